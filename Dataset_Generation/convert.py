@@ -0,0 +1,82 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../' + 'src' not in sys.path:
+    sys.path.append('../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Time (Time access and conversions)
+import time
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Lib/Utilities/File_IO
+import Utilities.File_IO as File_IO
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# The type of the dataset, see Dataset.Core.CONST_DATASET_TYPES.
+CONST_DATASET_TYPE = 'configuration'
+# Dataset configuration.
+#   Number of data to be generated.
+CONST_NUM_OF_DATA = 100000
+# Compression of the output data.
+#   Note:
+#       False: Folder of the columnar files (*.npy), which can be memory-mapped by the training scripts.
+#       True : Compressed Numpy archive (*.npz), which is smaller, but it is fully loaded into memory.
+CONST_COMPRESSION = False
+
+def main():
+    """
+    Description:
+        A program to convert generated data from 'generate.py' in 'bin' format to the typed columnar format
+        (one column per file).
+
+        If the 'bin' file does not exist, the legacy dataset in 'pkl' format (or 'zip' format, which contains 
+        a 'csv' file with the data) is converted instead.
+
+        The structure of the output dataset is described below.
+            'x_coord', 'y_coord' [float32]:
+                Coordinates of the x-axis, y-axis (in meters) corresponding to the absolute positions of the joints.
+            'cfg' [uint8]: The configuration of the solution. The IK for the RR robotic structure has two solutions.
+            'th_0', 'th_1' [float32]: Absolute position of the robot's joints.
+
+            The joint space dataset contains the pose of the TCP (position, orientation 'r_00' .. 'r_21' [float32] 
+            and configuration 'cfg' [uint8], depending on the robotic structure) and 'th_0' .. 'th_{n-1}' [float32] 
+            instead, see Dataset.Core.Get_Columns(..).
+
+        Note:
+            The data are converted chunk by chunk, so the whole dataset does not need to be held in memory.
+            The output data can be read using the function below:
+                ../Utilities/File_IO.py -> Load_Columnar(..)
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Create a file path to read/write the data.
+    file_path_rw = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}' + ('_Joint_Space' if CONST_DATASET_TYPE == 'joint_space' else '')
+
+    # The input and output columns of the dataset.
+    columns_x, columns_y = Dataset.Core.Get_Columns(CONST_ROBOT_TYPE, CONST_DATASET_TYPE)
+
+    # Start the timer.
+    t_0 = time.time()
+
+    # Convert the data from a file (*.bin, or the legacy *.pkl, *.zip) to the columnar files.
+    #   Note:
+    #       CONST_COMPRESSION == False: f'{file_path_rw}/' contains f'x_coord.npy', f'y_coord.npy', etc.
+    #       CONST_COMPRESSION == True:  f'{file_path_rw}.npz' contains f'x_coord.npy', f'y_coord.npy', etc.
+    File_IO.Convert_Stream_To_Columnar(file_path_rw, file_path_rw, {**columns_x, **columns_y}, CONST_COMPRESSION)
+
+    print(f'[INFO] Time: {(time.time() - t_0):0.05f} in seconds.')
+    print(f'[INFO] The file has been successfully converted.')
+
+if __name__ == "__main__":
+    sys.exit(main())
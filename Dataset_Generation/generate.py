@@ -7,11 +7,9 @@ if '../' + 'src' not in sys.path:
 import os
 # Time (Time access and conversions)
 import time
-# Numpy (Array computing) [pip3 install numpy]
-import numpy as np
 # Custom Lib.:
-#   ../Kinematics/Core
-import Kinematics.Core
+#   ../Dataset/Core
+import Dataset.Core
 #   ../Parameters/Robot
 import Parameters.Robot
 #   ../Lib/Utilities/File_IO
@@ -23,9 +21,32 @@ Description:
 """
 # Set the structure of the main parameters of the robot.
 CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# The type of the dataset.
+#   'configuration': Position (x, y) and configuration of the solution, generated using the analytical 
+#                    inverse kinematics of the RR robotic structure.
+#   'joint_space'  : Pose of the TCP (position, orientation and configuration, see Dataset.Core.Get_Columns(..)) 
+#                    generated from the random joint positions using the generic forward kinematics 
+#                    (Denavit-Hartenberg), which works for any non-redundant serial robotic structure.
+#     Note:
+#       The joint space dataset is saved with the suffix '_Joint_Space'.
+CONST_DATASET_TYPE = 'configuration'
 # Dataset configuration.
 #   Number of data to be generated.
 CONST_NUM_OF_DATA = 100000
+#   The number of decimals to which the data are rounded.
+CONST_TOLERANCE = 4
+#   The number of positions generated at once.
+CONST_BLOCK_SIZE = 100000
+#   The seed of the random number generator.
+#     Note:
+#       The dataset is bit-identical for the given seed and number of workers.
+CONST_SEED = 0
+#   The number of worker processes.
+CONST_NUM_OF_WORKERS = 4
+#   The number of data (rows) written to the file at once.
+#     Note:
+#       The chunk size must be even.
+CONST_CHUNK_SIZE = 1000000
 
 def main():
     """
@@ -34,6 +55,7 @@ def main():
 
         The structure of the dataset is described below.
             Input of the NN:  x -> Position(x, y); configuration_id(0, 1)
+                                   or Position(x, y, z) for the joint space dataset
             Output of the NN: y -> theta(0 .. n)
             
             Where n is the number of absolute joint positions.
@@ -50,64 +72,56 @@ def main():
     Robot_Str = CONST_ROBOT_TYPE
 
     # Create a file path to save the data.
-    file_path = f"{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}"
+    file_path = f"{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}" + ('_Joint_Space' if CONST_DATASET_TYPE == 'joint_space' else '')
 
-    # Remove the '*.urdf' file if it already exists.
-    if os.path.isfile(f'{file_path}.pkl'):
-        os.remove(f'{file_path}.pkl')
-
-    # Initialization of data to show the process flow.
-    percentage_offset = CONST_NUM_OF_DATA/10; percentage_idx = 1
+    # The input and output columns of the dataset.
+    columns_x, columns_y = Dataset.Core.Get_Columns(Robot_Str, CONST_DATASET_TYPE)
 
     # Start the timer.
     t_0 = time.time()
     print('[INFO] The generation of the dataset is in progress.')
 
-    # Generates data up to the desired maximum number of iterations, which is given by the constant {CONST_NUM_OF_DATA}.
-    i = 0; data = []; tolerance = 4
-    while CONST_NUM_OF_DATA > i:
-        # Random generation of absolute joint orientations.
-        #   Note:
-        #       The boundaries of the random generation are defined in the object structure.
-        theta_rand = np.random.uniform(Robot_Str.Theta.Limit[:, 0], Robot_Str.Theta.Limit[:, 1])
-
-        # Obtain the x, y coordinates using forward kinematics.
-        p_tmp = np.round(Kinematics.Core.Forward_Kinematics(theta_rand, Robot_Str)[1], tolerance).astype('float32')
-
-        # Obtain the solutions of the absolute positions of the joints.
-        th_tmp = Kinematics.Core.Inverse_Kinematics(p_tmp, Robot_Str)[1]
-
-        # If there is a duplicate of the input data, skip to the next step.
-        if data != []:
-            for _, x_i in enumerate(data):
-                if p_tmp in x_i[0:2]:
-                    continue
-
-        # Data structure.
-        #   Position (p), configuration(0: theta solution 0, 1: theta solution 1) and absolute position of the joint (theta).
-        for id, th_tmp_i in enumerate(th_tmp):
-            data_x = np.concatenate((p_tmp, np.array([id]).astype('float32')))
-            data_y = np.round(th_tmp_i, tolerance).astype('float32')
-            # Store the acquired data.
-            data.append(np.concatenate((data_x, data_y), dtype=np.float32))
-
-        i += 2
-        if i > (percentage_offset * percentage_idx):
-            print(f'[INFO]  Percentage: {int(100 * float(i)/float(CONST_NUM_OF_DATA))} %')
-            print(f'[INFO]  Time: {(time.time() - t_0):.3f} in seconds')
-            percentage_idx += 1
+    # Initialization of the filter to reject duplicate positions.
+    Filter_Cls = Dataset.Core.Duplicate_Filter_Cls(CONST_TOLERANCE)
+
+    # Open the file (*.bin) to write the data.
+    #   Note:
+    #       If the file with the same configuration already exists, the generation is resumed 
+    #       from the last complete chunk.
+    Writer_Cls = File_IO.Stream_Writer_Cls(file_path, Robot_Str.Id, CONST_NUM_OF_DATA, CONST_SEED, CONST_TOLERANCE, 
+                                           CONST_CHUNK_SIZE, len(columns_x) + len(columns_y))
+    if Writer_Cls.Num_Of_Rows > 0:
+        print(f'[INFO] The generation is resumed from the row {Writer_Cls.Num_Of_Rows}.')
+
+        # Rebuild the filter from the positions already written.
+        if CONST_DATASET_TYPE == 'configuration':
+            data = Writer_Cls.Data
+            Filter_Cls.Filter(data[data[:, 2] == 0.0, 0:2]); del data
+
+    # Generates data up to the desired maximum number of rows, which is given by the constant {CONST_NUM_OF_DATA}.
+    #   Note:
+    #       Each chunk is written to the file as soon as it is produced.
+    if CONST_DATASET_TYPE == 'joint_space':
+        chunks = Dataset.Core.Generate_Joint_Space_Chunks(CONST_NUM_OF_DATA, Robot_Str, CONST_TOLERANCE, CONST_SEED, CONST_CHUNK_SIZE, 
+                                                          Writer_Cls.Num_Of_Chunks)
+    else:
+        chunks = Dataset.Core.Generate_Chunks(CONST_NUM_OF_DATA, Robot_Str, CONST_TOLERANCE, CONST_SEED, CONST_NUM_OF_WORKERS,
+                                              CONST_CHUNK_SIZE, CONST_BLOCK_SIZE, Filter_Cls, Writer_Cls.Num_Of_Chunks)
+    for _, data_i in enumerate(chunks):
+        Writer_Cls.Write(data_i)
+        print(f'[INFO] >> Number of written data: {Writer_Cls.Num_Of_Rows}')
+
+    num_of_rows = Writer_Cls.Num_Of_Rows
+    Writer_Cls.Close()
 
     # Display information (1).
-    print(f'[INFO]  Percentage: {int(100 * float(i)/float(CONST_NUM_OF_DATA))} %')
     print(f'[INFO] Time: {(time.time() - t_0):0.05f} in seconds.')
-
-    # Save the data to the file.
-    File_IO.Save(file_path, data, 'pkl', ',')
     print(f'[INFO] The file has been successfully saved.')
 
     # Display information (2).
-    print(f'[INFO] Number of processed data: {i}')
-    if len(data) == CONST_NUM_OF_DATA:
+    print(f'[INFO] Number of processed data: {num_of_rows}')
+    print(f'[INFO] Number of rejected duplicate positions: {Filter_Cls.Num_Of_Rejected}')
+    if num_of_rows == CONST_NUM_OF_DATA:
         print('[INFO] The data generation has been successfully completed.')
     else:
         print(f'[WARNING] Insufficient number of combinations.')
@@ -0,0 +1,127 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../../../' + 'src' not in sys.path:
+    sys.path.append('../../../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Time (Time access and conversions)
+import time
+# Tempfile (Generate temporary files and directories)
+import tempfile
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Pandas (Data analysis and manipulation) [pip3 install pandas]
+import pandas as pd
+# Custom Lib.:
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Utilities/File_IO
+import Utilities.File_IO as File_IO
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Dataset configuration.
+#   Number of data to be generated.
+CONST_NUM_OF_DATA = 100000
+# Number of repetitions of the load measurement.
+CONST_NUM_OF_REPETITIONS = 10
+
+def Get_Size(path: str) -> int:
+    """
+    Description:
+        A function to obtain the size of the file or the folder (sum of the files).
+
+    Args:
+        (1) path [string]: The specified path of the file/folder.
+
+    Returns:
+        (1) parameter [int]: The size in bytes.
+    """
+
+    if os.path.isdir(path) == True:
+        return sum([os.path.getsize(f'{path}/{file_i}') for _, file_i in enumerate(os.listdir(path))])
+
+    return os.path.getsize(path)
+
+def Measure_Load_Time(load: tp.Callable) -> float:
+    """
+    Description:
+        A function to measure the time to load the input/output data of the model.
+
+    Args:
+        (1) load [function]: Load function, which returns the input/output data (x, y).
+
+    Returns:
+        (1) parameter [float]: Median of the load time in milliseconds.
+    """
+
+    t = np.zeros(CONST_NUM_OF_REPETITIONS, dtype=np.float64)
+    for i in range(CONST_NUM_OF_REPETITIONS):
+        t_0 = time.perf_counter()
+        load()
+        t[i] = (time.perf_counter() - t_0) * 1e3
+
+    return np.median(t)
+
+def main():
+    """
+    Description:
+        A program to compare the size and the load time of the dataset in the individual formats:
+            'zip' : Text file (*.csv) compressed into the archive (*.zip), read using pandas.
+            'npy' : Folder of the columnar files (*.npy), memory-mapped.
+            'npz' : Compressed Numpy archive (*.npz) of the columnar files.
+
+        Note:
+            The dataset in the binary (streamed) format generated by 'generate.py' is required.
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Create a file path to read the data.
+    file_path_r = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}'
+
+    # Number of input parameters of the model: x, y, cfg.
+    num_of_inputs = 3
+
+    with tempfile.TemporaryDirectory() as folder_w:
+        file_path_w = f'{folder_w}/Config_N_{CONST_NUM_OF_DATA}'
+        file_path_w_compressed = f'{folder_w}/Config_N_{CONST_NUM_OF_DATA}_Compressed'
+
+        # Convert the data to the individual formats.
+        #   'zip'
+        data = File_IO.Load(file_path_r, 'bin', ',')
+        df = pd.DataFrame({name_i: data[:, i].astype(dtype_i) for i, (name_i, dtype_i) in enumerate(Dataset.Core.CONST_COLUMNS.items())})
+        df.to_csv(f'{file_path_w}.zip', index=False, compression=dict(method='zip', archive_name=f'Config_N_{CONST_NUM_OF_DATA}.csv'))
+        del data, df
+        #   'npy', 'npz'
+        File_IO.Convert_Stream_To_Columnar(file_path_r, file_path_w, Dataset.Core.CONST_COLUMNS, False)
+        File_IO.Convert_Stream_To_Columnar(file_path_r, file_path_w_compressed, Dataset.Core.CONST_COLUMNS, True)
+
+        # Load functions of the individual formats.
+        def Load_Zip():
+            data = pd.read_csv(f'{file_path_w}.zip', compression='zip')
+            return (data.iloc[:, 0:num_of_inputs].values, data.iloc[:, num_of_inputs:].values)
+
+        def Load_Columnar():
+            data = File_IO.Load_Columnar(file_path_w, Dataset.Core.CONST_COLUMN_NAMES)
+            return (np.column_stack(data[0:num_of_inputs]), np.column_stack(data[num_of_inputs:]))
+
+        def Load_Columnar_Compressed():
+            data = File_IO.Load_Columnar(file_path_w_compressed, Dataset.Core.CONST_COLUMN_NAMES)
+            return (np.column_stack(data[0:num_of_inputs]), np.column_stack(data[num_of_inputs:]))
+
+        print(f'[INFO] Comparison of the dataset formats: N = {CONST_NUM_OF_DATA}')
+        for _, (format_i, path_i, load_i) in enumerate([('zip', f'{file_path_w}.zip', Load_Zip),
+                                                        ('npy', file_path_w, Load_Columnar),
+                                                        ('npz', f'{file_path_w_compressed}.npz', Load_Columnar_Compressed)]):
+            print(f'[INFO]  Format: {format_i}')
+            print(f'[INFO]  [size = {Get_Size(path_i) / 1e6:.03f} MB, load time = {Measure_Load_Time(load_i):.03f} ms]')
+
+if __name__ == "__main__":
+    sys.exit(main())
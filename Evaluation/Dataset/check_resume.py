@@ -0,0 +1,106 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../../' + 'src' not in sys.path:
+    sys.path.append('../../' + 'src')
+# Tempfile (Generate temporary files and directories)
+import tempfile
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Lib/Utilities/File_IO
+import Utilities.File_IO as File_IO
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# Dataset configuration.
+#   Number of data to be generated.
+CONST_NUM_OF_DATA = 8000
+#   The number of decimals to which the data are rounded.
+#     Note:
+#       The low tolerance causes many duplicates, including the duplicates across the shards.
+CONST_TOLERANCE = 2
+#   The number of positions generated at once.
+CONST_BLOCK_SIZE = 500
+#   The seed of the random number generator.
+CONST_SEED = 0
+#   The number of worker processes.
+CONST_NUM_OF_WORKERS = 4
+#   The number of data (rows) written to the file at once.
+CONST_CHUNK_SIZE = 1000
+# The number of chunks written before the generation is interrupted.
+CONST_NUM_OF_INTERRUPTED_CHUNKS = 2
+
+def Generate(file_path: str, Robot_Parameters_Str: Parameters.Robot, max_num_of_chunks: tp.Optional[int]) -> None:
+    """
+    Description:
+        A function to generate the dataset into the binary (streamed) file (*.bin) in the same way as
+        the program '../../Dataset_Generation/generate.py'.
+
+    Args:
+        (1) file_path [string]: The specified path of the file without extension (format).
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) max_num_of_chunks [int]: The number of chunks written before the generation is interrupted. If
+                                     the parameter is not defined, the generation is not interrupted.
+    """
+
+    Filter_Cls = Dataset.Core.Duplicate_Filter_Cls(CONST_TOLERANCE)
+
+    Writer_Cls = File_IO.Stream_Writer_Cls(file_path, Robot_Parameters_Str.Id, CONST_NUM_OF_DATA, CONST_SEED, CONST_TOLERANCE,
+                                           CONST_CHUNK_SIZE, Dataset.Core.CONST_NUM_OF_COLUMNS)
+    if Writer_Cls.Num_Of_Rows > 0:
+        # Rebuild the filter from the positions already written.
+        data = Writer_Cls.Data
+        Filter_Cls.Filter(data[data[:, 2] == 0.0, 0:2]); del data
+
+    for k, data_k in enumerate(Dataset.Core.Generate_Chunks(CONST_NUM_OF_DATA, Robot_Parameters_Str, CONST_TOLERANCE, CONST_SEED,
+                                                            CONST_NUM_OF_WORKERS, CONST_CHUNK_SIZE, CONST_BLOCK_SIZE, Filter_Cls,
+                                                            Writer_Cls.Num_Of_Chunks)):
+        Writer_Cls.Write(data_k)
+
+        if max_num_of_chunks != None and k + 1 >= max_num_of_chunks:
+            break
+
+    Writer_Cls.Close()
+
+def main():
+    """
+    Description:
+        A program to check that the generation of the dataset, which is interrupted and then resumed from the last
+        complete chunk, gives the same data as the uninterrupted generation.
+    """
+
+    # Initialization of the structure of the main parameters of the robot.
+    Robot_Str = CONST_ROBOT_TYPE
+
+    with tempfile.TemporaryDirectory() as folder_w:
+        # Uninterrupted generation.
+        Generate(f'{folder_w}/Uninterrupted', Robot_Str, None)
+
+        # Interrupted and resumed generation.
+        Generate(f'{folder_w}/Resumed', Robot_Str, CONST_NUM_OF_INTERRUPTED_CHUNKS)
+        Generate(f'{folder_w}/Resumed', Robot_Str, None)
+
+        data_0 = File_IO.Load(f'{folder_w}/Uninterrupted', 'bin', ',')
+        data_1 = File_IO.Load(f'{folder_w}/Resumed', 'bin', ',')
+
+    print(f'[INFO] Number of data: uninterrupted = {data_0.shape[0]}, resumed = {data_1.shape[0]}')
+    if data_0.shape == data_1.shape and np.array_equal(data_0, data_1):
+        print('[INFO] The resumed generation is identical to the uninterrupted generation.')
+    else:
+        i = np.flatnonzero(np.any(data_0[0:data_1.shape[0]] != data_1[0:data_0.shape[0]], axis=1))
+        print(f'[ERROR] The resumed generation differs from the uninterrupted generation from the row {i[0] if i.size > 0 else min(data_0.shape[0], data_1.shape[0])}.')
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,8 @@ import matplotlib.pyplot as plt
 # Custom Lib.:
 #   ../Parameters/Robot
 import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
 #   ../Lib/Utilities/File_IO
 import Utilities.File_IO as File_IO
 
@@ -51,13 +53,19 @@ def main():
     file_path = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}'
     
     # Read the data from a file.
-    data = File_IO.Load(file_path, 'pkl', ',')
-
-    # The tolerance of the data.
-    tolerance = 4
+    #   Note:
+    #       The binary (streamed) file (*.bin) is written by the program '../../Dataset_Generation/generate.py' and it 
+    #       contains the tolerance of the data in the header. Otherwise, the columnar files (or the legacy files *.pkl, 
+    #       *.zip) are read and the tolerance of the data is 4.
+    if os.path.isfile(f'{file_path}.bin'):
+        data = File_IO.Load_Stream(file_path); data_x = data[:, 0]; data_y = data[:, 1]
+        tolerance = int(File_IO.Load_Header(file_path)['tolerance'])
+    else:
+        data_x, data_y = File_IO.Load_Columnar(file_path, Dataset.Core.CONST_COLUMN_NAMES)[0:2]
+        tolerance = 4
 
     # Express the data as x, y coordinates in meters.
-    x = np.round(data[:, 0], tolerance); y = np.round(data[:, 1], tolerance)
+    x = np.round(data_x, tolerance); y = np.round(data_y, tolerance)
 
     # Create a figure.
     figure = plt.figure()
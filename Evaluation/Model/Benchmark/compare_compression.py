@@ -0,0 +1,122 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../../../' + 'src' not in sys.path:
+    sys.path.append('../../../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Time (Time access and conversions)
+import time
+# Tempfile (Generate temporary files and directories)
+import tempfile
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Kinematics/Core
+import Kinematics.Core
+#   ../FCNN_IK/Model
+import FCNN_IK.Model
+#   ../FCNN_IK/Inference
+import FCNN_IK.Inference
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# The configuration ID of the inverse kinematics (IK) solution.
+CONST_IK_CONFIGURATION = 0
+# Number of data used to evaluate the accuracy and the latency.
+CONST_NUM_OF_DATA = 1000
+# Number of predictions performed before the measurement (warm-up).
+CONST_NUM_OF_WARM_UP = 100
+# The compression variants to be compared: (sparsity, quantize).
+CONST_VARIANTS = [(0.0, False), (0.5, False), (0.0, True), (0.5, True), (0.8, True)]
+
+def Measure_Latency(predict: tp.Callable, x: tp.List[tp.List[float]]) -> tp.List[float]:
+    """
+    Description:
+        A function to measure the latency of the single-sample prediction.
+
+    Args:
+        (1) predict [function]: Prediction function of the model.
+        (2) x [Matrix<float> nxk]: Input data.
+
+    Returns:
+        (1) parameter [Vector<float> 1xn]: Latency of the individual predictions in microseconds.
+    """
+
+    # Warm-up of the prediction function.
+    for _, x_i in enumerate(x[0:CONST_NUM_OF_WARM_UP]):
+        predict(x_i)
+
+    t = np.zeros(x.shape[0], dtype=np.float64)
+    for i, x_i in enumerate(x):
+        t_0 = time.perf_counter()
+        predict(x_i)
+        t[i] = (time.perf_counter() - t_0) * 1e6
+
+    return t
+
+def main():
+    """
+    Description:
+        A program to compare the size, the latency of the single-sample prediction and the accuracy (error
+        of the end-effector position obtained using Forward Kinematics) of the models exported into the Numpy
+        archive (*.npz) with the individual post-training compression variants (magnitude pruning, int8 quantization)
+        for each dataset configuration.
+
+        Note:
+            The compressed models are evaluated using the CPU inference class below:
+                ../FCNN_IK/Inference.py -> FCNN_Numpy_Predictor_Cls
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Initialization of the structure of the main parameters of the robot.
+    Robot_Str = CONST_ROBOT_TYPE
+
+    # Random generation of reachable coordinates using forward kinematics.
+    theta_rand = np.random.uniform(Robot_Str.Theta.Limit[:, 0], Robot_Str.Theta.Limit[:, 1],
+                                   size=(CONST_NUM_OF_DATA, Robot_Str.Theta.Zero.size))
+    p = Kinematics.Core.Forward_Kinematics_Batch(theta_rand, Robot_Str)[1]
+    x = np.column_stack((p, np.full(CONST_NUM_OF_DATA, CONST_IK_CONFIGURATION))).astype(np.float32)
+
+    print(f'[INFO] Comparison of the compressed models: N = {CONST_NUM_OF_DATA}')
+    for _, N_i in enumerate([1000, 10000, 100000]):
+        # Load the trained model.
+        FCNN_IK_Predictor_Cls = FCNN_IK.Model.FCNN_Predictor_Cls(f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_x.pkl',
+                                                                 f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_y.pkl',
+                                                                 f'{project_folder}/Data/Model/Config_N_{N_i}.h5')
+
+        with tempfile.TemporaryDirectory() as folder_w:
+            for _, (sparsity_i, quantize_i) in enumerate(CONST_VARIANTS):
+                # Export the model with the compression variant.
+                file_path_w = f'{folder_w}/Config_N_{N_i}_Sparsity_{sparsity_i}_Quantize_{quantize_i}'
+                FCNN_IK_Predictor_Cls.Export(file_path_w, 'npz', False, sparsity_i, quantize_i)
+
+                # Load the exported model.
+                FCNN_IK_Numpy_Predictor_Cls = FCNN_IK.Inference.FCNN_Numpy_Predictor_Cls(f'{file_path_w}.npz')
+
+                # Error of the end-effector position in millimeters.
+                theta = FCNN_IK_Numpy_Predictor_Cls.Predict_Batch(x)
+                e = np.linalg.norm(Kinematics.Core.Forward_Kinematics_Batch(theta, Robot_Str)[1] - p, axis=1) * 1000.0
+
+                # Measure the latency of the prediction.
+                t = Measure_Latency(FCNN_IK_Numpy_Predictor_Cls.Predict, x)
+
+                print(f'[INFO]  Config_N_{N_i}: sparsity = {sparsity_i}, quantize = {quantize_i}')
+                print(f'[INFO]  [size = {os.path.getsize(f"{file_path_w}.npz") / 1e3:.03f} kB, latency p50 = {np.percentile(t, 50):.03f} us, '
+                      f'error mean = {np.mean(e):.05f} mm, error max = {np.max(e):.05f} mm]')
+
+        # Release class object.
+        del FCNN_IK_Predictor_Cls
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../../../' + 'src' not in sys.path:
+    sys.path.append('../../../' + 'src')
+if '../../../' + 'Training' not in sys.path:
+    sys.path.append('../../../' + 'Training')
+# Time (Time access and conversions)
+import time
+# Tempfile (Generate temporary files and directories)
+import tempfile
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Tensorflow (Machine learning) [pip3 install tensorflow]
+import tensorflow as tf
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../FCNN_IK/Model
+import FCNN_IK.Model
+#   ../Training/Hyperparameters/Utilities
+import Hyperparameters.Utilities
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# Number of data used for the training.
+CONST_NUM_OF_DATA = 100000
+# The number of decimals to which the generated data are rounded.
+CONST_TOLERANCE = 4
+# The number of epochs of the measurement.
+CONST_NUM_OF_EPOCHS = 5
+# The number of samples processed before the model is updated.
+CONST_BATCH_SIZE = 64
+# The training modes to be compared: (jit_compile, precision_policy).
+#   Note:
+#       The 'mixed_float16' policy is not compared, because the float16 computations are emulated on the CPU.
+CONST_MODES = [(False, 'float32'), (True, 'float32'), (False, 'mixed_bfloat16'), (True, 'mixed_bfloat16')]
+
+def Measure_Train_Time(x: np.ndarray, y: np.ndarray, N: int, jit_compile: bool, precision_policy: str,
+                       epochs: int) -> float:
+    """
+    Description:
+        A function to measure the time of the training.
+
+    Args:
+        (1) x [Matrix<float> nxk]: Input data.
+        (2) y [Matrix<float> nxm]: Output (target) data.
+        (3) N [int]: The dataset configuration of the hyperparameters.
+        (4) jit_compile [bool]: Information about whether the train step is compiled using XLA.
+        (5) precision_policy [string]: The precision policy of the model layers.
+        (6) epochs [int]: The number of epochs of the training.
+
+    Returns:
+        (1) parameter [float]: The time of the training in seconds.
+    """
+
+    with tempfile.TemporaryDirectory() as folder_w:
+        FCNN_IK_Trainer_Cls = FCNN_IK.Model.FCNN_Trainer_Cls(x=x, y=y, train_size=0.80, test_size=0.20,
+                                                             file_path=f'{folder_w}/Config_N_{N}')
+        FCNN_IK_Trainer_Cls.Compile(Hyperparameters.Utilities.Get_Hyperparameter_Structure(N), jit_compile=jit_compile,
+                                    precision_policy=precision_policy)
+
+        t_0 = time.perf_counter()
+        FCNN_IK_Trainer_Cls.Train(epochs=epochs, batch_size=CONST_BATCH_SIZE, use_data_pipeline=True)
+
+        return time.perf_counter() - t_0
+
+def main():
+    """
+    Description:
+        A program to compare the epoch time of the training on the CPU for the individual modes (XLA compilation,
+        mixed precision) and for the hyperparameters of each dataset configuration (Config_N_*).
+
+        Note:
+            The first epoch includes the tracing (and the XLA compilation) of the train step. Therefore, the epoch time
+            is the difference of the training times with CONST_NUM_OF_EPOCHS and 1 epoch, divided by the number
+            of additional epochs.
+    """
+
+    # Hide the GPU devices, the comparison runs on the CPU.
+    tf.config.set_visible_devices([], 'GPU')
+
+    # Generation of the data.
+    data = Dataset.Core.Generate(CONST_NUM_OF_DATA, CONST_ROBOT_TYPE, CONST_TOLERANCE, np.random.default_rng(0))
+    x = data[:, 0:(CONST_ROBOT_TYPE.Theta.Zero.size + 1)]; y = data[:, -CONST_ROBOT_TYPE.Theta.Zero.size:]
+
+    results = []
+    for _, N_i in enumerate([1000, 10000, 100000]):
+        for _, (jit_compile_i, precision_policy_i) in enumerate(CONST_MODES):
+            # Measure the time of the training.
+            t_1 = Measure_Train_Time(x, y, N_i, jit_compile_i, precision_policy_i, 1)
+            t_n = Measure_Train_Time(x, y, N_i, jit_compile_i, precision_policy_i, CONST_NUM_OF_EPOCHS)
+            results.append((N_i, jit_compile_i, precision_policy_i, (t_n - t_1) / (CONST_NUM_OF_EPOCHS - 1), t_1))
+
+    print(f'[INFO] Comparison of the training modes on the CPU: N = {CONST_NUM_OF_DATA}, batch_size = {CONST_BATCH_SIZE}')
+    for _, (N_i, jit_compile_i, precision_policy_i, t_epoch_i, t_first_i) in enumerate(results):
+        print(f'[INFO]  Config_N_{N_i}: jit_compile = {jit_compile_i}, precision_policy = {precision_policy_i}')
+        print(f'[INFO]  [epoch time = {t_epoch_i:.03f} s, first epoch (incl. tracing) = {t_first_i:.03f} s]')
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../../../' + 'src' not in sys.path:
+    sys.path.append('../../../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Time (Time access and conversions)
+import time
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Kinematics/Core
+import Kinematics.Core
+#   ../FCNN_IK/Model
+import FCNN_IK.Model
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# The configuration ID of the inverse kinematics (IK) solution.
+CONST_IK_CONFIGURATION = 0
+# Number of single-sample predictions to be measured.
+CONST_NUM_OF_DATA = 1000
+# Number of predictions performed before the measurement (warm-up).
+CONST_NUM_OF_WARM_UP = 100
+
+def Measure_Latency(predict: tp.Callable, x: tp.List[tp.List[float]]) -> tp.List[float]:
+    """
+    Description:
+        A function to measure the latency of the single-sample prediction.
+
+    Args:
+        (1) predict [function]: Prediction function of the model.
+        (2) x [Matrix<float> nxk]: Input data.
+
+    Returns:
+        (1) parameter [Vector<float> 1xn]: Latency of the individual predictions in microseconds.
+    """
+
+    # Warm-up of the prediction function.
+    for _, x_i in enumerate(x[0:CONST_NUM_OF_WARM_UP]):
+        predict(x_i)
+
+    t = np.zeros(x.shape[0], dtype=np.float64)
+    for i, x_i in enumerate(x):
+        t_0 = time.perf_counter()
+        predict(x_i)
+        t[i] = (time.perf_counter() - t_0) * 1e6
+
+    return t
+
+def main():
+    """
+    Description:
+        A program to measure the latency (p50/p99) of the single-sample prediction of the absolute joint
+        position for an individual dataset configuration.
+
+        The standard mode (model.predict) is compared with the low-latency mode (pre-traced function
+        with the fused scaler arithmetic).
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Initialization of the structure of the main parameters of the robot.
+    Robot_Str = CONST_ROBOT_TYPE
+
+    # Random generation of reachable coordinates using forward kinematics.
+    theta_rand = np.random.uniform(Robot_Str.Theta.Limit[:, 0], Robot_Str.Theta.Limit[:, 1],
+                                   size=(CONST_NUM_OF_DATA, Robot_Str.Theta.Zero.size))
+    p = Kinematics.Core.Forward_Kinematics_Batch(theta_rand, Robot_Str)[1]
+    x = np.column_stack((p, np.full(CONST_NUM_OF_DATA, CONST_IK_CONFIGURATION))).astype(np.float32)
+
+    print(f'[INFO] Latency of the single-sample prediction: N = {CONST_NUM_OF_DATA}')
+    for _, N_i in enumerate([1000, 10000, 100000]):
+        for _, low_latency_i in enumerate([False, True]):
+            # Prediction of the absolute joint position of the robotic arm.
+            FCNN_IK_Predictor_Cls = FCNN_IK.Model.FCNN_Predictor_Cls(f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_x.pkl',
+                                                                     f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_y.pkl',
+                                                                     f'{project_folder}/Data/Model/Config_N_{N_i}.h5', low_latency=low_latency_i)
+
+            # Measure the latency of the prediction.
+            t = Measure_Latency(FCNN_IK_Predictor_Cls.Predict, x)
+
+            print(f'[INFO]  Config_N_{N_i}: low_latency = {low_latency_i}')
+            print(f'[INFO]  [p50 = {np.percentile(t, 50):.03f}, p99 = {np.percentile(t, 99):.03f}] in microseconds')
+
+            # Release class object.
+            del FCNN_IK_Predictor_Cls
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,10 +14,10 @@ import matplotlib.pyplot as plt
 # Custom Lib.:
 #   ../Parameters/Robot
 import Parameters.Robot
-#   ../Transformation/Utilities/Mathematics
-import Transformation.Utilities.Mathematics as Mathematics
 #   ../Kinematics/Core
 import Kinematics.Core
+#   ../Dataset/Core
+import Dataset.Core
 #   ../FCNN_IK/Model
 import FCNN_IK.Model
 
@@ -52,27 +52,10 @@ def main():
     # The tolerance of the data.
     tolerance = 4
     
-    # Generates data up to the desired maximum number of iterations, which is given by the constant {CONST_NUM_OF_DATA}.
-    i = 0; data = []; tolerance = 4
-    while CONST_NUM_OF_DATA > i:
-        # Random generation of absolute joint orientations.
-        #   Note:
-        #       The boundaries of the random generation are defined in the object structure.
-        theta_rand = np.random.uniform(Robot_Str.Theta.Limit[:, 0], Robot_Str.Theta.Limit[:, 1])
-
-        # Obtain the x, y coordinates using forward kinematics.
-        p_tmp = np.round(Kinematics.Core.Forward_Kinematics(theta_rand, Robot_Str)[1], tolerance).astype('float32')
-
-        # If there is a duplicate of the input data, skip to the next step.
-        if data != []:
-            for _, x_i in enumerate(data):
-                if p_tmp in x_i[0:2]:
-                    continue
-
-        # Store the acquired data.
-        data.append(p_tmp)
-
-        i += 1
+    # Generates unique reachable coordinates up to the desired maximum number, which is given by the constant {CONST_NUM_OF_DATA}.
+    #   Note:
+    #       The boundaries of the random generation are defined in the object structure.
+    data = Dataset.Core.Generate_Positions(CONST_NUM_OF_DATA, Robot_Str, tolerance, np.random.default_rng())
 
     data_predicted = []; e_p = []
     for _, N_i in enumerate([1000, 10000, 100000]):
@@ -84,17 +67,17 @@ def main():
         
         # Obtain the predicted end-effector coordinates using neural-netowrk inverse kinematics from the generated 
         # radom coordinates.
-        data_predicted_i = []; e_p_i = []
-        for _, data_i in enumerate(np.array(data, dtype=np.float32)):
-            # Predict the absolute joint position of the robotic arm from the input position of the end-effector 
-            # and configuration of the solution.
-            theta_predicted = FCNN_IK_Predictor_Cls.Predict(np.array([data_i[0], data_i[1], CONST_IK_CONFIGURATION], dtype=np.float32))[0]
+        data_i = np.array(data, dtype=np.float32)
+
+        # Predict the absolute joint positions of the robotic arm from the input positions of the end-effector 
+        # and configuration of the solution.
+        theta_predicted = FCNN_IK_Predictor_Cls.Predict_Batch(np.column_stack((data_i, np.full(data_i.shape[0], CONST_IK_CONFIGURATION))))
 
-            # Obtain the end-effector coordinates.
-            data_predicted_i.append(np.round(Kinematics.Core.Forward_Kinematics(theta_predicted, Robot_Str)[1], tolerance).astype('float32'))
+        # Obtain the end-effector coordinates.
+        data_predicted_i = np.round(Kinematics.Core.Forward_Kinematics_Batch(theta_predicted, Robot_Str)[1], tolerance).astype('float32')
 
-            # Obtain the absolute orientation error.
-            e_p_i.append(Mathematics.Euclidean_Norm(np.round(Kinematics.Core.Forward_Kinematics(theta_predicted, Robot_Str)[1], tolerance).astype('float32') - data_i))
+        # Obtain the absolute orientation error.
+        e_p_i = np.linalg.norm(data_predicted_i - data_i, axis=1)
 
         # Store the data.
         data_predicted.append(data_predicted_i); e_p.append(e_p_i)
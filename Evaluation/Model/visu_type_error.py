@@ -14,10 +14,10 @@ import matplotlib.pyplot as plt
 # Custom Lib.:
 #   ../Parameters/Robot
 import Parameters.Robot
-#   ../Transformation/Utilities/Mathematics
-import Transformation.Utilities.Mathematics as Mathematics
 #   ../Kinematics/Core
 import Kinematics.Core
+#   ../Dataset/Core
+import Dataset.Core
 #   ../FCNN_IK/Model
 import FCNN_IK.Model
 
@@ -32,6 +32,10 @@ CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
 CONST_IK_CONFIGURATION = 0
 # Number of data (x, y coordinates) to be generated.
 CONST_NUM_OF_DATA = 500
+# The number of Newton iterations used to refine the predictions of the network (hybrid solver).
+#   Note:
+#       If the number of iterations is 0, the predictions are not refined.
+CONST_NUM_OF_REFINE_ITERATIONS = 0
 
 def main():
     """
@@ -51,27 +55,10 @@ def main():
     # The tolerance of the data.
     tolerance = 4
     
-    # Generates data up to the desired maximum number of iterations, which is given by the constant {CONST_NUM_OF_DATA}.
-    i = 0; data = []; tolerance = 4
-    while CONST_NUM_OF_DATA > i:
-        # Random generation of absolute joint orientations.
-        #   Note:
-        #       The boundaries of the random generation are defined in the object structure.
-        theta_rand = np.random.uniform(Robot_Str.Theta.Limit[:, 0], Robot_Str.Theta.Limit[:, 1])
-
-        # Obtain the x, y coordinates using forward kinematics.
-        p_tmp = np.round(Kinematics.Core.Forward_Kinematics(theta_rand, Robot_Str)[1], tolerance).astype('float32')
-
-        # If there is a duplicate of the input data, skip to the next step.
-        if data != []:
-            for _, x_i in enumerate(data):
-                if p_tmp in x_i[0:2]:
-                    continue
-
-        # Store the acquired data.
-        data.append(p_tmp)
-
-        i += 1
+    # Generates unique reachable coordinates up to the desired maximum number, which is given by the constant {CONST_NUM_OF_DATA}.
+    #   Note:
+    #       The boundaries of the random generation are defined in the object structure.
+    data = Dataset.Core.Generate_Positions(CONST_NUM_OF_DATA, Robot_Str, tolerance, np.random.default_rng())
 
     e_p = []
     for _, N_i in enumerate([1000, 10000, 100000]):
@@ -83,14 +70,19 @@ def main():
         
         # Obtain the Absolute Position Error (APE) using neural-netowrk inverse kinematics from the generated 
         # radom coordinates.
-        e_p_i = []
-        for _, data_i in enumerate(np.array(data, dtype=np.float32)):
-            # Predict the absolute joint position of the robotic arm from the input position of the end-effector 
-            # and configuration of the solution.
-            theta_predicted = FCNN_IK_Predictor_Cls.Predict(np.array([data_i[0], data_i[1], CONST_IK_CONFIGURATION], dtype=np.float32))[0]
-
-            # Obtain the absolute orientation error.
-            e_p_i.append(Mathematics.Euclidean_Norm(np.round(Kinematics.Core.Forward_Kinematics(theta_predicted, Robot_Str)[1], tolerance).astype('float32') - data_i))
+        data_i = np.array(data, dtype=np.float32)
+
+        # Predict the absolute joint positions of the robotic arm from the input positions of the end-effector 
+        # and configuration of the solution.
+        if CONST_NUM_OF_REFINE_ITERATIONS > 0:
+            theta_predicted = FCNN_IK_Predictor_Cls.Predict_Batch_Refined(np.column_stack((data_i, np.full(data_i.shape[0], CONST_IK_CONFIGURATION))), 
+                                                                          Robot_Str, CONST_NUM_OF_REFINE_ITERATIONS)
+        else:
+            theta_predicted = FCNN_IK_Predictor_Cls.Predict_Batch(np.column_stack((data_i, np.full(data_i.shape[0], CONST_IK_CONFIGURATION))))
+
+        # Obtain the absolute orientation error.
+        e_p_i = np.linalg.norm(np.round(Kinematics.Core.Forward_Kinematics_Batch(theta_predicted, Robot_Str)[1], tolerance).astype('float32') - data_i, 
+                               axis=1)
 
         # Store the data.
         e_p.append(e_p_i)
@@ -24,6 +24,12 @@ def Get_Hyperparameter_Structure(N: int) -> tp.Dict:
     Returns:
         (1) parameter [int]: The structure of the hyperparameters containing the amount of 
                              data generated to train the model.
+
+                             Note:
+                                The training is stopped if the validation loss has not improved 
+                                for {early_stopping_patience} epochs, and the learning rate is reduced 
+                                by {reduce_lr_factor} if the validation loss has not improved for 
+                                {reduce_lr_patience} epochs. A patience of 0 disables the policy.
     """
 
     return {
@@ -33,7 +39,11 @@ def Get_Hyperparameter_Structure(N: int) -> tp.Dict:
                'hidden_layer_1_units': 32,
                'hidden_layer_2_units': 64,
                'hidden_layer_3_units': 32,
-               'learning_rate': 0.001
+               'learning_rate': 0.001,
+               'early_stopping_patience': 500,
+               'reduce_lr_patience': 100,
+               'reduce_lr_factor': 0.5,
+               'min_learning_rate': 1e-5
             },
         10000: {'use_bias': True,
                 'layer_dropout': 0.05,
@@ -41,7 +51,11 @@ def Get_Hyperparameter_Structure(N: int) -> tp.Dict:
                 'hidden_layer_1_units': 64,
                 'hidden_layer_2_units': 128,
                 'hidden_layer_3_units': 64,
-                'learning_rate': 0.001
+                'learning_rate': 0.001,
+                'early_stopping_patience': 500,
+                'reduce_lr_patience': 100,
+                'reduce_lr_factor': 0.5,
+                'min_learning_rate': 1e-5
             },  
         100000: {'use_bias': True,
                  'layer_dropout': 0.05,
@@ -49,6 +63,38 @@ def Get_Hyperparameter_Structure(N: int) -> tp.Dict:
                  'hidden_layer_1_units': 128,
                  'hidden_layer_2_units': 256,
                  'hidden_layer_3_units': 128,
-                 'learning_rate': 0.001
+                 'learning_rate': 0.001,
+                 'early_stopping_patience': 500,
+                 'reduce_lr_patience': 100,
+                 'reduce_lr_factor': 0.5,
+                 'min_learning_rate': 1e-5
             }
-    }[N]
\ No newline at end of file
+    }[N]
+
+def Get_Student_Hyperparameter_Structure(N: int, hidden_layer_units: tp.List[int]) -> tp.Dict:
+    """
+    Description:
+        Get the hyperparameter structure of the compact (student) network, which is trained to mimic 
+        the teacher network, see the following program:
+            ../Training/distill.py
+
+        Note:
+            The training parameters are taken from the structure of the teacher, only the hidden layers 
+            are replaced.
+
+    Args:
+        (1) N [int]: The amount of data generated to train the teacher model.
+        (2) hidden_layer_units [Vector<int>]: The number of units of the individual hidden layers.
+
+    Returns:
+        (1) parameter [Dictionary {..}]: The structure of the hyperparameters of the student.
+    """
+
+    Hyperparameters = {key_i: value_i for _, (key_i, value_i) in enumerate(Get_Hyperparameter_Structure(N).items()) 
+                       if key_i.startswith('hidden_layer_') == False}
+
+    Hyperparameters['num_of_hidden_layers'] = len(hidden_layer_units)
+    for i, units_i in enumerate(hidden_layer_units):
+        Hyperparameters[f'hidden_layer_{i + 1}_units'] = units_i
+
+    return Hyperparameters
\ No newline at end of file
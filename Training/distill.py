@@ -0,0 +1,153 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../' + 'src' not in sys.path:
+    sys.path.append('../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Kinematics/Core
+import Kinematics.Core
+#   ../Utilities/File_IO
+import Utilities.File_IO as File_IO
+#   ../FCNN_IK/Model
+import FCNN_IK.Model
+#   ../Hyperparameters/Utilities
+import Hyperparameters.Utilities
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Set the structure of the main parameters of the robot.
+CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
+# A dataset configuration that specifies the amount of data
+# generated to train the model.
+CONST_NUM_OF_DATA = 100000
+# The source of the labels (targets) of the student.
+#   'model'   : Mean prediction of the teacher models (ensemble) given by CONST_TEACHERS.
+#   'analytic': Analytical inverse kinematics (Kinematics.Core.Inverse_Kinematics_Batch).
+CONST_TEACHER_TYPE = 'model'
+# The dataset configurations of the trained teacher models (Data/Model/Config_N_*.h5).
+#   Note:
+#       If more than one teacher is defined, the labels are averaged (ensemble).
+CONST_TEACHERS = [100000]
+# The number of units of the individual hidden layers of the student.
+CONST_STUDENT_HIDDEN_LAYER_UNITS = [32, 32]
+# Number of data used to evaluate the Cartesian error of the teacher and the student.
+CONST_NUM_OF_TEST_DATA = 10000
+# The number of decimals to which the test data are rounded.
+CONST_TOLERANCE = 4
+
+def Get_Cartesian_Error(theta: tp.List[tp.List[float]], x: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.List[float]:
+    """
+    Description:
+        A function to obtain the Cartesian error of the end-effector position using Forward Kinematics (FK).
+
+    Args:
+        (1) theta [Matrix<float> nxm]: Predicted absolute joint positions in radians.
+        (2) x [Matrix<float> nxk]: Input data (desired position of the end-effector and configuration).
+        (3) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Vector<float> 1xn]: The Euclidean error of the individual positions in millimeters.
+    """
+
+    p = Kinematics.Core.Forward_Kinematics_Batch(theta, Robot_Parameters_Str)[1]
+
+    return np.linalg.norm(p - x[:, 0:p.shape[1]], axis=1) * 1000.0
+
+def main():
+    """
+    Description:
+        A program to distill the teacher (a trained model, an ensemble of trained models or the analytical inverse
+        kinematics) into a compact student Fully-Connected Neural Network (FCNN) to reduce the cost of the inference.
+
+        The student is trained on the input data of the dataset with the labels predicted by the teacher and
+        the program reports the Cartesian error of the end-effector position versus the number of floating-point
+        operations (FLOPs) per sample for the teacher and the student.
+
+        Note:
+            The student is saved with the suffix '_Student', e.g. Data/Model/Config_N_100000_Student.h5, and can be
+            loaded/exported the same way as the teacher.
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Initialization of the structure of the main parameters of the robot.
+    Robot_Str = CONST_ROBOT_TYPE
+
+    # Create a file path to read/write the data.
+    file_path_r = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}'
+    file_path_w = f'{project_folder}/Data/Model/Config_N_{CONST_NUM_OF_DATA}_Student'
+
+    # Read the data from the columnar files (*.npy).
+    data = File_IO.Load_Columnar(file_path_r, Dataset.Core.CONST_COLUMN_NAMES)
+
+    # Assign the input data to variable.
+    #   'x_coord', 'y_coord', 'cfg'
+    x = np.column_stack(data[0:(Robot_Str.Theta.Zero.size + 1)])
+
+    # Load the trained teacher models.
+    Teachers = []
+    if CONST_TEACHER_TYPE == 'model':
+        for _, N_i in enumerate(CONST_TEACHERS):
+            Teachers.append((f'Config_N_{N_i}', FCNN_IK.Model.FCNN_Predictor_Cls(f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_x.pkl',
+                                                                                 f'{project_folder}/Data/Model/Config_N_{N_i}_Scaler_y.pkl',
+                                                                                 f'{project_folder}/Data/Model/Config_N_{N_i}.h5')))
+
+    # Obtain the labels of the teacher.
+    def Predict_Teacher(x: tp.List[tp.List[float]]) -> tp.List[tp.List[float]]:
+        if CONST_TEACHER_TYPE == 'analytic':
+            # Select the solution given by the configuration.
+            return Kinematics.Core.Inverse_Kinematics_Batch(x[:, 0:2], Robot_Str)[1][np.arange(x.shape[0]), x[:, 2].astype(np.int64)]
+
+        return np.mean([Teacher_i.Predict_Batch(x) for _, (_, Teacher_i) in enumerate(Teachers)], axis=0)
+    y = Predict_Teacher(x)
+
+    # Train the student model.
+    #   1-2\ Initialization and Compilation.
+    FCNN_IK_Trainer_Cls = FCNN_IK.Model.FCNN_Trainer_Cls(x=x, y=y, train_size=0.80, test_size=0.20,
+                                                         file_path=file_path_w)
+    FCNN_IK_Trainer_Cls.Compile(Hyperparameters.Utilities.Get_Student_Hyperparameter_Structure(CONST_NUM_OF_DATA,
+                                                                                               CONST_STUDENT_HIDDEN_LAYER_UNITS))
+    #   3\ Train.
+    FCNN_IK_Trainer_Cls.Train(epochs=10000, batch_size=64, use_data_pipeline=True)
+    #   4\ Save.
+    FCNN_IK_Trainer_Cls.Save()
+
+    # Load the best student model.
+    Student = FCNN_IK.Model.FCNN_Predictor_Cls(f'{file_path_w}_Scaler_x.pkl', f'{file_path_w}_Scaler_y.pkl',
+                                               f'{file_path_w}.h5')
+
+    # Generation of the test data, which are not part of the training dataset.
+    data_test = Dataset.Core.Generate(CONST_NUM_OF_TEST_DATA, Robot_Str, CONST_TOLERANCE, np.random.default_rng(1))
+    x_test = data_test[:, 0:(Robot_Str.Theta.Zero.size + 1)]
+
+    # The models to be compared: (name, prediction function, number of FLOPs per sample).
+    #   Note:
+    #       The FLOPs of the analytical inverse kinematics are not counted.
+    models = [(name_i, Teacher_i.Predict_Batch, Teacher_i.Get_Num_Of_FLOPs()) for _, (name_i, Teacher_i) in enumerate(Teachers)]
+    if CONST_TEACHER_TYPE == 'analytic':
+        models.append(('Teacher (analytic)', Predict_Teacher, None))
+    elif len(Teachers) > 1:
+        models.append(('Teacher (ensemble)', Predict_Teacher, sum([flops_i for _, (_, _, flops_i) in enumerate(models)])))
+    models.append((f'Student {CONST_STUDENT_HIDDEN_LAYER_UNITS}', Student.Predict_Batch, Student.Get_Num_Of_FLOPs()))
+
+    print(f'[INFO] Cartesian error versus FLOPs per sample: N = {CONST_NUM_OF_TEST_DATA}')
+    for _, (name_i, predict_i, flops_i) in enumerate(models):
+        e = Get_Cartesian_Error(predict_i(x_test), x_test, Robot_Str)
+        print(f'[INFO]  {name_i}: FLOPs = {flops_i if flops_i != None else "-"}')
+        print(f'[INFO]  [mean = {np.mean(e):.05f}, p99 = {np.percentile(e, 99):.05f}, max = {np.max(e):.05f}] in millimeters')
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# System (Default)
+import sys
+#   Add access if it is not in the system path.
+if '../' + 'src' not in sys.path:
+    sys.path.append('../' + 'src')
+# OS (Operating system interfaces)
+import os
+# Custom Lib.:
+#   ../FCNN_IK/Model
+import FCNN_IK.Model
+
+"""
+Description:
+    Initialization of constants.
+"""
+# A dataset configuration that specifies the amount of data
+# generated to train the model.
+CONST_NUM_OF_DATA = 1000
+# The format of the exported model.
+#   'npz' : Numpy archive; 'h5' : Keras model (HDF5)
+CONST_FORMAT = 'npz'
+# Fold the input/output scalers into the first/last Dense layer 
+# of the exported model.
+CONST_FOLD_SCALERS = False
+# Post-training compression of the exported model (only for the 'npz' format).
+#   The fraction of the weights with the smallest magnitude to be set to zero.
+CONST_SPARSITY = 0.0
+#   Quantization of the weights to int8.
+CONST_QUANTIZE = False
+
+def main():
+    """
+    Description:
+        A program to export the trained Fully-Connected Neural Network (FCNN) model together with the input/output
+        scalers into a Numpy archive (*.npz), which can be used without the Tensorflow library, or into a Keras 
+        model (*.h5).
+
+        Note 1:
+            The exported Numpy archive can be loaded using the class below:
+                ../FCNN_IK/Inference.py -> FCNN_Numpy_Predictor_Cls
+
+        Note 2:
+            If the scalers are folded, the exported model is self-contained and saved with the suffix '_Folded'. 
+            The Keras model is then loaded without the scaler files:
+                FCNN_IK.Model.FCNN_Predictor_Cls(None, None, '../.._Folded.h5')
+
+        Note 3:
+            If the model is compressed (pruned and/or quantized), it is saved with the suffix '_Compressed'. To compare 
+            the size, latency and accuracy of the compressed models, see the program below:
+                ../Evaluation/Model/Benchmark/compare_compression.py
+    """
+
+    # Locate the path to the project folder.
+    project_folder = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+
+    # Create a file path to read/write the data.
+    file_path_rw = f'{project_folder}/Data/Model/Config_N_{CONST_NUM_OF_DATA}'
+
+    # Load the trained model.
+    FCNN_IK_Predictor_Cls = FCNN_IK.Model.FCNN_Predictor_Cls(f'{file_path_rw}_Scaler_x.pkl', f'{file_path_rw}_Scaler_y.pkl',
+                                                             f'{file_path_rw}.h5')
+
+    # Create a file path to write the exported model.
+    file_path_w = file_path_rw
+    if CONST_FOLD_SCALERS == True:
+        file_path_w += '_Folded'
+    if CONST_SPARSITY > 0.0 or CONST_QUANTIZE == True:
+        file_path_w += '_Compressed'
+
+    # Export the model to the file.
+    FCNN_IK_Predictor_Cls.Export(file_path_w, CONST_FORMAT, CONST_FOLD_SCALERS, CONST_SPARSITY, CONST_QUANTIZE)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,15 @@ if '../' + 'src' not in sys.path:
     sys.path.append('../' + 'src')
 # OS (Operating system interfaces)
 import os
-# Pandas (Data analysis and manipulation) [pip3 install pandas]
-import pandas as pd
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
 # Custom Lib.:
 #   ../Parameters/Robot
 import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Utilities/File_IO
+import Utilities.File_IO as File_IO
 #   ../FCNN_IK/Model
 import FCNN_IK.Model
 
@@ -28,6 +32,26 @@ CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
 # A dataset configuration that specifies the amount of data 
 # generated to train the model.
 CONST_NUM_OF_DATA = 100000
+# The number of worker processes, which run the trials concurrently. 
+#   Note:
+#       The CPU threads are divided equally among the workers.
+CONST_NUM_OF_WORKERS = 4
+# Resume the previous (interrupted) optimization and reuse its completed trials.
+CONST_RESUME = False
+# A dataset configuration of another optimization to warm start from, which seeds 
+# the search with its best configurations of the hyperparameters.
+#   Note:
+#       If None, the warm start is not used.
+CONST_WARM_START_NUM_OF_DATA = None
+# The strategy of the hyperparameter search.
+#   'bayesian' : Bayesian optimization.
+#   'hyperband': Hyperband (successive halving), which terminates poor trials early.
+CONST_STRATEGY = 'bayesian'
+# The objective of the hyperparameter search.
+#   'val_loss', 'val_mae': Error of the predicted joint positions.
+#   'val_position_error' : Error of the end-effector position (in meters) obtained using Forward Kinematics.
+#   'val_cost'           : Position error penalized by the inference latency and the number of parameters.
+CONST_OBJECTIVE = 'val_position_error'
 
 def main():
     """
@@ -45,11 +69,15 @@ def main():
     # Create a file path to read/write the data.
     file_path_r = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}'
     file_path_w = f'{project_folder}/Data/Model/Config_N_{CONST_NUM_OF_DATA}'
+    if CONST_WARM_START_NUM_OF_DATA != None:
+        file_path_warm_start = f'{project_folder}/Data/Model/Config_N_{CONST_WARM_START_NUM_OF_DATA}'
+    else:
+        file_path_warm_start = None
 
-    # Read the data from a file (*.zip).
+    # Read the data from the columnar files (*.npy).
     #   Note:
-    #       f'{file_path_r}.zip' contains f'Config_N_{CONST_NUM_OF_DATA}.csv'
-    data = pd.read_csv(f'{file_path_r}.zip', compression='zip')
+    #       If the columnar files do not exist, the legacy files (*.pkl, *.zip) are read instead.
+    data = File_IO.Load_Columnar(file_path_r, Dataset.Core.CONST_COLUMN_NAMES)
 
     # Assign data to variables.
     #   Input:
@@ -60,15 +88,20 @@ def main():
     #              has two solutions.
     #   Output:
     #       'th_0', 'th_1': Absolute position of the robot's joints.
-    x = data.iloc[:, 0:(Robot_Str.Theta.Zero.size + 1)].values; y = data.iloc[:, -Robot_Str.Theta.Zero.size:].values
+    #   Note:
+    #       The columns are stacked into the input/output matrices, so the whole dataset is loaded into memory.
+    x = np.column_stack(data[0:(Robot_Str.Theta.Zero.size + 1)]); y = np.column_stack(data[-Robot_Str.Theta.Zero.size:])
     
     # Optimization of the hyperparameters for the Fully-Connected Neural Network (FCNN).
     #   1\ Initialization.
     FCNN_IK_Optimizer_Cls = FCNN_IK.Model.FCNN_Optimizer_Cls(x=x, y=y, train_size=0.80, test_size=0.20, 
-                                                             file_path=file_path_w)
+                                                             file_path=file_path_w, Robot_Parameters_Str=Robot_Str, 
+                                                             objective=CONST_OBJECTIVE, penalty=FCNN_IK.Model.CONST_PENALTY)
     #   2\ Optimization.
     FCNN_IK_Optimizer_Cls.Optimize(num_of_trials=100, epochs_per_trial=100, batch_size=64, 
-                                   save_results=True)
+                                   save_results=True, num_of_workers=CONST_NUM_OF_WORKERS, resume=CONST_RESUME, 
+                                   warm_start_file_path=file_path_warm_start, num_of_warm_start_trials=10, 
+                                   strategy=CONST_STRATEGY)
 
 if __name__ == "__main__":
     sys.exit(main())
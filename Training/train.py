@@ -5,11 +5,15 @@ if '../' + 'src' not in sys.path:
     sys.path.append('../' + 'src')
 # OS (Operating system interfaces)
 import os
-# Pandas (Data analysis and manipulation) [pip3 install pandas]
-import pandas as pd
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
 # Custom Lib.:
 #   ../Parameters/Robot
 import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Utilities/File_IO
+import Utilities.File_IO as File_IO
 #   ../FCNN_IK/Model
 import FCNN_IK.Model
 #   ../Hyperparameters/Utilities
@@ -30,6 +34,37 @@ CONST_ROBOT_TYPE = Parameters.Robot.EPSON_LS3_B401S_Str
 # A dataset configuration that specifies the amount of data 
 # generated to train the model.
 CONST_NUM_OF_DATA = 1000
+# The type of the dataset, see Dataset.Core.CONST_DATASET_TYPES.
+#   Note:
+#       The joint space dataset (and the model) uses the suffix '_Joint_Space', 
+#       see ../Dataset_Generation/generate.py.
+CONST_DATASET_TYPE = 'configuration'
+# Load the whole dataset into memory. If not, the dataset is memory-mapped from 
+# the columnar files (or from the binary file *.bin if the columnar files do not 
+# exist) and streamed from the disk during the training.
+CONST_IN_MEMORY = True
+# Pass the data to the model through the input pipeline (tf.data.Dataset) with 
+# shuffle, batch, cache and prefetch stages. If not, the scaled arrays are passed 
+# to the model directly.
+#   Note:
+#       The out-of-core training (CONST_IN_MEMORY = False) always uses the input pipeline.
+CONST_USE_DATA_PIPELINE = False
+# Train the model on the synthetic data sampled on the fly using the forward/inverse 
+# kinematics. The dataset is then used only to find the scale parameters and to 
+# validate the model.
+CONST_SYNTHETIC = False
+#   The number of decimals to which the sampled data are rounded.
+CONST_TOLERANCE = 4
+#   The number of batches drawn in each epoch.
+CONST_STEPS_PER_EPOCH = 1000
+# Compile the train step using XLA (Accelerated Linear Algebra).
+CONST_JIT_COMPILE = False
+# The precision policy of the model layers.
+#   'float32', 'mixed_float16' (GPU) or 'mixed_bfloat16' (CPU)
+#   Note:
+#       To compare the epoch time of the individual modes, see the program below:
+#           ../Evaluation/Model/Benchmark/compare_training_modes.py
+CONST_PRECISION_POLICY = 'float32'
 
 def main():
     """
@@ -44,13 +79,21 @@ def main():
     Robot_Str = CONST_ROBOT_TYPE
 
     # Create a file path to read/write the data.
-    file_path_r = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}'
-    file_path_w = f'{project_folder}/Data/Model/Config_N_{CONST_NUM_OF_DATA}'
+    suffix = '_Joint_Space' if CONST_DATASET_TYPE == 'joint_space' else ''
+    file_path_r = f'{project_folder}/Data/Dataset/Config_N_{CONST_NUM_OF_DATA}{suffix}'
+    file_path_w = f'{project_folder}/Data/Model/Config_N_{CONST_NUM_OF_DATA}{suffix}'
 
-    # Read the data from a file (*.zip).
-    #   Note:
-    #       f'{file_path_r}.zip' contains f'Config_N_{CONST_NUM_OF_DATA}.csv'
-    data = pd.read_csv(f'{file_path_r}.zip', compression='zip')
+    # The input and output columns of the dataset.
+    columns_x, columns_y = Dataset.Core.Get_Columns(Robot_Str, CONST_DATASET_TYPE)
+
+    if os.path.isdir(file_path_r) == True or CONST_IN_MEMORY == True:
+        # Read the data from the columnar files (*.npy).
+        #   Note:
+        #       If the columnar files do not exist, the legacy files (*.pkl, *.zip) are read instead.
+        data = File_IO.Load_Columnar(file_path_r, list(columns_x.keys()) + list(columns_y.keys()))
+    else:
+        # Map the data from the binary file (*.bin) without loading them into memory.
+        data = File_IO.Load_Stream(file_path_r)
 
     # Assign data to variables.
     #   Input:
@@ -61,15 +104,30 @@ def main():
     #              has two solutions.
     #   Output:
     #       'th_0', 'th_1': Absolute position of the robot's joints.
-    x = data.iloc[:, 0:(Robot_Str.Theta.Zero.size + 1)].values; y = data.iloc[:, -Robot_Str.Theta.Zero.size:].values
+    #   Note:
+    #       The columns of the joint space dataset are given by Dataset.Core.Get_Columns(..).
+    if CONST_IN_MEMORY == True:
+        # The columns are stacked into the input/output matrices, so the whole dataset is loaded into memory.
+        x = np.column_stack(data[0:len(columns_x)]); y = np.column_stack(data[len(columns_x):])
+    elif isinstance(data, list):
+        # The memory-mapped columns are accessed through the views (zero-copy) and each chunk of the data 
+        # is assembled from the columns during the training.
+        x = File_IO.Columnar_View_Cls(data[0:len(columns_x)]); y = File_IO.Columnar_View_Cls(data[len(columns_x):])
+    else:
+        x = data[:, 0:len(columns_x)]; y = data[:, len(columns_x):]
 
     # Train the Fully-Connected Neural Network (FCNN) model.
     #   1-2\ Initialization and Compilation.
     FCNN_IK_Trainer_Cls = FCNN_IK.Model.FCNN_Trainer_Cls(x=x, y=y, train_size=0.80, test_size=0.20, 
-                                                         file_path=file_path_w)
-    FCNN_IK_Trainer_Cls.Compile(Hyperparameters.Utilities.Get_Hyperparameter_Structure(CONST_NUM_OF_DATA))
+                                                         file_path=file_path_w, in_memory=CONST_IN_MEMORY)
+    FCNN_IK_Trainer_Cls.Compile(Hyperparameters.Utilities.Get_Hyperparameter_Structure(CONST_NUM_OF_DATA), 
+                                jit_compile=CONST_JIT_COMPILE, precision_policy=CONST_PRECISION_POLICY)
     #   3\ Train.
-    FCNN_IK_Trainer_Cls.Train(epochs=10000, batch_size=64)
+    if CONST_SYNTHETIC == True:
+        FCNN_IK_Trainer_Cls.Train_Synthetic(Robot_Str, tolerance=CONST_TOLERANCE, epochs=10000, steps_per_epoch=CONST_STEPS_PER_EPOCH, 
+                                            batch_size=64, dataset_type=CONST_DATASET_TYPE)
+    else:
+        FCNN_IK_Trainer_Cls.Train(epochs=10000, batch_size=64, use_data_pipeline=CONST_USE_DATA_PIPELINE)
     #   4\ Save.
     FCNN_IK_Trainer_Cls.Save()
 
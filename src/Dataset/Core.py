@@ -0,0 +1,603 @@
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Typing (Support for type hints)
+import typing as tp
+# Multiprocessing (Process-based parallelism)
+import multiprocessing
+# Custom Lib.:
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Kinematics/Core
+import Kinematics.Core
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Number of columns of the dataset.
+#   Position (x, y), configuration (cfg) and absolute position of the joints (th_0, th_1).
+CONST_NUM_OF_COLUMNS = 5
+# Names and data types of the columns of the dataset.
+CONST_COLUMNS = {'x_coord': np.float32, 'y_coord': np.float32, 'cfg': np.uint8, 'th_0': np.float32, 'th_1': np.float32}
+CONST_COLUMN_NAMES = list(CONST_COLUMNS.keys())
+# Names of the columns of the orientation in the joint space dataset.
+#   The first two columns of the rotation matrix of the TCP (tool center point), R[:, 0] and R[:, 1].
+#     Note:
+#       The planar robotic structures use only the first column in the plane (r_00, r_10).
+CONST_ORIENTATION_COLUMN_NAMES = ['r_00', 'r_10', 'r_20', 'r_01', 'r_11', 'r_21']
+# The types of the dataset.
+#   'configuration': Position (x, y), configuration (cfg) and absolute position of the joints of the RR robotic 
+#                    structure, see the Generate() function.
+#   'joint_space'  : Pose of the TCP (position, orientation and configuration, see the Get_Columns() function) and 
+#                    absolute position of the joints of any serial robotic structure, see the Generate_Joint_Space() 
+#                    function.
+CONST_DATASET_TYPES = ['configuration', 'joint_space']
+
+def __Is_Planar(Robot_Parameters_Str: Parameters.Robot) -> bool:
+    """
+    Description:
+        A function to find out whether the robotic structure is planar, i.e. all the joint axes are parallel 
+        (the link twist alpha is 0 or PI) and the TCP moves in the x, y plane.
+
+    Args:
+        (1) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [bool]: The result is "True" if the structure is planar, and "False" if it is not.
+    """
+
+    return bool(np.all(np.abs(np.sin(Kinematics.Core.Get_DH_Parameters(Robot_Parameters_Str)[:, 3])) < 1e-6))
+
+def Get_Columns(Robot_Parameters_Str: Parameters.Robot, dataset_type: str = 'configuration') -> tp.Tuple[tp.Dict[str, np.dtype], 
+                                                                                                      tp.Dict[str, np.dtype]]:
+    """
+    Description:
+        A function to obtain the names and data types of the input and output columns of the dataset.
+
+        The input columns of the joint space dataset are chosen so that the joint positions are a function 
+        of the input (up to the discrete solutions of the spatial structures, see the Generate_Joint_Space() 
+        function):
+            Planar structure:  Position (x, y), configuration (cfg, if m > 1) and, if m = 3, orientation in 
+                               the plane (r_00, r_10).
+            Spatial structure: Position (x, y, z) and, if m > 3, orientation (r_00, .., r_21).
+
+            Where m is the number of joints.
+
+    Args:
+        (1) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (2) dataset_type [string]: The type of the dataset, see CONST_DATASET_TYPES.
+
+    Returns:
+        (1) parameter [Dictionary {'name': data type, ..}]: The input columns of the dataset (input of the NN).
+        (2) parameter [Dictionary {'name': data type, ..}]: The output columns of the dataset (output of the NN).
+    """
+
+    m = Robot_Parameters_Str.Theta.Zero.size
+
+    if dataset_type == 'joint_space':
+        if __Is_Planar(Robot_Parameters_Str) == True:
+            columns_x = {'x_coord': np.float32, 'y_coord': np.float32}
+            columns_x.update({'cfg': np.uint8} if m > 1 else {})
+            columns_x.update({name_i: np.float32 for _, name_i in enumerate(CONST_ORIENTATION_COLUMN_NAMES[0:2] if m > 2 else [])})
+        else:
+            columns_x = {'x_coord': np.float32, 'y_coord': np.float32, 'z_coord': np.float32}
+            columns_x.update({name_i: np.float32 for _, name_i in enumerate(CONST_ORIENTATION_COLUMN_NAMES if m > 3 else [])})
+    else:
+        columns_x = {'x_coord': np.float32, 'y_coord': np.float32, 'cfg': np.uint8}
+
+    return (columns_x, {f'th_{i}': np.float32 for i in range(m)})
+
+class Duplicate_Filter_Cls(object):
+    """
+    Description:
+        A specific class for the rejection of duplicate positions. The positions are keyed on the integer grid
+        given by the tolerance and the keys are stored in a hash set, so the check of each position takes
+        O(1) time and the whole deduplication scales linearly with the number of data.
+
+    Initialization of the Class:
+        Args:
+            (1) tolerance [int]: The number of decimals to which the positions are rounded.
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = Duplicate_Filter_Cls(tolerance=4)
+
+            Features:
+                # Properties of the class.
+                Cls.Num_Of_Rejected
+
+                # Functions of the class.
+                Cls.Filter([[x, y], ..])
+    """
+
+    def __init__(self, tolerance: int) -> None:
+        # Scale of the integer grid.
+        self.__scale = 10.0 ** tolerance
+        # A set of the keys of the accepted positions.
+        self.__keys = set()
+        # The number of rejected (duplicate) positions.
+        self.__num_of_rejected = 0
+
+    def __Get_Keys(self, p: tp.List[tp.List[float]]) -> tp.List[int]:
+        """
+        Description:
+            A function to obtain the keys of the positions on the integer grid.
+
+            Note:
+                The x, y indices of the grid are packed into a single 64-bit integer.
+
+        Args:
+            (1) p [Matrix<float> nx2]: Positions (x, y) in meters.
+
+        Returns:
+            (1) parameter [Vector<int64> 1xn]: The keys of the positions.
+        """
+
+        idx = np.rint(np.asarray(p, dtype=np.float64) * self.__scale).astype(np.int64)
+
+        return (idx[:, 0] << 32) ^ (idx[:, 1] & 0xFFFFFFFF)
+
+    @property
+    def Num_Of_Rejected(self) -> int:
+        """
+        Description:
+            Get the number of rejected (duplicate) positions.
+
+        Returns:
+            (1) parameter [int]: The number of rejected positions.
+        """
+
+        return self.__num_of_rejected
+
+    def Add_Rejected(self, num_of_rejected: int) -> None:
+        """
+        Description:
+            A function to add the number of positions rejected outside of the filter, e.g. by the filters 
+            of the individual worker processes.
+
+        Args:
+            (1) num_of_rejected [int]: The number of rejected positions.
+        """
+
+        self.__num_of_rejected += num_of_rejected
+
+    def Filter(self, p: tp.List[tp.List[float]], max_num_of_accepted: tp.Optional[int] = None) -> tp.List[bool]:
+        """
+        Description:
+            A function to find the positions that have not been accepted yet. The found positions are 
+            accepted, i.e. stored in the set of keys.
+
+            Note 1:
+                If a position occurs several times in the input data, only the first occurrence is accepted.
+
+            Note 2:
+                If the maximum number of accepted positions is defined, the surplus new positions are neither 
+                accepted nor counted as rejected, so their keys remain available for the next calls.
+
+        Args:
+            (1) p [Matrix<float> nx2]: Positions (x, y) in meters.
+            (2) max_num_of_accepted [int]: The maximum number of positions to be accepted. If the parameter 
+                                           is not defined, all new positions are accepted.
+
+        Returns:
+            (1) parameter [Vector<bool> 1xn]: The value is "True" if the position is accepted, and "False" if it 
+                                              is a duplicate.
+        """
+
+        keys = self.__Get_Keys(p)
+
+        # The first occurrence of each key in the input data.
+        _, idx = np.unique(keys, return_index=True)
+        mask = np.zeros(keys.size, dtype=bool); mask[idx] = True
+
+        # Reject the keys that have already been accepted.
+        mask[idx[np.fromiter((key_i in self.__keys for key_i in keys[idx].tolist()), dtype=bool, count=idx.size)]] = False
+        self.__num_of_rejected += int(keys.size - np.count_nonzero(mask))
+
+        # Keep only the first new positions up to the maximum number.
+        if max_num_of_accepted != None:
+            mask[np.flatnonzero(mask)[max_num_of_accepted:]] = False
+
+        self.__keys.update(keys[mask].tolist())
+
+        return mask
+
+def Generate_Positions(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, rng: np.random.Generator,
+                       block_size: int = 100000, Filter_Cls: tp.Optional[Duplicate_Filter_Cls] = None) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to generate unique reachable positions of the selected robotic structure. The absolute joint 
+        positions are sampled in large blocks and the positions are obtained using the batch (vectorized) 
+        forward kinematics.
+
+        Note:
+            If no new position is found in the whole block, the generation is stopped and the function returns 
+            less than N positions (insufficient number of combinations for the given tolerance).
+
+    Args:
+        (1) N [int]: Number of positions to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the positions are rounded.
+        (4) rng [np.random.Generator(object)]: Random number generator.
+        (5) block_size [int]: The maximum number of positions generated at once.
+        (6) Filter_Cls [Duplicate_Filter_Cls(object)]: The filter of duplicate positions. If the parameter is not 
+                                                       defined, a new filter is created.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx2]: Generated positions (x, y) in meters.
+    """
+
+    if Filter_Cls == None:
+        Filter_Cls = Duplicate_Filter_Cls(tolerance)
+
+    # Preallocation of the positions.
+    p = np.empty((N, 2), dtype=np.float32)
+
+    i = 0
+    while N > i:
+        n_i = min(block_size, N - i)
+
+        # Random generation of absolute joint orientations.
+        #   Note:
+        #       The boundaries of the random generation are defined in the object structure.
+        theta_rand = rng.uniform(Robot_Parameters_Str.Theta.Limit[:, 0], Robot_Parameters_Str.Theta.Limit[:, 1],
+                                 size=(n_i, Robot_Parameters_Str.Theta.Zero.size))
+
+        # Obtain the x, y coordinates using forward kinematics.
+        p_tmp = np.round(Kinematics.Core.Forward_Kinematics_Batch(theta_rand, Robot_Parameters_Str)[1], tolerance).astype(np.float32)
+
+        # Reject the duplicates of the positions.
+        p_tmp = p_tmp[Filter_Cls.Filter(p_tmp)]
+        if p_tmp.shape[0] == 0:
+            break
+
+        # Store the acquired data.
+        p[i:i + p_tmp.shape[0]] = p_tmp
+        i += p_tmp.shape[0]
+
+    return p[0:i]
+
+def Generate(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, rng: np.random.Generator,
+             block_size: int = 100000, Filter_Cls: tp.Optional[Duplicate_Filter_Cls] = None) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to generate the dataset of the selected robotic structure. The unique positions are generated
+        in large blocks and processed using the batch (vectorized) inverse kinematics.
+
+        The structure of the dataset is described below.
+            Input of the NN:  x -> Position(x, y); configuration_id(0, 1)
+            Output of the NN: y -> theta(0 .. n)
+
+            Where n is the number of absolute joint positions.
+
+        Note:
+            Each randomly generated position yields two rows of the dataset, one for each configuration
+            of the inverse kinematics (IK) solution.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) rng [np.random.Generator(object)]: Random number generator.
+        (5) block_size [int]: The maximum number of positions generated at once.
+        (6) Filter_Cls [Duplicate_Filter_Cls(object)]: The filter of duplicate positions. If the parameter is not 
+                                                       defined, a new filter is created.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx5]: Generated data (x, y, cfg, th_0, th_1).
+    """
+
+    # Generate the unique positions.
+    p = Generate_Positions((N + 1) // 2, Robot_Parameters_Str, tolerance, rng, block_size, Filter_Cls)
+
+    return __Get_Data(p, Robot_Parameters_Str, tolerance)[0:N]
+
+def Sample(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, rng: np.random.Generator) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to sample the data of the selected robotic structure without the rejection of duplicate 
+        positions, e.g. to draw fresh batches of the data during the training.
+
+        Note:
+            The memory does not grow with the number of calls, because no positions are stored.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be sampled.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) rng [np.random.Generator(object)]: Random number generator.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx5]: Sampled data (x, y, cfg, th_0, th_1).
+    """
+
+    # Random generation of absolute joint orientations.
+    theta_rand = rng.uniform(Robot_Parameters_Str.Theta.Limit[:, 0], Robot_Parameters_Str.Theta.Limit[:, 1],
+                             size=((N + 1) // 2, Robot_Parameters_Str.Theta.Zero.size))
+
+    # Obtain the x, y coordinates using forward kinematics.
+    p = np.round(Kinematics.Core.Forward_Kinematics_Batch(theta_rand, Robot_Parameters_Str)[1], tolerance).astype(np.float32)
+
+    return __Get_Data(p, Robot_Parameters_Str, tolerance)[0:N]
+
+def Generate_Joint_Space(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, 
+                         rng: np.random.Generator) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to generate the dataset of any serial robotic structure (with revolute joints) described by 
+        the standard Denavit-Hartenberg (DH) parameters. The absolute joint positions are sampled within the limits 
+        and the pose of the TCP is obtained using the generic forward kinematics.
+
+        The structure of the dataset is described below.
+            Input of the NN:  x -> Pose(position, orientation, configuration), see the Get_Columns() function
+            Output of the NN: y -> theta(0 .. m)
+
+            Where m is the number of absolute joint positions.
+
+        Note:
+            The configuration of the planar structures is given by the elbow (joint 1), in the same way as in 
+            the inverse kinematics (0: sin(theta_{1}) >= 0, 1: sin(theta_{1}) < 0). No configuration is available 
+            for the general spatial structure, so the joint limits should select a single solution for each pose 
+            (e.g. the elbow-up region of the workspace).
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) rng [np.random.Generator(object)]: Random number generator.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx(k + m)]: Generated data (input columns, th_0, .., th_{m-1}).
+                                                  Note:
+                                                    Where k is the number of input columns.
+    """
+
+    # Random generation of absolute joint orientations.
+    theta_rand = rng.uniform(Robot_Parameters_Str.Theta.Limit[:, 0], Robot_Parameters_Str.Theta.Limit[:, 1],
+                             size=(N, Robot_Parameters_Str.Theta.Zero.size))
+
+    # Obtain the pose of the TCP using the generic forward kinematics.
+    T = Kinematics.Core.Forward_Kinematics_DH_Batch(theta_rand, Robot_Parameters_Str)[1]
+
+    # All the input parameters of the joint space dataset.
+    data_x = {'x_coord': T[:, 0, 3], 'y_coord': T[:, 1, 3], 'z_coord': T[:, 2, 3]}
+    data_x.update({name_i: T[:, int(name_i[2]), int(name_i[3])] for _, name_i in enumerate(CONST_ORIENTATION_COLUMN_NAMES)})
+    if theta_rand.shape[1] > 1:
+        data_x['cfg'] = np.sin(Kinematics.Core.Get_DH_Parameters(Robot_Parameters_Str)[1, 0] + theta_rand[:, 1]) < 0.0
+
+    columns_x = Get_Columns(Robot_Parameters_Str, 'joint_space')[0]
+
+    return np.round(np.column_stack([data_x[name_i] for _, name_i in enumerate(columns_x)] + [theta_rand]), 
+                    tolerance).astype(np.float32)
+
+def Generate_Joint_Space_Chunks(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, seed: int, chunk_size: int, 
+                                start: int = 0) -> tp.Iterator[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A generator to produce the joint space dataset (see the Generate_Joint_Space() function) in chunks of a fixed 
+        size, so that each chunk can be written to the file as soon as it is produced.
+
+        Note 1:
+            The random number generator of the chunk k is derived from [seed, k], so the generation can be resumed 
+            from any complete chunk.
+
+        Note 2:
+            The redundant structures (more joints than the degrees of freedom of the pose, i.e. 3 for the planar 
+            and 6 for the spatial structures) are rejected, because the pose leaves some joints undetermined.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) seed [int]: The seed (entropy) of the random number generator.
+        (5) chunk_size [int]: The number of data (rows) in a single chunk.
+        (6) start [int]: The index of the first chunk to be generated.
+
+    Returns:
+        (1) parameter [Matrix<float> chunk_size x (k + m)]: Generated chunk of the data (input columns, th_0, .., th_{m-1}).
+    """
+
+    try:
+        assert Robot_Parameters_Str.Theta.Zero.size <= (3 if __Is_Planar(Robot_Parameters_Str) == True else 6)
+
+        for k, i in enumerate(range(0, N, chunk_size)):
+            if k < start:
+                continue
+
+            yield Generate_Joint_Space(min(chunk_size, N - i), Robot_Parameters_Str, tolerance, np.random.default_rng([seed, k]))
+
+    except AssertionError as error:
+        print(f'[ERROR] Information: {error}')
+        print(f'[ERROR] The robotic structure with {Robot_Parameters_Str.Theta.Zero.size} joints is redundant, the joint positions are not unique.')
+
+def __Get_Data(p: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot, tolerance: int) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to obtain the rows of the dataset from the positions using the batch (vectorized) 
+        inverse kinematics.
+
+    Args:
+        (1) p [Matrix<float> nx2]: Positions (x, y) in meters.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+
+    Returns:
+        (1) parameter [Matrix<float> (2*n)x5]: The data (x, y, cfg, th_0, th_1), two rows per position.
+    """
+
+    # Obtain the solutions of the absolute positions of the joints.
+    th = Kinematics.Core.Inverse_Kinematics_Batch(p, Robot_Parameters_Str)[1]
+
+    # Preallocation of the dataset.
+    data = np.empty((p.shape[0], 2, CONST_NUM_OF_COLUMNS), dtype=np.float32)
+
+    # Store the acquired data.
+    #   Position (p), configuration (0: theta solution 0, 1: theta solution 1) and absolute 
+    #   position of the joint (theta).
+    data[:, :, 0:2] = p[:, np.newaxis, :]
+    data[:, :, 2]   = np.arange(2, dtype=np.float32)
+    data[:, :, 3:]  = np.round(th, tolerance)
+
+    return data.reshape(-1, CONST_NUM_OF_COLUMNS)
+
+def __Generate_Shard(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, seed_sequence: np.random.SeedSequence,
+                     block_size: int) -> tp.Tuple[tp.List[tp.List[float]], int]:
+    """
+    Description:
+        A function to generate a single shard of the dataset using its own random number generator.
+
+        Note:
+            The function is executed in the worker process.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) seed_sequence [np.random.SeedSequence(object)]: The seed sequence of the shard.
+        (5) block_size [int]: The maximum number of positions generated at once.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx5]: Generated data (x, y, cfg, th_0, th_1).
+        (2) parameter [int]: The number of positions rejected within the shard.
+    """
+
+    Filter_Cls = Duplicate_Filter_Cls(tolerance)
+
+    return (Generate(N, Robot_Parameters_Str, tolerance, np.random.default_rng(seed_sequence), block_size, Filter_Cls), 
+            Filter_Cls.Num_Of_Rejected)
+
+def Generate_Parallel(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, seed: tp.Union[int, tp.List[int]], 
+                      num_of_workers: int, block_size: int = 100000, Filter_Cls: tp.Optional[Duplicate_Filter_Cls] = None) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to generate the dataset of the selected robotic structure using multiple processes.
+
+        The desired number of data is split into shards, one for each worker. Each shard is generated 
+        in a separate process with its own seed sequence derived (spawned) from the input seed. The shards 
+        are merged in a fixed order and the positions duplicated across the shards are rejected. If the number 
+        of data is insufficient after the rejection, the missing data are generated in the next round with 
+        newly spawned seed sequences.
+
+        Note:
+            The result is bit-identical for the given seed, number of workers and block size.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) seed [int, Vector<int>]: The seed (entropy) of the random number generator.
+        (5) num_of_workers [int]: The number of worker processes.
+        (6) block_size [int]: The maximum number of positions generated at once.
+        (7) Filter_Cls [Duplicate_Filter_Cls(object)]: The filter of duplicate positions. If the parameter is not 
+                                                       defined, a new filter is created.
+
+    Returns:
+        (1) parameter [Matrix<float> Nx5]: Generated data (x, y, cfg, th_0, th_1).
+    """
+
+    if Filter_Cls == None:
+        Filter_Cls = Duplicate_Filter_Cls(tolerance)
+
+    # The root of the seed sequences of the individual shards.
+    seed_sequence = np.random.SeedSequence(seed)
+
+    # The number of positions to be generated.
+    N_p = (N + 1) // 2
+
+    # Preallocation of the dataset.
+    data = np.empty((N_p, 2, CONST_NUM_OF_COLUMNS), dtype=np.float32)
+
+    pool = multiprocessing.Pool(num_of_workers) if num_of_workers > 1 else None
+    try:
+        i = 0
+        while N_p > i:
+            # Arguments of the individual shards.
+            #   Note:
+            #       Each shard contains two rows (configurations) per position.
+            n_shard = -(-(N_p - i) // num_of_workers)
+            arguments = [(2 * n_shard, Robot_Parameters_Str, tolerance, seed_sequence_i, block_size) 
+                         for seed_sequence_i in seed_sequence.spawn(num_of_workers)]
+
+            # Generate the shards.
+            shards = pool.starmap(__Generate_Shard, arguments) if pool != None else [__Generate_Shard(*arguments_i) for arguments_i in arguments]
+
+            # Merge the shards and reject the positions duplicated across the shards.
+            i_round = i
+            for _, (shard_i, num_of_rejected_i) in enumerate(shards):
+                Filter_Cls.Add_Rejected(num_of_rejected_i)
+
+                shard_i = shard_i.reshape(-1, 2, CONST_NUM_OF_COLUMNS)
+                #   Note:
+                #       Only the positions that are stored are accepted by the filter, so the filter can be rebuilt 
+                #       from the stored data when the generation is resumed.
+                shard_i = shard_i[Filter_Cls.Filter(shard_i[:, 0, 0:2], N_p - i)]
+
+                data[i:i + shard_i.shape[0]] = shard_i
+                i += shard_i.shape[0]
+
+            # Insufficient number of combinations.
+            if i == i_round:
+                break
+    finally:
+        if pool != None:
+            pool.close(); pool.join()
+
+    return data[0:i].reshape(-1, CONST_NUM_OF_COLUMNS)[0:N]
+
+def Generate_Chunks(N: int, Robot_Parameters_Str: Parameters.Robot, tolerance: int, seed: int, num_of_workers: int, 
+                    chunk_size: int, block_size: int = 100000, Filter_Cls: tp.Optional[Duplicate_Filter_Cls] = None,
+                    start: int = 0) -> tp.Iterator[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A generator to produce the dataset of the selected robotic structure in chunks of a fixed size, so that 
+        each chunk can be written to the file as soon as it is produced.
+
+        Note 1:
+            The seed sequence of the chunk k is derived from [seed, k], so the generation can be resumed from 
+            any complete chunk. In this case, the filter must contain the positions of the previous chunks.
+
+        Note 2:
+            If the chunk is smaller than desired (insufficient number of combinations), the generation 
+            is stopped.
+
+    Args:
+        (1) N [int]: Number of data (rows) to be generated.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) tolerance [int]: The number of decimals to which the data are rounded.
+        (4) seed [int]: The seed (entropy) of the random number generator.
+        (5) num_of_workers [int]: The number of worker processes.
+        (6) chunk_size [int]: The number of data (rows) in a single chunk.
+                              Note:
+                                The chunk size must be even, so that both configurations of the position 
+                                are stored in the same chunk.
+        (7) block_size [int]: The maximum number of positions generated at once.
+        (8) Filter_Cls [Duplicate_Filter_Cls(object)]: The filter of duplicate positions. If the parameter is not 
+                                                       defined, a new filter is created.
+        (9) start [int]: The index of the first chunk to be generated.
+
+    Returns:
+        (1) parameter [Matrix<float> chunk_size x 5]: Generated chunk of the data (x, y, cfg, th_0, th_1).
+    """
+
+    try:
+        assert chunk_size % 2 == 0
+
+        if Filter_Cls == None:
+            Filter_Cls = Duplicate_Filter_Cls(tolerance)
+
+        for k, i in enumerate(range(0, N, chunk_size)):
+            if k < start:
+                continue
+
+            n_i = min(chunk_size, N - i)
+            data = Generate_Parallel(n_i, Robot_Parameters_Str, tolerance, [seed, k], num_of_workers, block_size, Filter_Cls)
+
+            yield data
+
+            if data.shape[0] < n_i:
+                break
+
+    except AssertionError as error:
+        print(f'[ERROR] Information: {error}')
+        print(f'[ERROR] The chunk size must be even and not {chunk_size}.')
@@ -0,0 +1,146 @@
+# Typing (Support for type hints)
+import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+
+"""
+Description:
+    Initialization of constants.
+"""
+# Activation functions of the Dense layers supported by the Numpy inference.
+CONST_ACTIVATION = {'linear': lambda x: x,
+                    'tanh': np.tanh,
+                    'relu': lambda x: np.maximum(x, 0.0),
+                    'sigmoid': lambda x: 1.0 / (1.0 + np.exp(-x))}
+
+class FCNN_Numpy_Predictor_Cls(object):
+    """
+    Description:
+        A specific class for predicting the absolute joint position of the robotic arm using a Fully-Connected
+        Neural Network (FCNN) exported into a Numpy archive (*.npz).
+
+        Note 1:
+            The class has the same interface as the FCNN_Predictor_Cls class, but it only requires the Numpy
+            library (Tensorflow, Sklearn and Joblib do not need to be installed).
+
+        Note 2:
+            To export the trained model, see the function below:
+                ../FCNN_IK/Model.py -> FCNN_Predictor_Cls.Export(.., format='npz', ..)
+
+        Note 3:
+            If the scalers were folded into the Dense layers at export time, the raw input data are 
+            propagated directly through the network.
+
+        Note 4:
+            If the weights were quantized to int8 at export time, they are dequantized to float32 when 
+            the archive is loaded, so the inference is the same as for the uncompressed model.
+
+    Initialization of the Class:
+        Args:
+            (1) file_path [string]: The specified path to the file of the exported model (*.npz).
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = FCNN_Numpy_Predictor_Cls('../..')
+
+            Features:
+                # Functions of the class.
+                Cls.Predict([p(x, y), cfg])
+                Cls.Predict_Batch([[p(x, y), cfg], ..], batch_size=4096)
+    """
+
+    def __init__(self, file_path: str) -> None:
+        # Load the data from the file (*.npz).
+        with np.load(file_path) as data:
+            # Parameters of the individual Dense layers.
+            self.__layers = []
+            for i, activation_i in enumerate(data['activation']):
+                W_i = data[f'W_{i}']
+                # Dequantization of the int8 weights.
+                #   W = W_{q} * scale
+                if f'W_{i}_scale' in data:
+                    W_i = W_i.astype(np.float32) * data[f'W_{i}_scale'][np.newaxis, :]
+                self.__layers.append((W_i, data[f'b_{i}'], CONST_ACTIVATION[str(activation_i)]))
+
+            # Parameters of the min-max scalers.
+            #   Note:
+            #       If the scalers are folded into the Dense layers, the archive does not contain them.
+            self.__folded = 'scale_x' not in data
+            if self.__folded == False:
+                self.__scale_x = data['scale_x']; self.__min_x = data['min_x']
+                self.__scale_y = data['scale_y']; self.__min_y = data['min_y']
+
+    def __Forward(self, x: tp.List[tp.List[float]]) -> tp.List[tp.List[float]]:
+        """
+        Description:
+            A function to propagate the input data through the network including the transformation
+            of the data using the scale parameters.
+
+        Args:
+            (1) x [Matrix<float> nxk]: Input data.
+
+        Returns:
+            (1) parameter [Matrix<float> nxm]: Output (unscaled) data.
+        """
+
+        if self.__folded == True:
+            y = x
+        else:
+            # Transform of data using the scale parameter.
+            y = x * self.__scale_x + self.__min_x
+
+        # Propagation through the individual Dense layers.
+        for _, (W_i, b_i, activation_i) in enumerate(self.__layers):
+            y = activation_i(y @ W_i + b_i)
+
+        if self.__folded == True:
+            return y
+
+        # Inverse transformation (unscaling) of data using the scale parameter.
+        return (y - self.__min_y) / self.__scale_y
+
+    def Predict(self, x: tp.List[tp.Union[float, int]]) -> tp.List[float]:
+        """
+        Description:
+            A function to predict the absolute joint position of the robotic arm from the input
+            position of the end-effector and configuration of the solution.
+
+        Args:
+            (1) x [Vector<[float, int]> 1xk]: Input data defined as coordinates of the x-axis, y-axis (in meters)
+                                              and the configuration of the solution.
+
+        Returns:
+            (1) parameter [Vector<float> 1xm]: Output data defined as absolute joint position of the robotic arm.
+                                                Note:
+                                                    Where m is the number of joints.
+        """
+
+        return self.__Forward(np.asarray(x, dtype=np.float32).reshape(1, -1))
+
+    def Predict_Batch(self, x: tp.List[tp.List[tp.Union[float, int]]], batch_size: int = 4096) -> tp.List[tp.List[float]]:
+        """
+        Description:
+            A function to predict the absolute joint positions of the robotic arm from a set of input
+            positions of the end-effector and configurations of the solution.
+
+        Args:
+            (1) x [Matrix<[float, int]> nxk]: Input data defined as coordinates of the x-axis, y-axis (in meters)
+                                              and the configuration of the solution.
+                                                Note:
+                                                    Where n is the number of data and k is the number of input parameters.
+            (2) batch_size [int]: The number of samples processed at once.
+
+        Returns:
+            (1) parameter [Matrix<float> nxm]: Output data defined as absolute joint positions of the robotic arm.
+                                                Note:
+                                                    Where m is the number of joints.
+        """
+
+        x = np.asarray(x, dtype=np.float32).reshape(-1, self.__layers[0][0].shape[0])
+
+        y = np.empty((x.shape[0], self.__layers[-1][0].shape[1]), dtype=np.float32)
+        for i in range(0, x.shape[0], batch_size):
+            y[i:i + batch_size] = self.__Forward(x[i:i + batch_size])
+
+        return y
@@ -14,9 +14,23 @@ import sklearn.model_selection
 import keras_tuner as kt
 # Shutil (High-level file operations)
 import shutil
+# Time (Time access and conversions)
+import time
+# Multiprocessing (Process-based parallelism)
+import multiprocessing
+# Socket (Low-level networking interface)
+import socket
 # Custom Lib.:
 #   ../FCNN_IK/Utilities
 import FCNN_IK.Utilities as Utilities
+#   ../FCNN_IK/Inference
+import FCNN_IK.Inference as Inference
+#   ../Parameters/Robot
+import Parameters.Robot
+#   ../Dataset/Core
+import Dataset.Core
+#   ../Kinematics/Core
+import Kinematics.Core
 #   ../Utilities/File_IO
 import Utilities.File_IO as File_IO
 
@@ -26,6 +40,37 @@ Description:
 """
 # Locate the path to the project folder.
 CONST_PROJECT_FOLDER = os.getcwd().split('FCNN_Inverse_Kinematics')[0] + 'FCNN_Inverse_Kinematics'
+# The number of data read from the disk at once, if the dataset is not loaded into memory.
+CONST_CHUNK_SIZE = 100000
+# Precision policies of the model layers.
+#   'float32'       : Default precision.
+#   'mixed_float16' : Computations in float16, variables in float32 (GPU).
+#   'mixed_bfloat16': Computations in bfloat16, variables in float32 (CPU/TPU).
+CONST_PRECISION_POLICIES = ['float32', 'mixed_float16', 'mixed_bfloat16']
+# The address of the chief process (oracle) of the parallel hyperparameter search.
+#   Note:
+#       The search runs on a single machine (localhost).
+CONST_ORACLE_IP = '127.0.0.1'
+# Strategies of the hyperparameter search.
+#   'bayesian' : Bayesian optimization, each trial is trained for the full number of epochs.
+#   'hyperband': Hyperband (successive halving), the poor trials are terminated early.
+CONST_SEARCH_STRATEGIES = ['bayesian', 'hyperband']
+# The reduction factor of the number of trials (and the increase of the number of epochs) 
+# between the rounds of the successive halving.
+CONST_HYPERBAND_FACTOR = 3
+# Objectives of the hyperparameter search.
+#   'val_loss'          : Mean squared error (MSE) of the scaled joint positions.
+#   'val_mae'           : Mean absolute error (MAE) of the scaled joint positions.
+#   'val_position_error': Mean Euclidean error (in meters) of the end-effector position obtained 
+#                         from the predicted joint positions using Forward Kinematics (FK).
+#   'val_cost'          : Position error penalized by the inference latency and the number of parameters.
+#   Note:
+#       All the objectives are minimized.
+CONST_OBJECTIVES = ['val_loss', 'val_mae', 'val_position_error', 'val_cost']
+# The relative penalties of the multi-objective search ('val_cost').
+#   val_cost = val_position_error * (1.0 + latency * t + num_of_parameters * N),
+#   where t is the latency of the single-sample prediction in milliseconds and N is the number of parameters of the model.
+CONST_PENALTY = {'latency': 10.0, 'num_of_parameters': 1e-6}
 
 class FCNN_Trainer_Cls(object):
     """
@@ -43,6 +88,13 @@ class FCNN_Trainer_Cls(object):
             (3) train_size [float]: The size of the training partition.
             (4) test_size [float]: The size of the validation partition.
             (5) file_path [string]: The specified path of the file without extension (format).
+            (6) in_memory [bool]: Information about whether the dataset is loaded into memory. If not, the input data 
+                                  can be memory-mapped (e.g. ../Utilities/File_IO.py -> Load_Stream, or the columns 
+                                  from Load_Columnar accessed through Columnar_View_Cls) and they are streamed 
+                                  from the disk during the training.
+                                    Note:
+                                        The dataset is split into contiguous train and validation subsets (the generated 
+                                        data are already in random order) and the scalers are fitted chunk by chunk.
 
         Example:
             Initialization:
@@ -59,12 +111,13 @@ class FCNN_Trainer_Cls(object):
                                        '../..')
             Features:
                 # Functions of the class.
-                Cls.Compile(Hyperparameters_Str); Cls.Train(epochs=100, batch_size=64)
+                Cls.Compile(Hyperparameters_Str, jit_compile=False, precision_policy='float32'); Cls.Train(epochs=100, batch_size=64)
+                Cls.Train_Synthetic(Robot_Str, tolerance=4, epochs=100, steps_per_epoch=1000, batch_size=64)
                 Cls.Save()
     """
         
     def __init__(self, x: tp.List[tp.Union[float, int]], y: tp.List[float], train_size: float, test_size: float,
-                 file_path: str) -> None:
+                 file_path: str, in_memory: bool = True) -> None:
 
         try:
             assert (train_size + test_size) == 1.0 and test_size > 0.0
@@ -72,14 +125,29 @@ class FCNN_Trainer_Cls(object):
             # The data (History: <loss, mean square error, mean absolute error>, etc.) from the training.
             self.__train_data = None
 
-            # Split the data from the dataset (x, y) into random train and validation subsets.
-            self.__x_train, self.__x_validation, self.__y_train, self.__y_validation = sklearn.model_selection.train_test_split(x, y, 
-                                                                                                                                train_size=train_size, test_size=test_size, 
-                                                                                                                                shuffle=1, random_state=0)
+            # Information about whether the dataset is loaded into memory.
+            self.__in_memory = in_memory
 
-            # Find the scale parameter from the dataset and transform the data using this parameter.
-            self.__scaler_x, self.__x_train_scaled = Utilities.Scale_Data([-1.0, 1.0], self.__x_train)
-            self.__scaler_y, self.__y_train_scaled = Utilities.Scale_Data([-1.0, 1.0], self.__y_train)
+            if self.__in_memory == True:
+                # Split the data from the dataset (x, y) into random train and validation subsets.
+                self.__x_train, self.__x_validation, self.__y_train, self.__y_validation = sklearn.model_selection.train_test_split(x, y, 
+                                                                                                                                    train_size=train_size, test_size=test_size, 
+                                                                                                                                    shuffle=1, random_state=0)
+
+                # Find the scale parameter from the dataset and transform the data using this parameter.
+                self.__scaler_x, self.__x_train_scaled = Utilities.Scale_Data([-1.0, 1.0], self.__x_train)
+                self.__scaler_y, self.__y_train_scaled = Utilities.Scale_Data([-1.0, 1.0], self.__y_train)
+            else:
+                # Split the data from the dataset (x, y) into contiguous train and validation subsets (views).
+                n_train = int(x.shape[0] * train_size)
+                self.__x_train, self.__x_validation = x[0:n_train], x[n_train:]
+                self.__y_train, self.__y_validation = y[0:n_train], y[n_train:]
+
+                # Find the scale parameter from the dataset chunk by chunk.
+                #   Note:
+                #       The data are transformed in the input pipeline during the training.
+                self.__scaler_x = Utilities.Fit_Scaler_Partial([-1.0, 1.0], self.__x_train, CONST_CHUNK_SIZE)
+                self.__scaler_y = Utilities.Fit_Scaler_Partial([-1.0, 1.0], self.__y_train, CONST_CHUNK_SIZE)
             
             # The file path to save the data.
             self.__file_path = file_path
@@ -95,13 +163,22 @@ class FCNN_Trainer_Cls(object):
             # Initialization of a sequential neural network model.
             self.__model = tf.keras.models.Sequential()
 
-            # Transform of data using an the scale parameter.
-            self.__x_validation_scaled = Utilities.Transform_Data_With_Scaler(self.__scaler_x, self.__x_validation)
-            self.__y_validation_scaled = Utilities.Transform_Data_With_Scaler(self.__scaler_y, self.__y_validation)
+            if self.__in_memory == True:
+                # Transform of data using an the scale parameter.
+                self.__x_validation_scaled = Utilities.Transform_Data_With_Scaler(self.__scaler_x, self.__x_validation)
+                self.__y_validation_scaled = Utilities.Transform_Data_With_Scaler(self.__scaler_y, self.__y_validation)
 
             # A callback to save the model with a specific frequency.
             self.__callback = tf.keras.callbacks.ModelCheckpoint(filepath=f'{self.__file_path}.h5', monitor='val_loss', 
                                                                  save_best_only=True, verbose=1)
+
+            # Parameters of the early stopping and the reduction of the learning rate on the plateau.
+            #   Note:
+            #       The policies are disabled if the patience is not defined or if it is not positive (e.g. 0).
+            self.__policy = {'early_stopping_patience': None, 'reduce_lr_patience': None, 'reduce_lr_factor': 0.5, 
+                             'min_learning_rate': 0.0}
+            #   A callback to stop the training when the validation loss has stopped improving.
+            self.__callback_early_stopping = None
         
         except AssertionError as error:
             print(f'[ERROR] Information: {error}')
@@ -118,6 +195,93 @@ class FCNN_Trainer_Cls(object):
 
         tf.keras.backend.clear_session()
 
+    def __Get_Callbacks(self, early_stopping_patience: tp.Optional[int], reduce_lr_patience: tp.Optional[int]) -> tp.List[tf.keras.callbacks.Callback]:
+        """
+        Description:
+            A function to obtain the callbacks of the training.
+
+        Args:
+            (1) early_stopping_patience [int]: The number of epochs with no improvement of the validation loss after 
+                                               which the training is stopped. If the parameter is not defined, the value 
+                                               from the hyperparameter structure is used.
+            (2) reduce_lr_patience [int]: The number of epochs with no improvement of the validation loss after which 
+                                          the learning rate is reduced. If the parameter is not defined, the value from 
+                                          the hyperparameter structure is used.
+                                            Note:
+                                                A patience less than or equal to zero (e.g. 0) disables the policy.
+
+        Returns:
+            (1) parameter [Vector<tf.keras.callbacks.Callback(object)>]: The callbacks of the training.
+        """
+
+        if early_stopping_patience == None:
+            early_stopping_patience = self.__policy['early_stopping_patience']
+        if reduce_lr_patience == None:
+            reduce_lr_patience = self.__policy['reduce_lr_patience']
+
+        callbacks = [self.__callback]; self.__callback_early_stopping = None
+        if early_stopping_patience != None and early_stopping_patience > 0:
+            # The weights of the best epoch are restored, so they correspond to the saved model.
+            self.__callback_early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=early_stopping_patience, 
+                                                                              restore_best_weights=True, verbose=1)
+            callbacks.append(self.__callback_early_stopping)
+        if reduce_lr_patience != None and reduce_lr_patience > 0:
+            callbacks.append(tf.keras.callbacks.ReduceLROnPlateau(monitor='val_loss', factor=self.__policy['reduce_lr_factor'], 
+                                                                  patience=reduce_lr_patience, min_lr=self.__policy['min_learning_rate'], 
+                                                                  verbose=1))
+
+        return callbacks
+
+    def __Get_Dataset(self, x: tp.List[tp.List[float]], y: tp.List[tp.List[float]], batch_size: int, shuffle: bool, 
+                      shuffle_buffer_size: int) -> tf.data.Dataset:
+        """
+        Description:
+            A function to create the input pipeline (tf.data.Dataset) of the training/validation data.
+
+            The pipeline consists of the stages below:
+                In memory:     (scaled data) -> cache -> shuffle -> batch -> prefetch
+                Not in memory: (chunks of the data from the disk) -> scale (parallel) -> unbatch -> shuffle -> batch -> prefetch
+
+            Note:
+                The prefetch stage overlaps the preparation of the input data on the CPU with the computation 
+                of the model.
+
+        Args:
+            (1) x [Matrix<float> nxm]: Input data.
+            (2) y [Matrix<float> nxk]: Output (target) data.
+            (3) batch_size [int]: The number of samples processed before the model is updated.
+            (4) shuffle [bool]: Information about whether the data should be shuffled in each epoch.
+            (5) shuffle_buffer_size [int]: The number of samples from which the shuffled samples are drawn.
+
+        Returns:
+            (1) parameter [tf.data.Dataset(object)]: The input pipeline of the data.
+        """
+
+        if self.__in_memory == True:
+            dataset = tf.data.Dataset.from_tensor_slices((x.astype(np.float32), y.astype(np.float32))).cache()
+        else:
+            num_of_chunks = -(-x.shape[0] // CONST_CHUNK_SIZE)
+            def Get_Chunk() -> tp.Iterator[tp.Tuple[tp.List[tp.List[float]], tp.List[tp.List[float]]]]:
+                # Read the chunks of the data from the disk in random order.
+                for _, i in enumerate(np.random.permutation(num_of_chunks) if shuffle == True else range(num_of_chunks)):
+                    yield (np.asarray(x[i * CONST_CHUNK_SIZE:(i + 1) * CONST_CHUNK_SIZE], dtype=np.float32), 
+                           np.asarray(y[i * CONST_CHUNK_SIZE:(i + 1) * CONST_CHUNK_SIZE], dtype=np.float32))
+
+            # Parameters of the min-max scalers.
+            #   x_{scaled} = x * scale + min
+            scale_x = self.__scaler_x.scale_.astype(np.float32); min_x = self.__scaler_x.min_.astype(np.float32)
+            scale_y = self.__scaler_y.scale_.astype(np.float32); min_y = self.__scaler_y.min_.astype(np.float32)
+
+            dataset = tf.data.Dataset.from_generator(Get_Chunk, output_signature=(tf.TensorSpec(shape=(None, x.shape[1]), dtype=tf.float32), 
+                                                                                  tf.TensorSpec(shape=(None, y.shape[1]), dtype=tf.float32)))
+            dataset = dataset.map(lambda x_i, y_i: (x_i * scale_x + min_x, y_i * scale_y + min_y), 
+                                  num_parallel_calls=tf.data.AUTOTUNE).unbatch()
+
+        if shuffle == True:
+            dataset = dataset.shuffle(shuffle_buffer_size, reshuffle_each_iteration=True)
+
+        return dataset.batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
     def Save(self) -> None:
         """
         Description:
@@ -147,14 +311,31 @@ class FCNN_Trainer_Cls(object):
             print(f'[INFO] The training data history has been successfully saved.')
             print(f'[INFO] >> file_path = {self.__file_path}_History.txt')
 
-    def Compile(self, Hyperparameters: tp.Dict) -> None:
+            # Save the information about the training: the number of epochs, the stopping epoch (0 if the training 
+            # was not stopped early) and the best epoch (minimum validation loss).
+            stopped_epoch = 0 if self.__callback_early_stopping == None or self.__callback_early_stopping.stopped_epoch == 0 \
+                            else self.__callback_early_stopping.stopped_epoch + 1
+            File_IO.Save(f'{self.__file_path}_History_Info', [len(self.__train_data.epoch), stopped_epoch, 
+                                                               int(np.argmin(self.__train_data.history['val_loss'])) + 1], 'txt', ',')
+            print(f'[INFO] >> file_path = {self.__file_path}_History_Info.txt')
+
+    def Compile(self, Hyperparameters: tp.Dict, jit_compile: bool = False, precision_policy: str = 'float32') -> None:
         """
         Description:
             A function to compile the model.
 
-            Note:
+            Note 1:
                 The model will be configured with the losses and metrics.
 
+            Note 2:
+                If the XLA (Accelerated Linear Algebra) compilation is enabled, the train step is compiled into fused 
+                kernels, which reduces the overhead of the individual operations of the small layers.
+
+            Note 3:
+                In the mixed precision, the computations of the layers use float16/bfloat16 and the variables stay 
+                in float32. The output layer is always computed in float32 to keep the precision of the joint positions. 
+                The loss of the 'mixed_float16' policy is scaled to avoid the numeric underflow of the gradients.
+
         Args:
             (1) Hyperparameters [Dictionary {..}]: The structure of the hyperparameters.
                                                     For more information about hyperparameters, see the script below:
@@ -162,28 +343,56 @@ class FCNN_Trainer_Cls(object):
 
                                                         where the {robot_name} is the name of the individual robotic 
                                                         structure.
+                                                    Note:
+                                                        The optional keys 'early_stopping_patience', 'reduce_lr_patience', 
+                                                        'reduce_lr_factor' and 'min_learning_rate' configure the early stopping 
+                                                        and the reduction of the learning rate on the plateau. A patience 
+                                                        less than or equal to zero disables the policy.
+            (2) jit_compile [bool]: Information about whether the train step should be compiled using XLA.
+            (3) precision_policy [string]: The precision policy of the layers, see CONST_PRECISION_POLICIES.
         """
 
+        try:
+            assert precision_policy in CONST_PRECISION_POLICIES
+
+        except AssertionError as error:
+            print(f'[ERROR] Information: {error}')
+            print(f'[ERROR] Incorrect precision policy. The policy must be one of {CONST_PRECISION_POLICIES}.')
+            return
+
         # Set the input layer of the FCNN model architecture.
         self.__model.add(tf.keras.layers.Dense(self.__x_train.shape[1], input_shape=(self.__x_train.shape[1], ), 
-                                               use_bias=Hyperparameters['use_bias']))
-        self.__model.add(tf.keras.layers.Dropout(Hyperparameters['layer_dropout']))
+                                               use_bias=Hyperparameters['use_bias'], dtype=precision_policy))
+        self.__model.add(tf.keras.layers.Dropout(Hyperparameters['layer_dropout'], dtype=precision_policy))
         
         # Set the hidden layers of the FCNN model architecture.
         for i in range(0, Hyperparameters['num_of_hidden_layers']):
             self.__model.add(tf.keras.layers.Dense(Hyperparameters[f'hidden_layer_{i + 1}_units'], activation='tanh', 
-                                                   use_bias=Hyperparameters['use_bias']))
-            self.__model.add(tf.keras.layers.Dropout(Hyperparameters['layer_dropout']))
+                                                   use_bias=Hyperparameters['use_bias'], dtype=precision_policy))
+            self.__model.add(tf.keras.layers.Dropout(Hyperparameters['layer_dropout'], dtype=precision_policy))
 
         # Set the output layer of the FCNN model architecture.
+        #   Note:
+        #       The output layer is computed in float32.
         self.__model.add(tf.keras.layers.Dense(self.__y_train.shape[1], activation='linear', 
-                                               use_bias=Hyperparameters['use_bias']))
+                                               use_bias=Hyperparameters['use_bias'], dtype='float32'))
+
+        # Set the optimizer with the loss scaling for the float16 computations.
+        optimizer = tf.keras.optimizers.Adam(learning_rate=Hyperparameters['learning_rate'])
+        if precision_policy == 'mixed_float16':
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
 
         # Finally, compile the model.
-        self.__model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=Hyperparameters['learning_rate']), loss='mse', 
-                             metrics=['accuracy', 'mse', 'mae'])
+        self.__model.compile(optimizer=optimizer, loss='mse', metrics=['accuracy', 'mse', 'mae'], 
+                             jit_compile=jit_compile)
+
+        # Parameters of the early stopping and the reduction of the learning rate on the plateau.
+        for _, key_i in enumerate(self.__policy.keys()):
+            if key_i in Hyperparameters:
+                self.__policy[key_i] = Hyperparameters[key_i]
         
-    def Train(self, epochs: int, batch_size: int) -> None:
+    def Train(self, epochs: int, batch_size: int, use_data_pipeline: bool = False, shuffle_buffer_size: int = 100000, 
+              early_stopping_patience: tp.Optional[int] = None, reduce_lr_patience: tp.Optional[int] = None) -> None:
         """
         Description:
             A function to train the Fully-Connected Neural Network (FCNN) model.
@@ -191,10 +400,108 @@ class FCNN_Trainer_Cls(object):
         Args:
             (1) epochs [int]: The number of epochs (iterations) to train the model.
             (2) batch_size [int]: The number of samples processed before the model is updated.
+            (3) use_data_pipeline [bool]: Information about whether the data should be passed to the model through 
+                                          the input pipeline (tf.data.Dataset).
+                                            Note:
+                                                If the dataset is not loaded into memory, the input pipeline is always used.
+            (4) shuffle_buffer_size [int]: The number of samples from which the shuffled samples are drawn in the input 
+                                           pipeline.
+            (5) early_stopping_patience [int]: The number of epochs with no improvement of the validation loss after which 
+                                               the training is stopped.
+            (6) reduce_lr_patience [int]: The number of epochs with no improvement of the validation loss after which 
+                                          the learning rate is reduced.
+                                            Note:
+                                                If the parameters (5, 6) are not defined, the values from the hyperparameter 
+                                                structure are used (see the Compile() function). A patience less than 
+                                                or equal to zero (e.g. 0) disables the policy for this training.
         """
+
+        # Callbacks of the training.
+        callbacks = self.__Get_Callbacks(early_stopping_patience, reduce_lr_patience)
  
-        self.__train_data = self.__model.fit(self.__x_train_scaled, self.__y_train_scaled, epochs=epochs, batch_size=batch_size, verbose=1, 
-                                             validation_data=(self.__x_validation_scaled, self.__y_validation_scaled), callbacks=[self.__callback])
+        if use_data_pipeline == True or self.__in_memory == False:
+            # Input pipelines of the training/validation data.
+            if self.__in_memory == True:
+                data_train = self.__Get_Dataset(self.__x_train_scaled, self.__y_train_scaled, batch_size, True, shuffle_buffer_size)
+                data_validation = self.__Get_Dataset(self.__x_validation_scaled, self.__y_validation_scaled, batch_size, False, shuffle_buffer_size)
+            else:
+                data_train = self.__Get_Dataset(self.__x_train, self.__y_train, batch_size, True, shuffle_buffer_size)
+                data_validation = self.__Get_Dataset(self.__x_validation, self.__y_validation, batch_size, False, shuffle_buffer_size)
+
+            self.__train_data = self.__model.fit(data_train, epochs=epochs, verbose=1, validation_data=data_validation, 
+                                                 callbacks=callbacks)
+        else:
+            self.__train_data = self.__model.fit(self.__x_train_scaled, self.__y_train_scaled, epochs=epochs, batch_size=batch_size, verbose=1, 
+                                                 validation_data=(self.__x_validation_scaled, self.__y_validation_scaled), callbacks=callbacks)
+
+        # Release GPU resources when the training process is already complete.
+        self.__Release()
+
+    def Train_Synthetic(self, Robot_Parameters_Str: Parameters.Robot, tolerance: int, epochs: int, steps_per_epoch: int, 
+                        batch_size: int, seed: tp.Optional[int] = None, early_stopping_patience: tp.Optional[int] = None, 
+                        reduce_lr_patience: tp.Optional[int] = None, dataset_type: str = 'configuration') -> None:
+        """
+        Description:
+            A function to train the Fully-Connected Neural Network (FCNN) model on the synthetic data, which are sampled 
+            on the fly using the batch (vectorized) forward/inverse kinematics. Each step draws a fresh batch of the data, 
+            so the model is trained on effectively unlimited data without any dataset I/O and with constant memory.
+
+            Note:
+                The data passed to the class are used only to find the scale parameters (train partition) and to 
+                validate the model (validation partition), so the validation set is fixed.
+
+        Args:
+            (1) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+            (2) tolerance [int]: The number of decimals to which the sampled data are rounded.
+            (3) epochs [int]: The number of epochs (iterations) to train the model.
+            (4) steps_per_epoch [int]: The number of batches drawn in each epoch.
+            (5) batch_size [int]: The number of samples processed before the model is updated.
+            (6) seed [int]: The seed of the random number generator of the sampler.
+            (7) early_stopping_patience [int]: The number of epochs with no improvement of the validation loss after which 
+                                               the training is stopped.
+            (8) reduce_lr_patience [int]: The number of epochs with no improvement of the validation loss after which 
+                                          the learning rate is reduced.
+                                            Note:
+                                                If the parameters (7, 8) are not defined, the values from the hyperparameter 
+                                                structure are used (see the Compile() function). A patience less than 
+                                                or equal to zero (e.g. 0) disables the policy for this training.
+            (9) dataset_type [string]: The type of the sampled data, see Dataset.Core.CONST_DATASET_TYPES.
+        """
+
+        rng = np.random.default_rng(seed)
+
+        # The sampler of the data.
+        Sample = Dataset.Core.Generate_Joint_Space if dataset_type == 'joint_space' else Dataset.Core.Sample
+
+        # The number of input parameters.
+        m = self.__x_train.shape[1]
+
+        def Get_Chunk() -> tp.Iterator[tp.Tuple[tp.List[tp.List[float]], tp.List[tp.List[float]]]]:
+            # Sample the data in chunks to reduce the overhead of the generator.
+            while True:
+                data = Sample(CONST_CHUNK_SIZE, Robot_Parameters_Str, tolerance, rng)
+                yield (data[:, 0:m], data[:, m:])
+
+        # Parameters of the min-max scalers.
+        #   x_{scaled} = x * scale + min
+        scale_x = self.__scaler_x.scale_.astype(np.float32); min_x = self.__scaler_x.min_.astype(np.float32)
+        scale_y = self.__scaler_y.scale_.astype(np.float32); min_y = self.__scaler_y.min_.astype(np.float32)
+
+        # Input pipeline of the synthetic training data.
+        #   Note:
+        #       Each position yields two consecutive rows (configurations), so the rows are shuffled within the chunk.
+        data_train = tf.data.Dataset.from_generator(Get_Chunk, output_signature=(tf.TensorSpec(shape=(None, m), dtype=tf.float32), 
+                                                                                 tf.TensorSpec(shape=(None, self.__y_train.shape[1]), dtype=tf.float32)))
+        data_train = data_train.map(lambda x_i, y_i: (x_i * scale_x + min_x, y_i * scale_y + min_y), 
+                                    num_parallel_calls=tf.data.AUTOTUNE).unbatch().shuffle(CONST_CHUNK_SIZE).batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+        if self.__in_memory == True:
+            data_validation = (self.__x_validation_scaled, self.__y_validation_scaled)
+        else:
+            data_validation = self.__Get_Dataset(self.__x_validation, self.__y_validation, batch_size, False, 0)
+
+        self.__train_data = self.__model.fit(data_train, epochs=epochs, steps_per_epoch=steps_per_epoch, verbose=1, 
+                                             validation_data=data_validation, callbacks=self.__Get_Callbacks(early_stopping_patience, reduce_lr_patience))
 
         # Release GPU resources when the training process is already complete.
         self.__Release()
@@ -209,27 +516,80 @@ class FCNN_Predictor_Cls(object):
         Args:
             (1) scaler_x_file_path [string]: The specified path to the file of the input data scaler.
             (2) scaler_y_file_path [string]: The specified path to the file of the output data scaler.
+                                             Note:
+                                                For a model with the scalers folded into the Dense layers (see the 
+                                                Export() function), the paths to the scalers are set to None.
             (3) model_file_path [string]: The specified path to the file of the trained model.
+            (4) low_latency [bool]: Information about whether the single-sample prediction should use the low-latency 
+                                    mode.
+                                    Note:
+                                        In the low-latency mode, the network together with the scaler arithmetic 
+                                        is traced once into a graph with a fixed input signature (1xm), which 
+                                        avoids the per-call overhead of the model.predict() function.
 
         Example:
             Initialization:
                 # Initialization of the class.
                 Cls = FCNN_Predictor_Cls('../..', '../..', 
-                                         '../..')
+                                         '../..', low_latency=False)
 
             Features:
                 # Functions of the class.
                 Cls.Predict([p(x, y), cfg])
+                Cls.Predict_Batch([[p(x, y), cfg], ..], batch_size=4096)
+                Cls.Predict_Batch_Refined([[p(x, y), cfg], ..], Robot_Str, num_of_iterations=3, batch_size=4096)
+                Cls.Get_Num_Of_FLOPs()
+                Cls.Export('../..', format='npz', fold_scalers=False, sparsity=0.0, quantize=False)
     """
         
-    def __init__(self, scaler_x_file_path: str, scaler_y_file_path: str, model_file_path: str) -> None:
+    def __init__(self, scaler_x_file_path: tp.Optional[str], scaler_y_file_path: tp.Optional[str], model_file_path: str, 
+                 low_latency: bool = False) -> None:
         # Load the scaler parameter for input/output data.
-        self.__scaler_x = joblib.load(scaler_x_file_path)
-        self.__scaler_y = joblib.load(scaler_y_file_path)
+        #   Note:
+        #       The scalers are not used if they are folded into the model.
+        self.__scaler_x = joblib.load(scaler_x_file_path) if scaler_x_file_path != None else None
+        self.__scaler_y = joblib.load(scaler_y_file_path) if scaler_y_file_path != None else None
 
         # Load the trained model from the folder.
         self.__model = tf.keras.models.load_model(model_file_path)
 
+        # Trace the graph of the low-latency mode.
+        self.__low_latency = low_latency
+        if self.__low_latency == True:
+            self.__predict_function = self.__Get_Low_Latency_Function()
+
+    def __Get_Low_Latency_Function(self) -> tp.Callable[[tf.Tensor], tf.Tensor]:
+        """
+        Description:
+            A function to obtain the concrete (pre-traced) function of the model for a single sample 
+            with the scaler arithmetic fused in.
+
+            Note:
+                The min-max scaler is an affine map:
+                    x_{scaled} = x * scale_x + min_x; y = (y_{scaled} - min_y) / scale_y
+
+        Returns:
+            (1) parameter [tf.types.experimental.ConcreteFunction]: Concrete function with the fixed input signature 
+                                                                    (1xm) that returns the unscaled output data.
+        """
+
+        model = self.__model
+        if self.__scaler_x == None:
+            # The scalers are already folded into the model.
+            @tf.function(input_signature=[tf.TensorSpec(shape=(1, model.input_shape[1]), dtype=tf.float32)])
+            def Predict_Function(x: tf.Tensor) -> tf.Tensor:
+                return model(x, training=False)
+        else:
+            # Express the parameters of the scalers as constants.
+            scale_x = tf.constant(self.__scaler_x.scale_, dtype=tf.float32); min_x = tf.constant(self.__scaler_x.min_, dtype=tf.float32)
+            scale_y = tf.constant(self.__scaler_y.scale_, dtype=tf.float32); min_y = tf.constant(self.__scaler_y.min_, dtype=tf.float32)
+
+            @tf.function(input_signature=[tf.TensorSpec(shape=(1, model.input_shape[1]), dtype=tf.float32)])
+            def Predict_Function(x: tf.Tensor) -> tf.Tensor:
+                return (model(x * scale_x + min_x, training=False) - min_y) / scale_y
+
+        return Predict_Function.get_concrete_function()
+
     def Predict(self, x: tp.List[tp.Union[float, int]]) -> tp.List[float]:
         """
         Description:
@@ -246,6 +606,14 @@ class FCNN_Predictor_Cls(object):
                                                     Where m is the number of joints.
         """
 
+        if self.__low_latency == True:
+            # Generates output predictions using the pre-traced function with the fused scaler arithmetic.
+            return self.__predict_function(tf.constant(x.reshape(1, x.shape[0]), dtype=tf.float32)).numpy()
+
+        if self.__scaler_x == None:
+            # Generates output predictions directly from the input data (folded scalers).
+            return self.__model.predict(x.reshape(1, x.shape[0]))
+
         # Transform of data using the scale parameter.
         x_transfored = Utilities.Transform_Data_With_Scaler(self.__scaler_x, x.reshape(1, x.shape[0]))
 
@@ -254,6 +622,344 @@ class FCNN_Predictor_Cls(object):
 
         return Utilities.Inverse_Data_With_Scaler(self.__scaler_y, y.reshape(1, y.shape[1]))
 
+    def Predict_Batch(self, x: tp.List[tp.List[tp.Union[float, int]]], batch_size: int = 4096) -> tp.List[tp.List[float]]:
+        """
+        Description:
+            A function to predict the absolute joint positions of the robotic arm from a set of input
+            positions of the end-effector and configurations of the solution.
+
+            Note:
+                The data are scaled, inferred and unscaled in one pass, so the cost depends on the number
+                of data and not on the number of function calls.
+
+        Args:
+            (1) x [Matrix<[float, int]> nxk]: Input data defined as coordinates of the x-axis, y-axis (in meters)
+                                              and the configuration of the solution.
+                                                Note:
+                                                    Where n is the number of data and k is the number of input parameters.
+            (2) batch_size [int]: The number of samples processed by the model at once.
+
+        Returns:
+            (1) parameter [Matrix<float> nxm]: Output data defined as absolute joint positions of the robotic arm.
+                                                Note:
+                                                    Where m is the number of joints.
+        """
+
+        x = np.asarray(x, dtype=np.float32).reshape(-1, self.__model.input_shape[1])
+
+        if self.__scaler_x == None:
+            # Generates output predictions directly from the input data (folded scalers).
+            return self.__model.predict(x, batch_size=batch_size, verbose=0)
+
+        # Transform of data using the scale parameter.
+        x_transfored = Utilities.Transform_Data_With_Scaler(self.__scaler_x, x)
+
+        # Generates output predictions from input transformed data.
+        y = self.__model.predict(x_transfored, batch_size=batch_size, verbose=0)
+
+        return Utilities.Inverse_Data_With_Scaler(self.__scaler_y, y)
+
+    def Predict_Batch_Refined(self, x: tp.List[tp.List[tp.Union[float, int]]], Robot_Parameters_Str: Parameters.Robot, 
+                              num_of_iterations: int = 3, batch_size: int = 4096) -> tp.List[tp.List[float]]:
+        """
+        Description:
+            A function to predict the absolute joint positions of the robotic arm from a set of input positions 
+            of the end-effector and configurations of the solution, and to refine the predictions using 
+            a fixed number of Newton iterations (hybrid solver).
+
+            Note:
+                The prediction of the network is used as the initial guess. The refinement does not flip the solution 
+                out of the desired configuration, see the function below:
+                    ../Kinematics/Core.py -> Inverse_Kinematics_Refine_Batch(..)
+
+        Args:
+            (1) x [Matrix<[float, int]> nxk]: Input data defined as coordinates of the x-axis, y-axis (in meters)
+                                              and the configuration of the solution.
+                                                Note:
+                                                    Where n is the number of data and k is the number of input parameters.
+            (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+            (3) num_of_iterations [int]: The number of Newton iterations.
+            (4) batch_size [int]: The number of samples processed by the model at once.
+
+        Returns:
+            (1) parameter [Matrix<float> nxm]: Output data defined as absolute joint positions of the robotic arm.
+                                                Note:
+                                                    Where m is the number of joints.
+        """
+
+        x = np.asarray(x, dtype=np.float32).reshape(-1, self.__model.input_shape[1])
+
+        return Kinematics.Core.Inverse_Kinematics_Refine_Batch(x[:, 0:2], self.Predict_Batch(x, batch_size), Robot_Parameters_Str, 
+                                                               num_of_iterations, cfg=x[:, 2].astype(np.int64))[1]
+
+    def Get_Num_Of_FLOPs(self) -> int:
+        """
+        Description:
+            A function to obtain the number of floating-point operations (FLOPs) of the single-sample prediction.
+
+            Note:
+                Each Dense layer (m inputs, k units) requires m*k multiplications and m*k additions, plus k additions 
+                of the bias. The activation functions, the Dropout layers and the scaler arithmetic are not counted.
+
+        Returns:
+            (1) parameter [int]: The number of FLOPs per sample.
+        """
+
+        num_of_flops = 0
+        for _, layer_i in enumerate(self.__model.layers):
+            if isinstance(layer_i, tf.keras.layers.Dense):
+                m, k = layer_i.kernel.shape
+                num_of_flops += 2 * int(m) * int(k) + (int(k) if layer_i.use_bias == True else 0)
+
+        return num_of_flops
+
+    def Export(self, file_path: str, format: str, fold_scalers: bool, sparsity: float = 0.0, quantize: bool = False) -> None:
+        """
+        Description:
+            A function to export the trained model.
+
+            Note 1:
+                The Numpy archive (*.npz) contains the weights/biases of the individual Dense layers, their activation 
+                functions and the parameters of the input/output min-max scalers. The archive can be loaded without 
+                the Tensorflow library, see the class below:
+                    ../FCNN_IK/Inference.py -> FCNN_Numpy_Predictor_Cls
+
+            Note 2:
+                The Dropout layers are omitted, because they do not affect the inference.
+
+            Note 3:
+                If the scalers are folded, the input scaler is folded into the first Dense layer and the inverse of 
+                the output scaler into the last Dense layer. The exported model then maps the raw input data 
+                (coordinates, configuration) directly to the absolute joint positions, and the scaler files 
+                (*_Scaler_x.pkl, *_Scaler_y.pkl) are not needed anymore. The scalers can only be folded if the last 
+                Dense layer has a linear activation function.
+
+            Note 4:
+                The Numpy archive can be compressed after the training: the magnitude pruning sets the given fraction 
+                of the smallest weights of each Dense layer to zero and the int8 quantization stores the weights 
+                as 8-bit integers with the float32 scale of each output. The compressed archive is saved using 
+                the deflate compression, so the pruned weights reduce the size of the file as well. The weights 
+                are dequantized when they are loaded by the FCNN_Numpy_Predictor_Cls class.
+
+        Args:
+            (1) file_path [string]: The specified path of the file without extension (format).
+            (2) format [string]: The format of the exported file.
+                                 Note:
+                                    'npz' : Numpy archive; 'h5' : Keras model (HDF5)
+            (3) fold_scalers [bool]: Information about whether the scalers should be folded into the model.
+            (4) sparsity [float]: The fraction of the weights to be pruned, in the range <0.0, 1.0). Only for the 'npz' format.
+            (5) quantize [bool]: Information about whether the weights should be quantized to int8. Only for the 'npz' format.
+        """
+
+        # The activation function of the last Dense layer.
+        activation_out = [layer_i for layer_i in self.__model.layers if isinstance(layer_i, tf.keras.layers.Dense)][-1].get_config()['activation']
+
+        try:
+            assert format in ['npz', 'h5'] and (fold_scalers == False or self.__scaler_x != None)
+            assert 0.0 <= sparsity < 1.0 and (format == 'npz' or (sparsity == 0.0 and quantize == False))
+            assert fold_scalers == False or activation_out == 'linear'
+
+            # Parameters of the individual Dense layers.
+            W = []; b = []; activation = []
+            for _, layer_i in enumerate(self.__model.layers):
+                if isinstance(layer_i, tf.keras.layers.Dense):
+                    W.append(layer_i.kernel.numpy().astype(np.float32))
+                    b.append(layer_i.bias.numpy().astype(np.float32) if layer_i.use_bias == True else np.zeros(W[-1].shape[1], dtype=np.float32))
+                    activation.append(layer_i.get_config()['activation'])
+
+            # Fold the scalers into the first and the last Dense layer.
+            if fold_scalers == True:
+                W, b = Utilities.Fold_Scalers(self.__scaler_x, self.__scaler_y, W, b)
+
+            # Compression of the weights: magnitude pruning and int8 quantization.
+            if sparsity > 0.0:
+                W = Utilities.Prune_Weights(W, sparsity)
+            if quantize == True:
+                W, W_scale = Utilities.Quantize_Weights(W)
+
+            if format == 'npz':
+                data = {'activation': np.array(activation)}
+                for i, (W_i, b_i) in enumerate(zip(W, b)):
+                    data[f'W_{i}'] = W_i; data[f'b_{i}'] = b_i
+                    if quantize == True:
+                        data[f'W_{i}_scale'] = W_scale[i]
+
+                # Parameters of the min-max scalers.
+                #   x_{scaled} = x * scale + min
+                if fold_scalers == False and self.__scaler_x != None:
+                    data['scale_x'] = self.__scaler_x.scale_.astype(np.float32); data['min_x'] = self.__scaler_x.min_.astype(np.float32)
+                    data['scale_y'] = self.__scaler_y.scale_.astype(np.float32); data['min_y'] = self.__scaler_y.min_.astype(np.float32)
+
+                # Save the data to the file (*.npz).
+                if sparsity > 0.0 or quantize == True:
+                    np.savez_compressed(f'{file_path}.npz', **data)
+                else:
+                    np.savez(f'{file_path}.npz', **data)
+            else:
+                # Copy the architecture of the model. The folded biases are generally non-zero, so all 
+                # Dense layers use the bias.
+                model = tf.keras.models.clone_model(self.__model, clone_function=lambda layer: layer.__class__.from_config({**layer.get_config(), 'use_bias': True}) 
+                                                                                              if isinstance(layer, tf.keras.layers.Dense) else layer.__class__.from_config(layer.get_config()))
+                for _, (layer_i, W_i, b_i) in enumerate(zip([layer_i for layer_i in model.layers if isinstance(layer_i, tf.keras.layers.Dense)], W, b)):
+                    layer_i.set_weights([W_i, b_i])
+
+                # Save the model to the file (*.h5).
+                model.save(f'{file_path}.h5', include_optimizer=False)
+
+            print(f'[INFO] The model has been successfully exported.')
+            print(f'[INFO] >> file_path = {file_path}.{format}')
+
+        except AssertionError as error:
+            print(f'[ERROR] Information: {error}')
+            if format not in ['npz', 'h5']:
+                print(f'[ERROR] Incorrectly selected format. The format must be \'npz\' or \'h5\' and not \'{format}\'.')
+            if fold_scalers == True and self.__scaler_x == None:
+                print(f'[ERROR] The scalers of the model have already been folded.')
+            if fold_scalers == True and activation_out != 'linear':
+                print(f'[ERROR] The output scaler can only be folded into the last Dense layer with the linear activation function and not \'{activation_out}\'.')
+            if sparsity < 0.0 or sparsity >= 1.0:
+                print(f'[ERROR] Incorrectly selected sparsity. The sparsity must be in the range <0.0, 1.0) and not {sparsity}.')
+            if format != 'npz' and (sparsity > 0.0 or quantize == True):
+                print(f'[ERROR] The pruning and the quantization are only supported by the \'npz\' format.')
+
+class Position_Error_Callback_Cls(tf.keras.callbacks.Callback):
+    """
+    Description:
+        A specific class of the callback, which adds the position error of the end-effector on the validation data 
+        ('val_position_error') and the penalized position error ('val_cost') to the logs at the end of each epoch.
+
+        Note 1:
+            The predicted joint positions are unscaled and converted to the end-effector position using Forward 
+            Kinematics (FK). The error is the Euclidean distance to the desired position (input of the model).
+
+        Note 2:
+            The latency is measured for the single-sample prediction of the Dense layers in Numpy (the same way as 
+            FCNN_Numpy_Predictor_Cls), so it only depends on the architecture of the model.
+
+        Note 3:
+            The callback must be placed before the other callbacks that read the logs.
+
+    Initialization of the Class:
+        Args:
+            (1) x [Vector<[float, int]> nxm]: Input (unscaled) validation data.
+            (2) x_scaled [Vector<float> nxm]: Input (scaled) validation data.
+            (3) scaler_y [sklearn.preprocessing.MinMaxScaler(object)]: The scaler of the output data.
+            (4) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+            (5) penalty [Dictionary {'latency': float, 'num_of_parameters': float}]: The relative penalties of the latency 
+                                                                                     and the number of parameters.
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = Position_Error_Callback_Cls(x, x_scaled, scaler_y, Robot_Str, CONST_PENALTY)
+
+            Features:
+                # Pass the callback to the training.
+                model.fit(.., callbacks=[Cls])
+    """
+
+    def __init__(self, x: tp.List[tp.Union[float, int]], x_scaled: tp.List[float], scaler_y: tp.Any, 
+                 Robot_Parameters_Str: Parameters.Robot, penalty: tp.Dict) -> None:
+        super().__init__()
+
+        self.__x = x; self.__x_scaled = x_scaled
+        self.__scaler_y = scaler_y
+        self.__Robot_Parameters_Str = Robot_Parameters_Str
+        self.__penalty = penalty
+
+        # The latency of the model architecture in milliseconds.
+        self.__latency = None
+
+    def __Measure_Latency(self, num_of_repetitions: int = 100) -> float:
+        """
+        Description:
+            A function to measure the latency of the single-sample prediction of the Dense layers.
+
+        Args:
+            (1) num_of_repetitions [int]: The number of repetitions of the measurement.
+
+        Returns:
+            (1) parameter [float]: Median of the latency in milliseconds.
+        """
+
+        layers = [(layer_i.kernel.numpy(), layer_i.bias.numpy() if layer_i.use_bias == True else 0.0, Inference.CONST_ACTIVATION[layer_i.get_config()['activation']]) 
+                  for _, layer_i in enumerate(self.model.layers) if isinstance(layer_i, tf.keras.layers.Dense)]
+        x = np.asarray(self.__x_scaled[0:1], dtype=np.float32)
+
+        t = np.zeros(num_of_repetitions, dtype=np.float64)
+        for i in range(num_of_repetitions):
+            t_0 = time.perf_counter()
+            y = x
+            for _, (W_i, b_i, activation_i) in enumerate(layers):
+                y = activation_i(y @ W_i + b_i)
+            t[i] = (time.perf_counter() - t_0) * 1e3
+
+        return np.median(t)
+
+    def on_epoch_end(self, epoch: int, logs: tp.Optional[tp.Dict] = None) -> None:
+        if logs == None:
+            return
+
+        # Predict the joint positions and calculate the end-effector positions using Forward Kinematics.
+        theta = Utilities.Inverse_Data_With_Scaler(self.__scaler_y, self.model.predict(self.__x_scaled, batch_size=4096, verbose=0))
+        _, p = Kinematics.Core.Forward_Kinematics_Batch(theta, self.__Robot_Parameters_Str)
+
+        # Mean Euclidean error of the end-effector position.
+        logs['val_position_error'] = float(np.mean(np.linalg.norm(p - self.__x[:, 0:p.shape[1]], axis=1)))
+
+        # Penalized position error.
+        if self.__latency == None:
+            self.__latency = self.__Measure_Latency()
+        logs['val_cost'] = logs['val_position_error'] * (1.0 + self.__penalty['latency'] * self.__latency 
+                                                         + self.__penalty['num_of_parameters'] * self.model.count_params())
+
+class Warm_Start_Oracle_Cls(kt.oracles.BayesianOptimizationOracle):
+    """
+    Description:
+        A specific class of the Bayesian optimization oracle, which first proposes the queued configurations 
+        of the hyperparameters (e.g. the best configurations from another optimization) and then continues 
+        with the standard Bayesian optimization.
+
+        Note:
+            The configurations that have already been tried (e.g. in the resumed optimization) are skipped.
+
+    Initialization of the Class:
+        Args:
+            (1) hyperparameters_queue [Vector<Dictionary {'name': value, ..}>]: The configurations of the hyperparameters 
+                                                                                to be tried first.
+            (2) **kwargs [Dictionary]: The arguments of the Bayesian optimization oracle, 
+                                       see kt.oracles.BayesianOptimizationOracle(..).
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = Warm_Start_Oracle_Cls([{'use_bias': True, ..}, ..], objective=kt.Objective(..), max_trials=100)
+    """
+
+    def __init__(self, hyperparameters_queue: tp.List[tp.Dict], **kwargs) -> None:
+        super().__init__(**kwargs)
+
+        self.__hyperparameters_queue = list(hyperparameters_queue)
+
+    def populate_space(self, trial_id: str) -> tp.Dict:
+        """
+        Description:
+            A function to fill the hyperparameter space with the values of the next trial.
+
+        Args:
+            (1) trial_id [string]: Identification of the trial.
+
+        Returns:
+            (1) parameter [Dictionary {'status': string, 'values': Dictionary}]: The status of the trial and the values of the hyperparameters.
+        """
+
+        while self.__hyperparameters_queue:
+            values = self.__hyperparameters_queue.pop(0)
+            if self._duplicate(values) == False:
+                return {'status': kt.engine.trial.TrialStatus.RUNNING, 'values': values}
+
+        return super().populate_space(trial_id)
+
 class FCNN_Optimizer_Cls(object):
     """
     Description:
@@ -285,6 +991,12 @@ class FCNN_Optimizer_Cls(object):
             (3) train_size [float]: The size of the training partition.
             (4) test_size [float]: The size of the validation partition.
             (5) file_path [string]: The specified path of the file without extension (format).
+            (6) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+                                                                     Note:
+                                                                        Required by the objectives based on the position error.
+            (7) objective [string]: The objective of the search, see CONST_OBJECTIVES.
+            (8) penalty [Dictionary {'latency': float, 'num_of_parameters': float}]: The relative penalties of the multi-objective 
+                                                                                     search ('val_cost'), see CONST_PENALTY.
 
         Example:
             Initialization:
@@ -295,17 +1007,23 @@ class FCNN_Optimizer_Cls(object):
 
                 # Initialization of the class.
                 Cls = FCNN_Optimizer_Cls(x=x_in, y=y_out, train_size=0.8, test_size=0.2,
-                                         '../..')
+                                         '../..', Robot_Str, objective='val_position_error', 
+                                         penalty=CONST_PENALTY)
             Features:
                 # Functions of the class.
                 Cls.Optimize(num_of_trials=100, epochs_per_trial=100, batch_size=64, 
-                             save_results=True)
+                             save_results=True, num_of_workers=1, resume=False, warm_start_file_path=None,
+                             num_of_warm_start_trials=10, strategy='bayesian')
+                Cls.Search(num_of_trials=100, epochs_per_trial=100, batch_size=64, hyperparameters_queue=[], 
+                           strategy='bayesian')
     """
         
     def __init__(self, x: tp.List[tp.Union[float, int]], y: tp.List[float], train_size: float, test_size: float,
-                 file_path: str) -> None:
+                 file_path: str, Robot_Parameters_Str: tp.Optional[Parameters.Robot] = None, objective: str = 'val_loss', 
+                 penalty: tp.Dict = CONST_PENALTY) -> None:
         try:
             assert (train_size + test_size) == 1.0 and test_size > 0.0
+            assert objective in CONST_OBJECTIVES and (objective in ['val_loss', 'val_mae'] or Robot_Parameters_Str != None)
 
             # Split the data from the dataset (x, y) into random train and validation subsets.
             self.__x_train, self.__x_validation, self.__y_train, self.__y_validation = sklearn.model_selection.train_test_split(x, y, 
@@ -319,6 +1037,13 @@ class FCNN_Optimizer_Cls(object):
             # The file path to save the data.
             self.__file_path = file_path
 
+            # The objective function of the optimization.
+            #   Note:
+            #       The error of the regression is minimized.
+            self.__objective = kt.Objective(name=objective, direction='min')
+            self.__Robot_Parameters_Str = Robot_Parameters_Str
+            self.__penalty = penalty
+
             # Set whether memory growth should be enabled.
             gpu_arr = tf.config.experimental.list_physical_devices('GPU')
             if gpu_arr:
@@ -337,6 +1062,10 @@ class FCNN_Optimizer_Cls(object):
                 print(f'[ERROR] Incorrectly selected test and training set size. The sum of the set sizes must equal 1.0 and not {(train_size + test_size)}.')
             if test_size <= 0.0:
                 print(f'[ERROR] Incorrectly selected test set size. The size of the validation partition (test_size) must be greater than 0.0.')
+            if objective not in CONST_OBJECTIVES:
+                print(f'[ERROR] Incorrect objective of the search. The objective must be one of {CONST_OBJECTIVES}.')
+            elif Robot_Parameters_Str == None:
+                print(f'[ERROR] The objective \'{objective}\' requires the structure of the main parameters of the robot.')
 
     def __Release(self) -> None:
         """
@@ -362,13 +1091,81 @@ class FCNN_Optimizer_Cls(object):
             os.remove(file_name)
 
         # Write the results obtained from the optimizer.
+        #   Note:
+        #       The internal parameters of the tuner ('tuner/epochs', etc.) are not written.
         with open(file_name, 'w') as f:
             for _, (key, value) in enumerate(parameters.items()):
-                f.write(f'{key}: {value}\n')
+                if key.startswith('tuner/') == False:
+                    f.write(f'{key}: {value}\n')
 
         print(f'[INFO] The results obtained from the optimizer were successfully saved.')
         print(f'[INFO] >> file_path = {file_name}')
 
+    def __Get_Num_Of_Epochs(self, optimizer: kt.Tuner, epochs_per_trial: int) -> tp.Tuple[int, int]:
+        """
+        Description:
+            A function to obtain the total number of epochs consumed by the search and the number of epochs, which would 
+            be consumed by the Bayesian optimization (baseline) to train the same configurations of the hyperparameters.
+
+        Args:
+            (1) optimizer [kt.Tuner(object)]: The tuner (optimizer) containing the results of the trials.
+            (2) epochs_per_trial [int]: The number of epochs (iterations) to train the model per trial.
+
+        Returns:
+            (1) parameter [int]: The number of epochs consumed by the search.
+            (2) parameter [int]: The number of epochs consumed by the baseline.
+        """
+
+        num_of_epochs = 0; num_of_configurations = 0
+        for _, trial_i in enumerate(optimizer.oracle.trials.values()):
+            if trial_i.status != kt.engine.trial.TrialStatus.COMPLETED:
+                continue
+
+            values = trial_i.hyperparameters.values
+            if 'tuner/epochs' in values:
+                # The trial trained by the successive halving continues from the epoch 'tuner/initial_epoch'.
+                num_of_epochs += values['tuner/epochs'] - values['tuner/initial_epoch']
+                if 'tuner/trial_id' not in values:
+                    num_of_configurations += 1
+            else:
+                num_of_epochs += epochs_per_trial; num_of_configurations += 1
+
+        return (num_of_epochs, num_of_configurations * epochs_per_trial)
+
+    def __Load_Best_Hyperparameters(self, file_path: str, num_of_trials: int) -> tp.List[tp.Dict]:
+        """
+        Description:
+            A function to load the best configurations of the hyperparameters from the completed trials 
+            of another optimization.
+
+        Args:
+            (1) file_path [string]: The specified path of the file without extension (format) of another optimization.
+            (2) num_of_trials [int]: The maximum number of configurations to be loaded.
+
+        Returns:
+            (1) parameter [Vector<Dictionary {'name': value, ..}>]: The configurations of the hyperparameters sorted 
+                                                                    from the best one.
+        """
+
+        directory_path = f'{file_path}_Optimizer/FCNN_Inverse_Kinematics'
+        if os.path.isdir(directory_path) == False:
+            print(f'[WARNING] The optimization to warm start from does not exist: {directory_path}')
+            return []
+
+        # Load the completed trials of the optimization.
+        trials = []
+        for _, folder_i in enumerate(sorted(os.listdir(directory_path))):
+            file_name = f'{directory_path}/{folder_i}/trial.json'
+            if folder_i.startswith('trial_') and os.path.isfile(file_name):
+                trial = kt.engine.trial.Trial.load(file_name)
+                if trial.status == kt.engine.trial.TrialStatus.COMPLETED and trial.score != None:
+                    trials.append(trial)
+
+        # Sort the trials from the best one, given by the direction of the objective function.
+        trials.sort(key=lambda trial: trial.score, reverse=(self.__objective.direction == 'max'))
+
+        return [trial_i.hyperparameters.values for _, trial_i in enumerate(trials[0:num_of_trials])]
+
     def __Compile(self, Hyperparameters: kt.engine.hyperparameters.hyperparameters.HyperParameters) -> tf.keras.Sequential:
         """
         Description:
@@ -412,37 +1209,178 @@ class FCNN_Optimizer_Cls(object):
 
         # Finally, compile the model.
         model.compile(optimizer=tf.keras.optimizers.Adam(learning_rate=Hyperparameters.Choice('learning_rate', values=[1e-2, 1e-3])), loss='mse', 
-                      metrics=['accuracy'])
+                      metrics=['mae'])
         
         return model
 
-    def Optimize(self, num_of_trials: int, epochs_per_trial: int, batch_size: int, save_results: bool) -> None:
+    def Search(self, num_of_trials: int, epochs_per_trial: int, batch_size: int, 
+               hyperparameters_queue: tp.Optional[tp.List[tp.Dict]] = None, strategy: str = 'bayesian') -> kt.Tuner:
+        """
+        Description:
+            A function to search for the most suitable hyperparameters of the Fully-Connected Neural Network (FCNN) model.
+
+            Note 1:
+                In the parallel search, the role of the process (chief/worker) is given by the environment variables 
+                KERASTUNER_TUNER_ID, KERASTUNER_ORACLE_IP and KERASTUNER_ORACLE_PORT. The chief process only distributes 
+                the trials to the worker processes and blocks until all the trials are finished.
+
+            Note 2:
+                The completed trials found in the directory of the optimization are reused, so the interrupted search 
+                continues from the last completed trial. The number of trials includes the reused ones.
+
+            Note 3:
+                The Hyperband strategy trains the trials in rounds (successive halving) with the increasing number of epochs 
+                up to the 'epochs_per_trial' and only the best trials of each round are trained further. The number 
+                of trials is given by the number of epochs and the factor CONST_HYPERBAND_FACTOR, so the parameters 
+                'num_of_trials' and 'hyperparameters_queue' are not used.
+
+        Args:
+            (1) num_of_trials [int]: The number of trials to be used in hyperparameter optimization.
+            (2) epochs_per_trial [int]: The number of epochs (iterations) to train the model per trial.
+            (3) batch_size [int]: The number of samples processed before the model is updated.
+            (4) hyperparameters_queue [Vector<Dictionary {'name': value, ..}>]: The configurations of the hyperparameters 
+                                                                                to be tried first (warm start). If the parameter 
+                                                                                is not defined, no configuration is queued.
+            (5) strategy [string]: The strategy of the search. 
+                                    Note:
+                                        strategy = 'bayesian' or 'hyperband', see CONST_SEARCH_STRATEGIES.
+
+        Returns:
+            (1) parameter [kt.Tuner(object)]: The tuner (optimizer) containing the results of the trials.
+        """
+
+        hyperparameters_queue = list(hyperparameters_queue) if hyperparameters_queue != None else []
+
+        if strategy == 'hyperband':
+            # Hyperband optimization (successive halving) over the desired hyperparameters.
+            optimizer = kt.Hyperband(hypermodel=self.__Compile, objective=self.__objective, max_epochs=epochs_per_trial, 
+                                     factor=CONST_HYPERBAND_FACTOR, directory=f'{self.__file_path}_Optimizer', project_name='FCNN_Inverse_Kinematics', 
+                                     overwrite=False)
+        else:
+            # Bayesian optimization with Gaussian process over the desired hyperparameters.
+            optimizer = kt.Tuner(oracle=Warm_Start_Oracle_Cls(hyperparameters_queue, objective=self.__objective, max_trials=num_of_trials), 
+                                 hypermodel=self.__Compile, directory=f'{self.__file_path}_Optimizer', project_name='FCNN_Inverse_Kinematics', 
+                                 overwrite=False)
+        
+        # The position error of the end-effector is evaluated only if it is required by the objective.
+        if self.__objective.name in ['val_position_error', 'val_cost']:
+            callbacks = [Position_Error_Callback_Cls(self.__x_validation, self.__x_validation_scaled, self.__scaler_y, 
+                                                     self.__Robot_Parameters_Str, self.__penalty)]
+        else:
+            callbacks = []
+
+        # Start the search for the most suitable model.
+        optimizer.search(self.__x_train_scaled, self.__y_train_scaled, epochs=epochs_per_trial, batch_size=batch_size, 
+                            validation_data=(self.__x_validation_scaled, self.__y_validation_scaled), callbacks=callbacks)
+
+        return optimizer
+
+    def Optimize(self, num_of_trials: int, epochs_per_trial: int, batch_size: int, save_results: bool, 
+                 num_of_workers: int = 1, resume: bool = False, warm_start_file_path: tp.Optional[str] = None, 
+                 num_of_warm_start_trials: int = 10, strategy: str = 'bayesian') -> None:
         """
         Description:
             A function to optimize the Fully-Connected Neural Network (FCNN) model.
 
+            Note 1:
+                If the number of workers is greater than 1, the trials run concurrently in separate worker processes, 
+                each with its own budget of CPU threads. The current process acts as the chief, which coordinates 
+                the workers (on the same machine, fully offline).
+
+            Note 2:
+                The results of the trials are stored in the folder f'{file_path}_Optimizer'. If the optimization is resumed, 
+                the completed trials are reused and only the remaining trials are run.
+
+            Note 3:
+                The warm start seeds the search with the best configurations of the hyperparameters from another optimization, 
+                e.g. from the optimization with a different dataset or robot. It is only supported by the Bayesian strategy.
+
+            Note 4:
+                The total number of epochs consumed by the search is compared with the number of epochs, which the Bayesian 
+                optimization would need to fully train the same number of configurations of the hyperparameters.
+
         Args:
             (1) num_of_trials [int]: The number of trials to be used in hyperparameter optimization.
             (2) epochs_per_trial [int]: The number of epochs (iterations) to train the model per trial.
             (3) batch_size [int]: The number of samples processed before the model is updated.
             (4) save_results [bool]: Information about whether the optimization results will be saved.
+            (5) num_of_workers [int]: The number of worker processes.
+            (6) resume [bool]: Information about whether the results of the previous (interrupted) optimization will be reused.
+            (7) warm_start_file_path [string]: The specified path of the file without extension (format) of another optimization 
+                                               to warm start from. If None, the warm start is not used.
+            (8) num_of_warm_start_trials [int]: The number of the best configurations taken from another optimization.
+            (9) strategy [string]: The strategy of the search. 
+                                    Note:
+                                        strategy = 'bayesian' or 'hyperband', see CONST_SEARCH_STRATEGIES.
         """
 
-        # Remove the unnecessary directory.
-        directory_path = f'{CONST_PROJECT_FOLDER}/src/Training/FCNN_Inverse_Kinematics_Optimizer'
-        if os.path.isdir(directory_path):
+        try:
+            assert strategy in CONST_SEARCH_STRATEGIES
+
+        except AssertionError as error:
+            print(f'[ERROR] Information: {error}')
+            print(f'[ERROR] Incorrect strategy of the search. The strategy must be one of {CONST_SEARCH_STRATEGIES}.')
+            return
+
+        # Remove the results of the previous optimization.
+        directory_path = f'{self.__file_path}_Optimizer'
+        if resume == False and os.path.isdir(directory_path):
             shutil.rmtree(directory_path)
 
-        # Bayesian optimization with Gaussian process over the desired hyperparameters.
-        optimizer = kt.BayesianOptimization(hypermodel=self.__Compile, objective=kt.Objective(name='val_accuracy', direction='max'), 
-                                            max_trials=num_of_trials, directory='FCNN_Inverse_Kinematics_Optimizer', project_name='FCNN_Inverse_Kinematics')
-        
-        # Start the search for the most suitable model.
-        optimizer.search(self.__x_train_scaled, self.__y_train_scaled, epochs=epochs_per_trial, batch_size=batch_size, 
-                            validation_data=(self.__x_validation_scaled, self.__y_validation_scaled))
+        # Load the best configurations of the hyperparameters from another optimization.
+        if warm_start_file_path != None and strategy == 'bayesian':
+            hyperparameters_queue = self.__Load_Best_Hyperparameters(warm_start_file_path, num_of_warm_start_trials)
+            print(f'[INFO] The number of configurations to warm start from: {len(hyperparameters_queue)}')
+        else:
+            if warm_start_file_path != None:
+                print(f'[WARNING] The warm start is not supported by the strategy \'{strategy}\'.')
+            hyperparameters_queue = []
+
+        if num_of_workers > 1:
+            # Find a free port for the chief process.
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                s.bind((CONST_ORACLE_IP, 0)); oracle_port = s.getsockname()[1]
+
+            # The number of CPU threads of each worker.
+            num_of_threads = max(1, (os.cpu_count() or 1) // num_of_workers)
+
+            # Start the worker processes.
+            #   Note:
+            #       The processes are spawned, because Tensorflow is not fork-safe.
+            context = multiprocessing.get_context('spawn')
+            workers = [context.Process(target=Run_Search_Worker, args=(self, f'tuner{i}', oracle_port, num_of_threads, num_of_trials, 
+                                                                       epochs_per_trial, batch_size, strategy)) for i in range(num_of_workers)]
+            for _, worker_i in enumerate(workers):
+                worker_i.start()
+
+            # Run the chief process.
+            environment = {key_i: os.environ.get(key_i) for key_i in ['KERASTUNER_TUNER_ID', 'KERASTUNER_ORACLE_IP', 'KERASTUNER_ORACLE_PORT']}
+            os.environ.update({'KERASTUNER_TUNER_ID': 'chief', 'KERASTUNER_ORACLE_IP': CONST_ORACLE_IP, 
+                               'KERASTUNER_ORACLE_PORT': str(oracle_port)})
+            try:
+                optimizer = self.Search(num_of_trials, epochs_per_trial, batch_size, hyperparameters_queue, strategy)
+            finally:
+                for _, (key_i, value_i) in enumerate(environment.items()):
+                    if value_i == None:
+                        os.environ.pop(key_i, None)
+                    else:
+                        os.environ[key_i] = value_i
+
+                for _, worker_i in enumerate(workers):
+                    worker_i.join()
+        else:
+            optimizer = self.Search(num_of_trials, epochs_per_trial, batch_size, hyperparameters_queue, strategy)
         
+        # Compare the compute consumed by the search with the Bayesian baseline.
+        num_of_epochs, num_of_epochs_baseline = self.__Get_Num_Of_Epochs(optimizer, epochs_per_trial)
+        print(f'[INFO] Strategy: {strategy}')
+        print(f'[INFO]  Total number of epochs: {num_of_epochs}')
+        print(f'[INFO]  Total number of epochs (Bayesian baseline): {num_of_epochs_baseline}')
+        if num_of_epochs_baseline > 0:
+            print(f'[INFO]  Compute savings: {(1.0 - num_of_epochs / num_of_epochs_baseline) * 100.0:.02f} %')
+
         # Get the best hyperparameters determined by the objective function.
-        #   objective = 'accuracy/val_accuracy'
+        #   objective = 'val_loss', 'val_mae', 'val_position_error' or 'val_cost'
         best_hps = optimizer.get_best_hyperparameters(num_trials=1)[0]
 
         # Save the results of the best parameters along with the score.
@@ -451,3 +1389,38 @@ class FCNN_Optimizer_Cls(object):
 
         # Release GPU resources when the optimization process is already complete.
         self.__Release()
+
+def Run_Search_Worker(Optimizer_Cls: FCNN_Optimizer_Cls, tuner_id: str, oracle_port: int, num_of_threads: int, num_of_trials: int, 
+                      epochs_per_trial: int, batch_size: int, strategy: str) -> None:
+    """
+    Description:
+        A function to run the worker process of the parallel hyperparameter search. The worker receives the trials 
+        from the chief process and trains the models.
+
+        Note:
+            The function is executed in the worker process, see the function below:
+                FCNN_Optimizer_Cls.Optimize(.., num_of_workers > 1)
+
+    Args:
+        (1) Optimizer_Cls [FCNN_Optimizer_Cls(object)]: The class of the hyperparameter optimization.
+        (2) tuner_id [string]: Identification of the worker.
+        (3) oracle_port [int]: The port of the chief process.
+        (4) num_of_threads [int]: The number of CPU threads of the worker.
+        (5) num_of_trials [int]: The number of trials to be used in hyperparameter optimization.
+        (6) epochs_per_trial [int]: The number of epochs (iterations) to train the model per trial.
+        (7) batch_size [int]: The number of samples processed before the model is updated.
+        (8) strategy [string]: The strategy of the search.
+    """
+
+    # Set the role of the process.
+    os.environ.update({'KERASTUNER_TUNER_ID': tuner_id, 'KERASTUNER_ORACLE_IP': CONST_ORACLE_IP, 
+                       'KERASTUNER_ORACLE_PORT': str(oracle_port)})
+
+    # Set the budget of the CPU threads.
+    tf.config.threading.set_intra_op_parallelism_threads(num_of_threads)
+    tf.config.threading.set_inter_op_parallelism_threads(num_of_threads)
+
+    Optimizer_Cls.Search(num_of_trials, epochs_per_trial, batch_size, strategy=strategy)
+
+    # Release GPU resources when the search is already complete.
+    tf.keras.backend.clear_session()
@@ -1,5 +1,7 @@
 # Typing (Support for type hints)
 import typing as tp
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
 # Sklearn (Simple and efficient tools for predictive 
 # data analysis) [pip3 install scikit-learn]
 import sklearn.preprocessing
@@ -51,4 +53,126 @@ def Inverse_Data_With_Scaler(scaler: sklearn.preprocessing.MinMaxScaler, data: t
         (1) parameter [Vector<float>]: Output inversed (unscaled) data.
     """
 
-    return scaler.inverse_transform(data)
\ No newline at end of file
+    return scaler.inverse_transform(data)
+
+def Fit_Scaler_Partial(range: tp.List[float], data: tp.List[float], chunk_size: int) -> sklearn.preprocessing.MinMaxScaler:
+    """
+    Description:
+        Find the scale parameter from the dataset chunk by chunk, so that the whole dataset does not need 
+        to be loaded into memory (e.g. memory-mapped data).
+
+        Note:
+            The data are not transformed.
+
+    Args:
+        (1) range [Vector<float> 1x2]: Required range of transformed data (min, max).
+        (2) data [Vector<float>]: Input data.
+        (3) chunk_size [int]: The number of data processed at once.
+
+    Returns:
+        (1) parameter [sklearn.preprocessing.MinMaxScaler(object)]: Class of the min-max scaler.
+    """
+
+    scaler = sklearn.preprocessing.MinMaxScaler(feature_range=(range[0], range[1]))
+    for _, i in enumerate(np.arange(0, data.shape[0], chunk_size)):
+        scaler.partial_fit(data[i:i + chunk_size])
+
+    return scaler
+
+def Fold_Scalers(scaler_x: sklearn.preprocessing.MinMaxScaler, scaler_y: sklearn.preprocessing.MinMaxScaler, W: tp.List[tp.List[tp.List[float]]], 
+                 b: tp.List[tp.List[float]]) -> tp.Tuple[tp.List[tp.List[tp.List[float]]], tp.List[tp.List[float]]]:
+    """
+    Description:
+        Fold the input scaler into the first Dense layer and the inverse of the output scaler into the last 
+        Dense layer, so that the network maps the raw (unscaled) input data directly to the output data.
+
+        Note 1:
+            The min-max scaler is an affine map x_{scaled} = x * s + m, so that:
+                First layer: (x * s_x + m_x) @ W + b = x @ (diag(s_x) @ W) + (m_x @ W + b)
+                Last layer:  ((h @ W + b) - m_y) / s_y = h @ (W / s_y) + (b - m_y) / s_y
+
+        Note 2:
+            The last layer must have a linear activation function.
+
+    Args:
+        (1) scaler_x [sklearn.preprocessing.MinMaxScaler(object)]: Class of the min-max scaler of the input data.
+        (2) scaler_y [sklearn.preprocessing.MinMaxScaler(object)]: Class of the min-max scaler of the output data.
+        (3) W [Vector<Matrix<float>> 1xl]: Weights of the individual Dense layers.
+        (4) b [Vector<Vector<float>> 1xl]: Biases of the individual Dense layers.
+                                            Note:
+                                                Where l is the number of Dense layers.
+
+    Returns:
+        (1) parameter 1 [Vector<Matrix<float>> 1xl]: Folded weights of the individual Dense layers.
+        (2) parameter 2 [Vector<Vector<float>> 1xl]: Folded biases of the individual Dense layers.
+    """
+
+    W = list(W); b = list(b)
+
+    # Fold the input scaler into the first layer.
+    b[0]  = (scaler_x.min_ @ W[0] + b[0]).astype(W[0].dtype)
+    W[0]  = (scaler_x.scale_[:, np.newaxis] * W[0]).astype(W[0].dtype)
+
+    # Fold the inverse of the output scaler into the last layer.
+    b[-1] = ((b[-1] - scaler_y.min_) / scaler_y.scale_).astype(W[-1].dtype)
+    W[-1] = (W[-1] / scaler_y.scale_[np.newaxis, :]).astype(W[-1].dtype)
+
+    return (W, b)
+
+def Prune_Weights(W: tp.List[tp.List[tp.List[float]]], sparsity: float) -> tp.List[tp.List[tp.List[float]]]:
+    """
+    Description:
+        Magnitude pruning of the weights. The given fraction of the weights with the smallest absolute value 
+        is set to zero in each Dense layer.
+
+        Note:
+            The biases are not pruned.
+
+    Args:
+        (1) W [Vector<Matrix<float>> 1xl]: Weights of the individual Dense layers.
+                                            Note:
+                                                Where l is the number of Dense layers.
+        (2) sparsity [float]: The fraction of the weights to be set to zero, in the range <0.0, 1.0).
+
+    Returns:
+        (1) parameter [Vector<Matrix<float>> 1xl]: Pruned weights of the individual Dense layers.
+    """
+
+    W_pruned = []
+    for _, W_i in enumerate(W):
+        W_i = W_i.copy(); k = int(sparsity * W_i.size)
+        if k > 0:
+            # Indices of the k weights with the smallest absolute value.
+            W_i.reshape(-1)[np.argpartition(np.abs(W_i).reshape(-1), k - 1)[0:k]] = 0.0
+        W_pruned.append(W_i)
+
+    return W_pruned
+
+def Quantize_Weights(W: tp.List[tp.List[tp.List[float]]]) -> tp.Tuple[tp.List[tp.List[tp.List[int]]], tp.List[tp.List[float]]]:
+    """
+    Description:
+        Symmetric int8 quantization of the weights with the scale of each output (column) of the Dense layer.
+
+        Note:
+            The weights are restored (dequantized) as follows:
+                W = W_{q} * scale
+
+    Args:
+        (1) W [Vector<Matrix<float>> 1xl]: Weights of the individual Dense layers.
+                                            Note:
+                                                Where l is the number of Dense layers.
+
+    Returns:
+        (1) parameter 1 [Vector<Matrix<int8>> 1xl]: Quantized weights of the individual Dense layers.
+        (2) parameter 2 [Vector<Vector<float>> 1xl]: Scales of the individual outputs of the Dense layers.
+    """
+
+    W_q = []; scale = []
+    for _, W_i in enumerate(W):
+        scale_i = (np.max(np.abs(W_i), axis=0) / 127.0).astype(np.float32)
+        #   Note:
+        #       The zero columns (e.g. fully pruned) keep the unit scale.
+        scale_i[scale_i == 0.0] = 1.0
+        W_q.append(np.clip(np.round(W_i / scale_i[np.newaxis, :]), -127, 127).astype(np.int8)); scale.append(scale_i)
+
+    return (W_q, scale)
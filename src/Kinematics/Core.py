@@ -72,6 +72,160 @@ def Forward_Kinematics(theta: tp.List[float], Robot_Parameters_Str: Parameters.R
 
     return (th_limit_err, x)
 
+def __Check_Theta_Limit_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.List[tp.List[bool]]:
+    """
+    Description:
+        Function to check that the desired absolute joint positions are not out of limit. The check
+        is performed over the entire set of joint vectors at once.
+
+    Args:
+        (1) theta [Matrix<float> nxm]: Desired absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors and m is the number of joints.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Matrix<bool> nxm]: The result is a matrix of values with a warning if the limit
+                                          is exceeded.
+                                            Note:
+                                                The value in the matrix is "True" if the desired absolute
+                                                joint position is out of limit, and "False" if it is not.
+    """
+
+    return (theta < Robot_Parameters_Str.Theta.Limit[:, 0]) | (theta > Robot_Parameters_Str.Theta.Limit[:, 1])
+
+def Forward_Kinematics_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.Tuple[tp.List[tp.List[bool]],
+                                                                                                                tp.List[tp.List[float]]]:
+    """
+    Description:
+        Calculation of forward kinematics using the fast method for a set of joint vectors. The function
+        is the batch (vectorized) version of the Forward_Kinematics() function.
+
+        Note:
+            The calculation only works for the RR robotic structure (called SCARA -> simplified version).
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Desired absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Matrix<bool> nx2]: The result is a matrix of values with a warning if the limit
+                                          is exceeded.
+                                            Note:
+                                                The value in the matrix is "True" if the desired absolute
+                                                joint position is out of limit, and "False" if it is not.
+        (2) paramter [Matrix<float> nx2]: The obtained TCP (tool center point) in Cartesian coordinates defined
+                                          as a vector in the x, y axes for each joint vector.
+    """
+
+    theta = np.asarray(theta).reshape(-1, Robot_Parameters_Str.Theta.Zero.size)
+
+    # Check that the desired absolute joint positions are not out of limit.
+    th_limit_err = __Check_Theta_Limit_Batch(theta, Robot_Parameters_Str)
+
+    # Express the absolute positions of the joints.
+    th_0  = Robot_Parameters_Str.DH.Standard[0, 0] + theta[:, 0]
+    th_01 = th_0 + Robot_Parameters_Str.DH.Standard[1, 0] + theta[:, 1]
+
+    # Calculation of forward kinematics using the fast method.
+    x = np.empty(theta.shape, dtype=np.float32)
+    x[:, 0] = Robot_Parameters_Str.DH.Standard[0, 1]*np.cos(th_0) + Robot_Parameters_Str.DH.Standard[1, 1]*np.cos(th_01)
+    x[:, 1] = Robot_Parameters_Str.DH.Standard[0, 1]*np.sin(th_0) + Robot_Parameters_Str.DH.Standard[1, 1]*np.sin(th_01)
+
+    return (th_limit_err, x)
+
+def Get_DH_Parameters(Robot_Parameters_Str: Parameters.Robot) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to obtain the complete table of the standard Denavit-Hartenberg (DH) parameters of the robot.
+
+        Note:
+            The robotic structures defined in the plane (e.g. EPSON_LS3_B401S_Str) only express the columns 
+            theta_zero, a. The missing columns (d, alpha) are equal to zero.
+
+    Args:
+        (1) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Matrix<float> mx4]: The DH parameters (theta_zero, a, d, alpha) of the individual joints.
+                                            Note:
+                                                Where m is the number of joints.
+    """
+
+    DH = np.asarray(Robot_Parameters_Str.DH.Standard, dtype=np.float64).reshape(Robot_Parameters_Str.Theta.Zero.size, -1)
+
+    return np.pad(DH, ((0, 0), (0, 4 - DH.shape[1])))
+
+def __Get_DH_Matrix_Batch(theta: tp.List[float], a: float, d: float, alpha: float) -> tp.List[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A function to obtain the homogeneous transformation matrices of a single joint using the standard 
+        Denavit-Hartenberg (DH) method for a set of joint positions.
+
+            T_{i} = Rot_z(theta_{i}) @ Trans_z(d_{i}) @ Trans_x(a_{i}) @ Rot_x(alpha_{i})
+
+    Args:
+        (1) theta [Vector<float> 1xn]: The joint positions (incl. theta_zero) in radians.
+        (2) a, d, alpha [float]: The DH parameters of the joint.
+
+    Returns:
+        (1) parameter [Tensor<float> nx4x4]: The homogeneous transformation matrices.
+    """
+
+    c_th = np.cos(theta); s_th = np.sin(theta)
+    c_alpha = np.cos(alpha); s_alpha = np.sin(alpha)
+
+    T = np.zeros((theta.size, 4, 4), dtype=np.float64)
+    T[:, 0, 0] = c_th; T[:, 0, 1] = -s_th*c_alpha; T[:, 0, 2] = s_th*s_alpha;  T[:, 0, 3] = a*c_th
+    T[:, 1, 0] = s_th; T[:, 1, 1] = c_th*c_alpha;  T[:, 1, 2] = -c_th*s_alpha; T[:, 1, 3] = a*s_th
+    T[:, 2, 1] = s_alpha; T[:, 2, 2] = c_alpha; T[:, 2, 3] = d
+    T[:, 3, 3] = 1.0
+
+    return T
+
+def Forward_Kinematics_DH_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.Tuple[tp.List[tp.List[bool]],
+                                                                                                                   tp.List[tp.List[tp.List[float]]]]:
+    """
+    Description:
+        Calculation of forward kinematics using the standard Denavit-Hartenberg (DH) method for a set of 
+        joint vectors. The chain of the transformations is built using the batch matrix products, so the function 
+        works for any serial structure with revolute joints.
+
+            T = T_{0} @ T_{1} @ .. @ T_{m-1}
+
+        Note:
+            For the RR robotic structure, the translation part of the matrix is equal to the result 
+            of the Forward_Kinematics_Batch() function.
+
+    Args:
+        (1) theta [Matrix<float> nxm]: Desired absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors and m is the number of joints.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Matrix<bool> nxm]: The result is a matrix of values with a warning if the limit
+                                          is exceeded.
+                                            Note:
+                                                The value in the matrix is "True" if the desired absolute
+                                                joint position is out of limit, and "False" if it is not.
+        (2) paramter [Tensor<float> nx4x4]: The homogeneous transformation matrices of the TCP (tool center point) 
+                                            for each joint vector.
+    """
+
+    theta = np.asarray(theta).reshape(-1, Robot_Parameters_Str.Theta.Zero.size)
+
+    # Check that the desired absolute joint positions are not out of limit.
+    th_limit_err = __Check_Theta_Limit_Batch(theta, Robot_Parameters_Str)
+
+    T = np.broadcast_to(np.eye(4, dtype=np.float64), (theta.shape[0], 4, 4))
+    for i, (th_zero_i, a_i, d_i, alpha_i) in enumerate(Get_DH_Parameters(Robot_Parameters_Str)):
+        T = T @ __Get_DH_Matrix_Batch(th_zero_i + theta[:, i], a_i, d_i, alpha_i)
+
+    return (th_limit_err, T)
+
 def Inverse_Kinematics(p: tp.List[float], Robot_Parameters_Str: Parameters.Robot) -> tp.Tuple[tp.Dict, 
                                                                                               tp.List[tp.List[float]]]:
     """
@@ -166,5 +320,408 @@ def Inverse_Kinematics(p: tp.List[float], Robot_Parameters_Str: Parameters.Robot
 
     return (info, theta_solutions)
 
+def Inverse_Kinematics_Batch(p: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.Tuple[tp.Dict, 
+                                                                                                            tp.List[tp.List[tp.List[float]]]]:
+    """
+    Description:
+        A function to compute the solution of the inverse kinematics (IK) of the RR robotic structure 
+        (called SCARA -> simplified version) using an analytical method for a set of desired TCP positions. 
+        The function is the batch (vectorized) version of the Inverse_Kinematics() function.
+
+        Note:
+            The branches of the scalar version are replaced by clamping the arguments of the arccos 
+            function to the interval <-1, 1>, which gives the same results.
+
+    Args:
+        (1) p [Matrix<float> nx2]: The desired TCP (tool center point) in Cartesian coordinates defined 
+                                   as a vector in the x, y axes for each point.
+                                    Note:
+                                        Where n is the number of points.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Dictionary {'error': Matrix<float> nxk, 
+                                   'clamped': Matrix<bool> nx2}]: Information on the results found.
+                                                                    Note 1:
+                                                                        Where k is the number of solutions.
+                                                                    Note 2:
+                                                                        'error': Information about the absolute position error.
+                                                                        'clamped': Information about whether the argument of 
+                                                                                   the arccos function for the Theta_{1} (column 0) 
+                                                                                   and Theta_{2} (column 1) joint was out of the 
+                                                                                   interval <-1, 1>, i.e. the point is not reachable.
+        (2) parameter [Tensor<float> nxkx2]: Obtained solutions of the absolute positions of the joints in radians.
+    """
+
+    p = np.asarray(p).reshape(-1, 2)
+
+    # Auxiliary calculations.
+    #   L^2 = x^2 + y^2; gamma = arctan2(y, x)
+    L_pow = p[:, 0]**2 + p[:, 1]**2; gamma = np.arctan2(p[:, 1], p[:, 0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # The Law of Cosines (see the Inverse_Kinematics() function).
+        beta = ((Robot_Parameters_Str.DH.Standard[0, 1]**2) + L_pow - (Robot_Parameters_Str.DH.Standard[1, 1]**2)) \
+                / (2*Robot_Parameters_Str.DH.Standard[0, 1]*np.sqrt(L_pow))
+    alpha = ((Robot_Parameters_Str.DH.Standard[0, 1]**2) + (Robot_Parameters_Str.DH.Standard[1, 1]**2) - L_pow) \
+            / (2*(Robot_Parameters_Str.DH.Standard[0, 1]*Robot_Parameters_Str.DH.Standard[1, 1]))
+
+    # Mask of points where the argument of the arccos function is out of the interval <-1, 1>.
+    clamped = np.column_stack(((beta > 1) | (beta < -1), (alpha > 1) | (alpha < -1)))
+
+    # Clamp the arguments to the interval <-1, 1>.
+    #   Note:
+    #       arccos(1) = 0 and arccos(-1) = PI, which corresponds to the special cases of the 
+    #       Inverse_Kinematics() function.
+    beta_angle  = np.arccos(np.clip(beta, -1, 1)); alpha_angle = np.arccos(np.clip(alpha, -1, 1))
+
+    # Initialization of output solutions.
+    theta_solutions = np.zeros((p.shape[0], 2, Robot_Parameters_Str.Theta.Zero.size), dtype=np.float32)
+
+    # Calculation of the absolute position of the Theta_{1} joint.
+    #   Configuration 1: cfg_{1} = gamma - beta; Configuration 2: cfg_{2} = gamma + beta 
+    theta_solutions[:, 0, 0] = gamma - beta_angle
+    theta_solutions[:, 1, 0] = np.where(clamped[:, 0], 0.0, gamma + beta_angle)
+
+    # Calculation of the absolute position of the Theta_{2} joint.
+    #   Configuration 1: cfg_{1} = PI - alpha; Configuration 2: cfg_{2} = alpha - PI
+    theta_solutions[:, 0, 1] = Mathematics.CONST_MATH_PI - alpha_angle
+    theta_solutions[:, 1, 1] = np.where(clamped[:, 1], 0.0, alpha_angle - Mathematics.CONST_MATH_PI)
+
+    # Obtain the absolute position error.
+    x = Forward_Kinematics_Batch(theta_solutions.reshape(-1, Robot_Parameters_Str.Theta.Zero.size), 
+                                 Robot_Parameters_Str)[1].reshape(theta_solutions.shape)
+    info = {'error': np.linalg.norm(x - p[:, np.newaxis, :], axis=2).astype(np.float32), 
+            'clamped': clamped}
+
+    return (info, theta_solutions)
+
+def __Get_Position_And_Jacobian_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.Tuple[tp.List[tp.List[float]], 
+                                                                                                                         tp.List[tp.List[tp.List[float]]]]:
+    """
+    Description:
+        A function to obtain the TCP (tool center point) positions and the Jacobian matrices of the RR robotic structure 
+        for a set of joint vectors in double precision.
+
+        Note:
+            The Jacobian is the derivative of the position with respect to the absolute joint positions:
+                J = [[-a_{0}*sin(th_0) - a_{1}*sin(th_01), -a_{1}*sin(th_01)],
+                     [ a_{0}*cos(th_0) + a_{1}*cos(th_01),  a_{1}*cos(th_01)]],
+            where th_0 and th_01 are the absolute positions of the joints (see the Forward_Kinematics_Batch() function) 
+            and a_{i} is the link length of the standard Denavit-Hartenberg (DH) parameters.
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Matrix<float> nx2]: The TCP positions in the x, y axes.
+        (2) parameter [Tensor<float> nx2x2]: The Jacobian matrices.
+    """
+
+    theta = np.asarray(theta, dtype=np.float64).reshape(-1, Robot_Parameters_Str.Theta.Zero.size)
+    a = Robot_Parameters_Str.DH.Standard[:, 1].astype(np.float64)
+
+    # Express the absolute positions of the joints.
+    th_0  = Robot_Parameters_Str.DH.Standard[0, 0] + theta[:, 0]
+    th_01 = th_0 + Robot_Parameters_Str.DH.Standard[1, 0] + theta[:, 1]
+
+    c_0 = a[0]*np.cos(th_0); c_01 = a[1]*np.cos(th_01)
+    s_0 = a[0]*np.sin(th_0); s_01 = a[1]*np.sin(th_01)
+
+    J = np.empty((theta.shape[0], 2, 2), dtype=np.float64)
+    J[:, 0, 0] = -s_0 - s_01; J[:, 0, 1] = -s_01
+    J[:, 1, 0] =  c_0 + c_01; J[:, 1, 1] =  c_01
+
+    return (np.column_stack((c_0 + c_01, s_0 + s_01)), J)
+
+def __Get_Inverse_Jacobian_Batch(J: tp.List[tp.List[tp.List[float]]], damping: float) -> tp.List[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A function to obtain the (damped) inverse of a set of Jacobian matrices 2x2.
+
+            J^{+} = J^T @ (J @ J^T + damping^2 * I)^(-1)
+
+        Note:
+            The symmetric matrix A = J @ J^T + damping^2 * I is inverted in the closed form. If the damping 
+            is zero, the result is the exact inverse J^(-1) and the matrices in the singular configurations are 
+            nan.
+
+    Args:
+        (1) J [Tensor<float> nx2x2]: The Jacobian matrices.
+        (2) damping [float]: The damping factor of the least squares.
+
+    Returns:
+        (1) parameter [Tensor<float> nx2x2]: The inverse Jacobian matrices.
+    """
+
+    A_00 = J[:, 0, 0]**2 + J[:, 0, 1]**2 + damping**2; A_11 = J[:, 1, 0]**2 + J[:, 1, 1]**2 + damping**2
+    A_01 = J[:, 0, 0]*J[:, 1, 0] + J[:, 0, 1]*J[:, 1, 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        det = A_00*A_11 - A_01**2
+
+        A_inv = np.empty(J.shape, dtype=J.dtype)
+        A_inv[:, 0, 0] = A_11 / det; A_inv[:, 1, 1] = A_00 / det
+        A_inv[:, 0, 1] = A_inv[:, 1, 0] = -A_01 / det
+
+        J_inv = J.transpose(0, 2, 1) @ A_inv
+
+    # The inverse does not exist in the singular configurations (det = 0), so the whole matrix is undefined.
+    J_inv[~np.isfinite(J_inv).all(axis=(1, 2))] = np.nan
+
+    return J_inv
+
+def Jacobian_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.List[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A function to obtain the Jacobian matrices of the RR robotic structure (called SCARA -> simplified version) 
+        for a set of joint vectors, which map the joint velocities to the TCP (tool center point) velocities.
+
+            v = J(theta) @ theta_dot
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors (e.g. waypoints of a trajectory).
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Tensor<float> nx2x2]: The Jacobian matrices (double precision).
+    """
+
+    return __Get_Position_And_Jacobian_Batch(theta, Robot_Parameters_Str)[1]
+
+def Inverse_Jacobian_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot, 
+                           damping: float = 0.0) -> tp.List[tp.List[tp.List[float]]]:
+    """
+    Description:
+        A function to obtain the inverse Jacobian matrices of the RR robotic structure for a set of joint vectors.
+
+        Note:
+            In the singular configurations (see the Manipulability_Batch() function), the exact inverse does not exist 
+            (the result is inf/nan). The damping gives the Damped Least Squares (DLS) inverse, which is bounded.
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (3) damping [float]: The damping factor of the least squares.
+
+    Returns:
+        (1) parameter [Tensor<float> nx2x2]: The inverse Jacobian matrices (double precision).
+    """
+
+    return __Get_Inverse_Jacobian_Batch(Jacobian_Batch(theta, Robot_Parameters_Str), damping)
 
+def Manipulability_Batch(theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot) -> tp.List[float]:
+    """
+    Description:
+        A function to obtain the measure of the manipulability (Yoshikawa) of the RR robotic structure for a set 
+        of joint vectors.
+
+            w = sqrt(det(J @ J^T)) = |det(J)| = a_{0}*a_{1}*|sin(theta_zero_{1} + theta_{1})|
+
+        Note:
+            The manipulability is zero in the singular configurations (the arm is stretched or folded), where 
+            the TCP cannot move in all directions.
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions in radians.
+                                        Note:
+                                            Where n is the number of joint vectors.
+        (2) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+
+    Returns:
+        (1) parameter [Vector<float> 1xn]: The manipulability of the individual joint vectors.
+    """
+
+    J = Jacobian_Batch(theta, Robot_Parameters_Str)
+
+    return np.abs(J[:, 0, 0]*J[:, 1, 1] - J[:, 0, 1]*J[:, 1, 0])
+
+def Inverse_Kinematics_Velocity_Batch(theta: tp.List[tp.List[float]], v: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot, 
+                                      damping: float = 0.0) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to obtain the joint velocities from the TCP (tool center point) velocities along a trajectory 
+        (velocity inverse kinematics).
+
+            theta_dot = J^(-1)(theta) @ v
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions of the individual waypoints in radians.
+                                        Note:
+                                            Where n is the number of waypoints.
+        (2) v [Matrix<float> nx2]: The TCP velocities in the x, y axes (in meters per second).
+        (3) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (4) damping [float]: The damping factor of the least squares, see the Inverse_Jacobian_Batch() function.
+                              Note:
+                                If the damping is zero, the rows of the singular waypoints are nan (the joint velocities 
+                                are undefined), so the trajectory planner should pass a nonzero damping (e.g. 1e-3) 
+                                for a path that passes through or close to a singularity.
+
+    Returns:
+        (1) parameter [Matrix<float> nx2]: The joint velocities in radians per second.
+    """
+
+    v = np.asarray(v, dtype=np.float64).reshape(-1, 2)
+
+    return (Inverse_Jacobian_Batch(theta, Robot_Parameters_Str, damping) @ v[:, :, np.newaxis])[:, :, 0]
+
+def Inverse_Kinematics_Acceleration_Batch(theta: tp.List[tp.List[float]], theta_dot: tp.List[tp.List[float]], a: tp.List[tp.List[float]], 
+                                          Robot_Parameters_Str: Parameters.Robot, damping: float = 0.0) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A function to obtain the joint accelerations from the TCP (tool center point) accelerations along a trajectory 
+        (acceleration inverse kinematics).
+
+            theta_ddot = J^(-1)(theta) @ (a - J_dot(theta, theta_dot) @ theta_dot),
+
+        where J_dot is the time derivative of the Jacobian matrix.
+
+    Args:
+        (1) theta [Matrix<float> nx2]: Absolute joint positions of the individual waypoints in radians.
+                                        Note:
+                                            Where n is the number of waypoints.
+        (2) theta_dot [Matrix<float> nx2]: The joint velocities in radians per second, see the Inverse_Kinematics_Velocity_Batch() 
+                                           function.
+        (3) a [Matrix<float> nx2]: The TCP accelerations in the x, y axes (in meters per second squared).
+        (4) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (5) damping [float]: The damping factor of the least squares, see the Inverse_Jacobian_Batch() function.
+                              Note:
+                                If the damping is zero, the rows of the singular waypoints are nan (the joint accelerations 
+                                are undefined), so the trajectory planner should pass a nonzero damping (e.g. 1e-3) 
+                                for a path that passes through or close to a singularity.
+
+    Returns:
+        (1) parameter [Matrix<float> nx2]: The joint accelerations in radians per second squared.
+    """
+
+    theta_dot = np.asarray(theta_dot, dtype=np.float64).reshape(-1, 2); a = np.asarray(a, dtype=np.float64).reshape(-1, 2)
+
+    # The position of the TCP relative to the base (p) and to the second joint (p_1).
+    #   Note:
+    #       The Jacobian matrix is J = [[-p_y, -p_1_y], [p_x, p_1_x]], so its time derivative is given by 
+    #       the angular velocities of the links: omega_0 = theta_dot_0, omega_01 = theta_dot_0 + theta_dot_1.
+    p, J = __Get_Position_And_Jacobian_Batch(theta, Robot_Parameters_Str)
+    p_1 = np.column_stack((J[:, 1, 1], -J[:, 0, 1])); p_0 = p - p_1
+    omega_0 = theta_dot[:, 0]; omega_01 = theta_dot[:, 0] + theta_dot[:, 1]
+
+    #   J_dot @ theta_dot = -(omega_0^2 * p_0 + omega_01^2 * p_1)
+    J_dot_theta_dot = -(omega_0[:, np.newaxis]**2 * p_0 + omega_01[:, np.newaxis]**2 * p_1)
+
+    return (__Get_Inverse_Jacobian_Batch(J, damping) @ (a - J_dot_theta_dot)[:, :, np.newaxis])[:, :, 0]
+
+def Inverse_Kinematics_Refine_Batch(p: tp.List[tp.List[float]], theta: tp.List[tp.List[float]], Robot_Parameters_Str: Parameters.Robot, 
+                                    num_of_iterations: int = 3, damping: float = 1e-4, max_step: float = 0.05, 
+                                    cfg: tp.Optional[tp.List[int]] = None) -> tp.Tuple[tp.Dict, tp.List[tp.List[float]]]:
+    """
+    Description:
+        A function to refine the approximate solutions of the inverse kinematics (IK) of the RR robotic structure 
+        (e.g. predicted by the neural network) using a fixed number of damped Newton (Damped Least Squares) 
+        iterations for a set of desired TCP positions.
+
+        The update of the joint positions in each iteration is given by:
+            theta = theta + J^T @ (J @ J^T + damping^2 * I)^(-1) @ (p - FK(theta)),
+        where J is the Jacobian matrix of the current joint positions.
+
+        Note 1:
+            The number of iterations is fixed, so the cost (latency) of the refinement is bounded and does not depend 
+            on the data. The Newton method converges quadratically, so a few iterations from the approximate solution 
+            are sufficient to reach the float32 precision, except near the singular configurations, where 
+            the convergence is slower.
+
+        Note 2:
+            Near the singular configurations (stretched arm), the Jacobian matrix is ill-conditioned and the update 
+            is large. Therefore, the update is limited to the maximum step of each joint and it is accepted only if 
+            the position error does not grow and the configuration of the solution (the sign of the elbow joint) 
+            is not flipped. Otherwise, the previous joint positions are kept and the next step of the sample is halved, 
+            so the refined solution is never worse than the initial guess.
+
+        Note 3:
+            If the configuration is not defined, it is given by the initial guess. Otherwise, the updates can move 
+            an initial guess with the other configuration towards the desired one, but not vice versa.
+
+    Args:
+        (1) p [Matrix<float> nx2]: The desired TCP (tool center point) in Cartesian coordinates defined 
+                                   as a vector in the x, y axes for each point.
+                                    Note:
+                                        Where n is the number of points.
+        (2) theta [Matrix<float> nx2]: The initial guess of the absolute positions of the joints in radians.
+        (3) Robot_Parameters_Str [Robot_Parameters_Str(object)]: The structure of the main parameters of the robot.
+        (4) num_of_iterations [int]: The number of Newton iterations.
+        (5) damping [float]: The damping factor of the least squares.
+        (6) max_step [float]: The maximum change of the joint positions in a single iteration in radians.
+                                Note:
+                                    The refinement corrects the initial guess by at most num_of_iterations * max_step, 
+                                    so a less accurate initial guess requires more iterations or a larger step.
+        (7) cfg [Vector<int> 1xn]: The desired configuration of the solution (0: sin(theta_{1}) >= 0, 1: sin(theta_{1}) <= 0), 
+                                   see the Inverse_Kinematics_Batch() function.
+
+    Returns:
+        (1) parameter [Dictionary {'error': Vector<float> 1xn, 
+                                   'limit': Matrix<bool> nx2,
+                                   'rejected': Vector<bool> 1xn}]: Information on the results found.
+                                                                    Note:
+                                                                        'error': Information about the absolute position error.
+                                                                        'limit': Information about whether the refined absolute 
+                                                                                 joint position is out of limit.
+                                                                        'rejected': Information about whether an update 
+                                                                                    of the sample was rejected, because 
+                                                                                    it would flip the configuration 
+                                                                                    or increase the position error, 
+                                                                                    or whether the refined solution 
+                                                                                    does not have the desired 
+                                                                                    configuration.
+        (2) parameter [Matrix<float> nx2]: The refined absolute positions of the joints in radians.
+    """
+
+    p = np.asarray(p, dtype=np.float64).reshape(-1, 2)
+    theta = np.array(theta, dtype=np.float64).reshape(-1, Robot_Parameters_Str.Theta.Zero.size)
+
+    # The configuration of the solution, given by the sign of the elbow joint.
+    cfg_sign = np.sign(np.sin(Robot_Parameters_Str.DH.Standard[1, 0] + theta[:, 1]))
+    if cfg is not None:
+        cfg_sign = 1.0 - 2.0 * np.asarray(cfg, dtype=np.float64).reshape(-1)
+
+    # The resolution of the position in single precision. The updates below the resolution are not 
+    # considered as rejected.
+    tolerance = np.finfo(np.float32).eps * np.sum(Robot_Parameters_Str.DH.Standard[:, 1])
+
+    x, J = __Get_Position_And_Jacobian_Batch(theta, Robot_Parameters_Str)
+    e = np.linalg.norm(p - x, axis=1)
+
+    # The scale of the step of each sample.
+    alpha = np.ones(theta.shape[0], dtype=np.float64); rejected = np.zeros(theta.shape[0], dtype=bool)
+    for _ in range(num_of_iterations):
+        # Damped Least Squares (DLS) update limited to the maximum step.
+        d_theta = (__Get_Inverse_Jacobian_Batch(J, damping) @ (p - x)[:, :, np.newaxis])[:, :, 0]
+        with np.errstate(divide='ignore'):
+            d_theta *= (alpha * np.minimum(1.0, max_step / np.max(np.abs(d_theta), axis=1)))[:, np.newaxis]
+        theta_new = theta + d_theta
+
+        x_new, J_new = __Get_Position_And_Jacobian_Batch(theta_new, Robot_Parameters_Str)
+        e_new = np.linalg.norm(p - x_new, axis=1)
+
+        # Accept only the updates that do not flip the configuration and do not increase the error.
+        flipped = (cfg_sign * np.sign(np.sin(Robot_Parameters_Str.DH.Standard[1, 0] + theta_new[:, 1])) < 0.0) \
+                  & (cfg_sign * np.sign(np.sin(Robot_Parameters_Str.DH.Standard[1, 0] + theta[:, 1])) >= 0.0)
+        accepted = (flipped == False) & (e_new <= e)
+        theta = np.where(accepted[:, np.newaxis], theta_new, theta); x = np.where(accepted[:, np.newaxis], x_new, x)
+        J = np.where(accepted[:, np.newaxis, np.newaxis], J_new, J); e = np.where(accepted, e_new, e)
+
+        alpha[accepted == False] *= 0.5
+        rejected |= flipped | ((accepted == False) & (e > tolerance))
+
+    rejected |= cfg_sign * np.sin(Robot_Parameters_Str.DH.Standard[1, 0] + theta[:, 1]) < 0.0
+    theta = theta.astype(np.float32)
+
+    # Obtain the absolute position error.
+    th_limit_err, x = Forward_Kinematics_Batch(theta, Robot_Parameters_Str)
+    info = {'error': np.linalg.norm(x - p, axis=1).astype(np.float32), 
+            'limit': th_limit_err, 'rejected': rejected}
 
+    return (info, theta)
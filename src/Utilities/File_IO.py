@@ -4,6 +4,205 @@ import numpy as np
 import typing as tp
 # Pickle (Python object serialization)
 import pickle as pkl
+# OS (Operating system interfaces)
+import os
+# Zipfile (Work with ZIP archives)
+import zipfile
+# IO (Core tools for working with streams)
+import io
+
+"""
+Description:
+    Initialization of constants.
+"""
+# The identifier of the binary (streamed) dataset file (*.bin).
+CONST_STREAM_MAGIC = b'FCNN_IK1'
+# The structure of the header of the binary (streamed) dataset file (*.bin).
+#   Note:
+#       The header is followed by the data stored as float32 rows (C-order).
+CONST_STREAM_HEADER = np.dtype([('magic', 'S8'), ('Id', '<u4'), ('N', '<u8'), ('seed', '<i8'), ('tolerance', '<u4'), 
+                                ('chunk_size', '<u8'), ('num_of_columns', '<u4')])
+
+class Stream_Writer_Cls(object):
+    """
+    Description:
+        A specific class for writing the data to the binary (streamed) file (*.bin). The data are written in chunks 
+        of a fixed size and each chunk is flushed to the disk as soon as it is produced, so the whole data does not 
+        need to be held in memory.
+
+        Note:
+            If the file already exists and its header matches the input parameters, the writing is resumed from 
+            the last complete chunk. Otherwise, the file is overwritten.
+
+    Initialization of the Class:
+        Args:
+            (1) file_path [string]: The specified path of the file without extension (format).
+            (2) Id [int]: Identification number of the robot.
+            (3) N [int]: Number of data (rows) to be written.
+            (4) seed [int]: The seed of the random number generator.
+            (5) tolerance [int]: The number of decimals to which the data are rounded.
+            (6) chunk_size [int]: The number of data (rows) in a single chunk.
+            (7) num_of_columns [int]: The number of columns of the data.
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = Stream_Writer_Cls('../..', Id=1, N=1000, seed=0, tolerance=4, chunk_size=100, 
+                                        num_of_columns=5)
+
+            Features:
+                # Properties of the class.
+                Cls.Num_Of_Rows; Cls.Num_Of_Chunks; Cls.Data
+
+                # Functions of the class.
+                Cls.Write(data)
+                Cls.Close()
+    """
+
+    def __init__(self, file_path: str, Id: int, N: int, seed: int, tolerance: int, chunk_size: int, 
+                 num_of_columns: int) -> None:
+        self.__file_path = file_path + '.bin'
+        self.__N = N; self.__chunk_size = chunk_size; self.__num_of_columns = num_of_columns
+
+        # The size of a single row in bytes.
+        self.__row_size = np.dtype(np.float32).itemsize * num_of_columns
+
+        # Initialization of the header.
+        header = np.array([(CONST_STREAM_MAGIC, Id, N, seed, tolerance, chunk_size, num_of_columns)], dtype=CONST_STREAM_HEADER)
+
+        # The number of data (rows) already written.
+        self.__num_of_rows = 0
+        if os.path.isfile(self.__file_path) and os.path.getsize(self.__file_path) >= CONST_STREAM_HEADER.itemsize \
+           and Load_Header(file_path) == header[0]:
+            # Keep only the complete chunks.
+            num_of_rows = (os.path.getsize(self.__file_path) - CONST_STREAM_HEADER.itemsize) // self.__row_size
+            self.__num_of_rows = N if num_of_rows >= N else (num_of_rows // chunk_size) * chunk_size
+
+            self.__f = open(self.__file_path, 'r+b')
+            self.__f.truncate(CONST_STREAM_HEADER.itemsize + self.__num_of_rows * self.__row_size)
+            self.__f.seek(0, os.SEEK_END)
+        else:
+            self.__f = open(self.__file_path, 'wb')
+            self.__f.write(header.tobytes())
+            self.__Flush()
+
+    def __Flush(self) -> None:
+        """
+        Description:
+            A function to flush the written data to the disk.
+        """
+
+        self.__f.flush()
+        os.fsync(self.__f.fileno())
+
+    @property
+    def Num_Of_Rows(self) -> int:
+        """
+        Description:
+            Get the number of data (rows) already written.
+
+        Returns:
+            (1) parameter [int]: The number of rows.
+        """
+
+        return self.__num_of_rows
+
+    @property
+    def Num_Of_Chunks(self) -> int:
+        """
+        Description:
+            Get the number of complete chunks already written.
+
+        Returns:
+            (1) parameter [int]: The number of chunks.
+        """
+
+        return self.__num_of_rows // self.__chunk_size
+
+    @property
+    def Data(self) -> tp.List[tp.List[float]]:
+        """
+        Description:
+            Get the data (rows) already written.
+
+            Note:
+                The data are memory-mapped (read-only), so they are not loaded into memory.
+
+        Returns:
+            (1) parameter [Matrix<float> nxk]: The written data.
+        """
+
+        return np.memmap(self.__file_path, dtype=np.float32, mode='r', offset=CONST_STREAM_HEADER.itemsize, 
+                         shape=(self.__num_of_rows, self.__num_of_columns))
+
+    def Write(self, data: tp.List[tp.List[float]]) -> None:
+        """
+        Description:
+            A function to write a single chunk of the data to the file.
+
+        Args:
+            (1) data [Matrix<float> nxk]: The chunk of the data.
+                                          Note:
+                                            Where n must not be greater than the chunk size.
+        """
+
+        try:
+            assert len(data) <= min(self.__chunk_size, self.__N - self.__num_of_rows)
+
+            self.__f.write(np.ascontiguousarray(data, dtype=np.float32).tobytes())
+            self.__Flush()
+
+            self.__num_of_rows += len(data)
+
+        except AssertionError as error:
+            print(f'[ERROR] Information: {error}')
+            print(f'[ERROR] The chunk of the data exceeds the chunk size or the desired number of data.')
+
+    def Close(self) -> None:
+        """
+        Description:
+            A function to close the file.
+        """
+
+        self.__f.close()
+
+def Load_Header(file_path: str) -> np.void:
+    """
+    Description:
+        A simple function to read the header of the binary (streamed) file (*.bin).
+
+    Args:
+        (1) file_path [string]: The specified path of the file without extension (format).
+
+    Returns:
+        (1) parameter [Structured scalar <magic, Id, N, seed, tolerance, chunk_size, num_of_columns>]: Loaded 
+                                                                                                       header.
+    """
+
+    with open(file_path + '.bin', 'rb') as f:
+        return np.fromfile(f, dtype=CONST_STREAM_HEADER, count=1)[0]
+
+def Load_Stream(file_path: str) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A simple function to map the data of the binary (streamed) file (*.bin) without loading them 
+        into memory.
+
+        Note:
+            Only complete rows are mapped.
+
+    Args:
+        (1) file_path [string]: The specified path of the file without extension (format).
+
+    Returns:
+        (1) parameter [Matrix<float> nxk]: Memory-mapped (read-only) data.
+    """
+
+    num_of_columns = int(Load_Header(file_path)['num_of_columns'])
+    num_of_rows = (os.path.getsize(file_path + '.bin') - CONST_STREAM_HEADER.itemsize) // (np.dtype(np.float32).itemsize * num_of_columns)
+
+    return np.memmap(file_path + '.bin', dtype=np.float32, mode='r', offset=CONST_STREAM_HEADER.itemsize, 
+                     shape=(num_of_rows, num_of_columns))
 
 def Load(file_path: str, format: str, separator: str) -> tp.List[tp.Union[float, bool]]:
     """
@@ -13,11 +212,14 @@ def Load(file_path: str, format: str, separator: str) -> tp.List[tp.Union[float,
         Note:
             Deserialization of the data into a binary / text file.
 
+            The binary (streamed) file (*.bin) is written using the Stream_Writer_Cls class. Only 
+            complete rows are read.
+
     Args:
         (1) file_path [string]: The specified path of the file without extension (format).
         (2) format [string]: The format of the loaded file.
                              Note:
-                                'pkl' : Pickle file; 'txt' : Text file
+                                'pkl' : Pickle file; 'txt' : Text file; 'bin' : Binary (streamed) file
         (3) separator [string]: Separator between data.
 
     Returns:
@@ -39,6 +241,15 @@ def Load(file_path: str, format: str, separator: str) -> tp.List[tp.Union[float,
                 # and converts to a float.
                 data_tmp.append(np.float64(line.split(separator)))
 
+    elif format == 'bin':
+        with open(file_path + f'.{format}', 'rb') as f:
+            # Read the header of the file.
+            header = np.fromfile(f, dtype=CONST_STREAM_HEADER, count=1)[0]
+
+            # Read the complete rows of the data.
+            num_of_rows = (os.path.getsize(file_path + f'.{format}') - CONST_STREAM_HEADER.itemsize) // (np.dtype(np.float32).itemsize * header['num_of_columns'])
+            data_tmp = np.fromfile(f, dtype=np.float32, count=num_of_rows * header['num_of_columns']).reshape(-1, header['num_of_columns'])
+
     # Convert a list to an array.
     data = np.array(data_tmp, dtype=np.float64)
     
@@ -77,4 +288,209 @@ def Save(file_path: str, data: tp.List[tp.Union[float, bool]], format: str, sepa
             f.writelines([str(data[-1]), '\n'])
 
     # Close the file after writing the data.
-    f.close()
\ No newline at end of file
+    f.close()
+
+def Save_Columnar(file_path: str, data: tp.Dict[str, tp.List[tp.Union[float, int]]]) -> None:
+    """
+    Description:
+        A simple function to write data to the columnar files. Each column is stored in a separate binary 
+        file (*.npy) with its own data type.
+
+        Note:
+            The files are stored in the folder given by the file path, e.g. '{file_path}/x_coord.npy'.
+
+    Args:
+        (1) file_path [string]: The specified path of the folder.
+        (2) data [Dictionary {'name': Vector<float, int> 1xn, ..}]: Individual columns of the data.
+    """
+
+    if os.path.isdir(file_path) == False:
+        os.makedirs(file_path)
+
+    for _, (name_i, data_i) in enumerate(data.items()):
+        np.save(f'{file_path}/{name_i}.npy', data_i)
+
+def Convert_Stream_To_Columnar(file_path_r: str, file_path_w: str, columns: tp.Dict[str, np.dtype], compress: bool) -> None:
+    """
+    Description:
+        A function to convert the binary (streamed) file (*.bin) to the columnar files. The data are converted 
+        chunk by chunk, so the whole data does not need to be held in memory.
+
+        Note 1:
+            If the compression is disabled, the columns are stored in the folder '{file_path_w}/' (see the Save_Columnar 
+            function) and they can be memory-mapped. Otherwise, the columns are stored in the compressed Numpy 
+            archive '{file_path_w}.npz'.
+
+        Note 2:
+            If the binary (streamed) file does not exist, the data are read from the legacy files (*.pkl, *.zip), 
+            see the Load_Legacy function. The legacy data are converted at once.
+
+    Args:
+        (1) file_path_r [string]: The specified path of the binary (streamed) file (or the legacy file) without 
+                                  extension (format).
+        (2) file_path_w [string]: The specified path of the output folder/archive without extension (format).
+        (3) columns [Dictionary {'name': data type, ..}]: Names and data types of the individual columns.
+        (4) compress [bool]: Information about whether the columns should be compressed.
+    """
+
+    if os.path.isfile(f'{file_path_r}.bin') == False:
+        data = {name_i: data_i.astype(columns[name_i]) for _, (name_i, data_i) in enumerate(zip(columns.keys(), Load_Legacy(file_path_r, list(columns.keys()))))}
+        if compress == False:
+            Save_Columnar(file_path_w, data)
+        else:
+            np.savez_compressed(f'{file_path_w}.npz', **data)
+        return
+
+    # Map the data of the file.
+    data = Load_Stream(file_path_r)
+    num_of_rows = data.shape[0]
+    chunk_size = int(Load_Header(file_path_r)['chunk_size'])
+
+    if compress == False:
+        if os.path.isdir(file_path_w) == False:
+            os.makedirs(file_path_w)
+
+        # Write all columns at once (single pass over the data).
+        data_w = [np.lib.format.open_memmap(f'{file_path_w}/{name_i}.npy', mode='w+', dtype=dtype_i, shape=(num_of_rows, )) 
+                  for _, (name_i, dtype_i) in enumerate(columns.items())]
+        for i in range(0, num_of_rows, chunk_size):
+            for j, data_w_j in enumerate(data_w):
+                data_w_j[i:i + chunk_size] = data[i:i + chunk_size, j]
+        for _, data_w_j in enumerate(data_w):
+            data_w_j.flush()
+        del data_w
+    else:
+        with zipfile.ZipFile(f'{file_path_w}.npz', 'w', compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            for j, (name_i, dtype_i) in enumerate(columns.items()):
+                # Write the column as a '*.npy' file within the archive.
+                with archive.open(f'{name_i}.npy', 'w', force_zip64=True) as f:
+                    np.lib.format.write_array_header_1_0(f, {'descr': np.lib.format.dtype_to_descr(np.dtype(dtype_i)), 
+                                                             'fortran_order': False, 'shape': (num_of_rows, )})
+                    for i in range(0, num_of_rows, chunk_size):
+                        f.write(np.ascontiguousarray(data[i:i + chunk_size, j], dtype=dtype_i).tobytes())
+
+    del data
+
+def Load_Legacy(file_path: str, names: tp.List[str]) -> tp.List[tp.List[float]]:
+    """
+    Description:
+        A simple function to read the columns of the data from the legacy files, i.e. the pickle file (*.pkl) 
+        with the rows of the data or the archive (*.zip) with the text file (*.csv) written by the previous 
+        versions of the programs.
+
+        Note:
+            The pickle file does not contain the names of the columns, so the names must describe all 
+            the columns of the file in the stored order. The text file (*.csv) contains the names of the columns 
+            in the header.
+
+    Args:
+        (1) file_path [string]: The specified path of the file without extension (format).
+        (2) names [Vector<string>]: Names of the columns to be read.
+
+    Returns:
+        (1) parameter [Vector<Vector<float> 1xn>]: Individual columns of the data in the order given by 
+                                                   the names.
+    """
+
+    if os.path.isfile(f'{file_path}.pkl'):
+        data = Load(file_path, 'pkl', ','); header = list(names)
+    else:
+        with zipfile.ZipFile(f'{file_path}.zip', 'r') as archive:
+            with io.TextIOWrapper(archive.open(archive.namelist()[0], 'r')) as f:
+                header = f.readline().strip().split(',')
+                data = np.loadtxt(f, delimiter=',', ndmin=2)
+
+    return [data[:, header.index(name_i)].astype(np.float32) for _, name_i in enumerate(names)]
+
+def Load_Columnar(file_path: str, names: tp.List[str], mmap: bool = True) -> tp.List[tp.List[tp.Union[float, int]]]:
+    """
+    Description:
+        A simple function to read data from the columnar files written using the Save_Columnar function or
+        the Convert_Stream_To_Columnar function.
+
+        Note 1:
+            If the memory mapping is enabled, the columns are not loaded into memory (zero-copy). The data 
+            are read from the disk only when they are accessed.
+
+        Note 2:
+            If the folder does not exist, the columns are read from the compressed Numpy archive '{file_path}.npz'. 
+            The compressed columns cannot be memory-mapped.
+
+        Note 3:
+            If neither the folder nor the archive exists, the columns are read from the legacy files 
+            (*.pkl, *.zip), see the Load_Legacy function.
+
+    Args:
+        (1) file_path [string]: The specified path of the folder.
+        (2) names [Vector<string>]: Names of the columns to be read.
+        (3) mmap [bool]: Information about whether the columns should be memory-mapped (read-only).
+
+    Returns:
+        (1) parameter [Vector<Vector<float, int> 1xn>]: Individual columns of the data in the order given by 
+                                                        the names.
+    """
+
+    if os.path.isdir(file_path) == False:
+        if os.path.isfile(f'{file_path}.npz') == False:
+            return Load_Legacy(file_path, names)
+
+        with np.load(f'{file_path}.npz') as data:
+            return [data[name_i] for _, name_i in enumerate(names)]
+
+    return [np.load(f'{file_path}/{name_i}.npy', mmap_mode='r' if mmap == True else None) for _, name_i in enumerate(names)]
+class Columnar_View_Cls(object):
+    """
+    Description:
+        A specific class for accessing the individual columns (e.g. memory-mapped columns from the Load_Columnar 
+        function) as a single matrix without stacking the whole data in memory.
+
+        Note:
+            Slicing of the rows returns a new view (zero-copy). The rows are assembled (stacked) into a matrix 
+            only when the view is converted to an array (e.g. np.asarray(..)), so the converted view should 
+            contain only a chunk (batch) of the data.
+
+    Initialization of the Class:
+        Args:
+            (1) columns [Vector<Vector<float, int> 1xn>]: Individual columns of the data.
+
+        Example:
+            Initialization:
+                # Initialization of the class.
+                Cls = Columnar_View_Cls(Load_Columnar('../..', ['x_coord', 'y_coord', 'cfg']))
+
+            Features:
+                # Properties of the class.
+                Cls.shape
+
+                # Functions of the class.
+                np.asarray(Cls[0:100], dtype=np.float32)
+    """
+
+    def __init__(self, columns: tp.List[tp.List[tp.Union[float, int]]]) -> None:
+        self.__columns = columns
+
+    @property
+    def shape(self) -> tp.Tuple[int, int]:
+        """
+        Description:
+            Get the shape of the data.
+
+        Returns:
+            (1) parameter [Vector<int> 1x2]: The number of data (rows) and the number of columns.
+        """
+
+        return (len(self.__columns[0]), len(self.__columns))
+
+    def __len__(self) -> int:
+        return len(self.__columns[0])
+
+    def __getitem__(self, index: tp.Union[int, slice, tp.List[int]]) -> tp.Union['Columnar_View_Cls', tp.List[tp.List[float]]]:
+        if isinstance(index, slice):
+            return Columnar_View_Cls([column_i[index] for _, column_i in enumerate(self.__columns)])
+
+        return np.column_stack([column_i[index] for _, column_i in enumerate(self.__columns)])
+
+    def __array__(self, dtype: tp.Optional[np.dtype] = None, copy: tp.Optional[bool] = None) -> tp.List[tp.List[float]]:
+        data = np.column_stack(self.__columns)
+
+        return data if dtype == None else data.astype(dtype, copy=False)